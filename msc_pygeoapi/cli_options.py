@@ -236,6 +236,25 @@ def OPTION_BATCH_SIZE(*args, **kwargs):
     return click.option(*args, **kwargs)
 
 
+def OPTION_THREAD_COUNT(*args, **kwargs):
+
+    default_args = ['--thread-count']
+
+    default_kwargs = {
+        'default': 1,
+        'type': click.IntRange(1, 32),
+        'required': False,
+        'help': 'Number of concurrent bulk requests to ES index'
+    }
+
+    if not args:
+        args = default_args
+
+    kwargs = {**default_kwargs, **kwargs} if kwargs else default_kwargs
+
+    return click.option(*args, **kwargs)
+
+
 def OPTION_YES(**kwargs):
 
     default_kwargs = {
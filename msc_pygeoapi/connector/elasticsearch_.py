@@ -28,23 +28,60 @@
 #
 # =================================================================
 
+import asyncio
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import hashlib
+from itertools import chain
+import json
 import logging
+import os
+import random
+import threading
+import time
 
 from elasticsearch import (
+    ApiError,
+    AsyncElasticsearch,
+    ConnectionError,
+    ConnectionTimeout,
     Elasticsearch,
     NotFoundError,
     logger as elastic_logger
 )
-from elasticsearch.helpers import streaming_bulk, BulkIndexError
+from elasticsearch.helpers import (
+    expand_action,
+    parallel_bulk
+)
+from elasticsearch.serializer import JsonSerializer
+
+try:
+    # only defined if orjson is installed
+    from elasticsearch.serializer import OrjsonSerializer
+except ImportError:
+    OrjsonSerializer = None
 
 from msc_pygeoapi.connector.base import BaseConnector
 from msc_pygeoapi.env import (
+    MSC_PYGEOAPI_ES_BULK_MAX_BYTES,
+    MSC_PYGEOAPI_ES_BULK_MAX_RETRIES,
+    MSC_PYGEOAPI_ES_BULK_RETRY_BACKOFF,
+    MSC_PYGEOAPI_ES_BULK_RETRY_BUDGET,
+    MSC_PYGEOAPI_ES_BULK_TARGET_LATENCY,
+    MSC_PYGEOAPI_ES_CONNECTIONS_PER_NODE,
+    MSC_PYGEOAPI_ES_HTTP_COMPRESS,
+    MSC_PYGEOAPI_ES_SERIALIZER,
+    MSC_PYGEOAPI_ES_SNIFF,
+    MSC_PYGEOAPI_ES_TEMPLATE_CACHE,
+    MSC_PYGEOAPI_ES_TEMPLATE_CACHE_TTL,
     MSC_PYGEOAPI_ES_USERNAME,
     MSC_PYGEOAPI_ES_PASSWORD,
     MSC_PYGEOAPI_ES_URL,
     MSC_PYGEOAPI_ES_TIMEOUT,
     MSC_PYGEOAPI_LOGGING_LOGLEVEL
 )
+from msc_pygeoapi.metrics import METRICS
 
 LOGGER = logging.getLogger(__name__)
 elastic_logger.setLevel(getattr(logging, MSC_PYGEOAPI_LOGGING_LOGLEVEL))
@@ -53,6 +90,608 @@ logging.getLogger('elastic_transport').setLevel(
 )
 
 
+CLIENTS = {}
+CLIENTS_LOCK = threading.Lock()
+
+# bulk API statuses worth re-submitting: full queues and unavailable nodes
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# transport options of bulk requests: failed requests are not replayed by
+# the transport, so that BulkRetry is the only (backed off) retry layer
+BULK_OPTIONS = {
+    'max_retries': 0,
+    'retry_on_status': (),
+    'retry_on_timeout': False
+}
+
+# number of error types of which a bulk summary keeps an example
+ERROR_SAMPLES = 5
+
+# index settings relaxed while bulk loading an index
+BULK_LOAD_SETTINGS = {
+    'index.refresh_interval': '-1',
+    'index.number_of_replicas': 0
+}
+
+# number of document ids looked up per request for stale copies in other
+# time partitions
+STALE_CHUNK_SIZE = 1000
+
+# time partition intervals: index name suffix (lowercase) and duration
+PARTITION_INTERVALS = {
+    'day': ('%Y-%m-%d', timedelta(days=1)),
+    'hour': ('%Y-%m-%dt%H', timedelta(hours=1))
+}
+
+
+def get_serializer(name=MSC_PYGEOAPI_ES_SERIALIZER):
+    """
+    get the JSON serializer of Elasticsearch requests and responses
+
+    The orjson serializer (opt-in, requires orjson) is faster but stricter
+    than the json one: e.g. it rejects non-string keys.
+
+    :param name: `str` of serializer (`json` or `orjson`)
+
+    :returns: `elasticsearch.serializer.JsonSerializer`
+    """
+
+    if name == 'orjson':
+        if OrjsonSerializer is not None:
+            return OrjsonSerializer()
+        LOGGER.warning('orjson not installed; using json serializer')
+    elif name != 'json':
+        LOGGER.warning(f'Unknown serializer {name}; using json serializer')
+
+    return JsonSerializer()
+
+
+def get_client(url=None, auth=None, verify_certs=True, timeout=None,
+               http_compress=MSC_PYGEOAPI_ES_HTTP_COMPRESS):
+    """
+    get the process-wide Elasticsearch client of a cluster, so that all
+    callers share the same pool of keep-alive HTTP connections
+
+    :param url: `str` Elasticsearch URL (default `MSC_PYGEOAPI_ES_URL`)
+    :param auth: `tuple` of username and password
+    :param verify_certs: `bool` of whether to verify TLS certificates
+    :param timeout: request timeout in seconds applied to calls made with
+                    the returned client (default is the client default)
+    :param http_compress: `bool` of whether to gzip request bodies and
+                          accept gzipped responses
+
+    :returns: `elasticsearch.Elasticsearch`
+    """
+
+    if not url:
+        url = MSC_PYGEOAPI_ES_URL or 'http://localhost:9200'
+
+    # if no protocol specified in url append http:// by default
+    if not url.startswith('http'):
+        url = f'http://{url}'
+
+    if auth is not None:
+        auth = tuple(auth)
+
+    key = (url, auth, verify_certs, http_compress)
+
+    with CLIENTS_LOCK:
+        if key not in CLIENTS:
+            LOGGER.debug(f'Creating Elasticsearch client for {url}')
+
+            es_args = {
+                'hosts': [url],
+                'verify_certs': verify_certs,
+                'retry_on_timeout': True,
+                'max_retries': 3,
+                'connections_per_node': MSC_PYGEOAPI_ES_CONNECTIONS_PER_NODE,
+                'serializer': get_serializer(),
+                'http_compress': http_compress
+            }
+
+            if auth:
+                es_args['basic_auth'] = auth
+
+            if MSC_PYGEOAPI_ES_SNIFF:
+                es_args['sniff_on_start'] = True
+                es_args['sniff_on_node_failure'] = True
+                es_args['min_delay_between_sniffing'] = 60
+
+            CLIENTS[key] = Elasticsearch(**es_args)
+
+        client = CLIENTS[key]
+
+    if timeout is not None:
+        # shallow copy sharing the transport (and its connection pool)
+        return client.options(request_timeout=timeout)
+
+    return client
+
+
+class BulkSummary:
+    """accounting of the results of bulk API actions, per package"""
+
+    def __init__(self, packages):
+        """
+        initializer
+
+        :param packages: number of packages of bulk API actions
+
+        :returns: `msc_pygeoapi.connector.elasticsearch_.BulkSummary`
+        """
+
+        self.inserts = 0
+        self.updates = 0
+        self.noops = 0
+        self.errors = Counter()
+        self.error_samples = {}
+        self.results = [True] * packages
+        self.bytes_sent = 0
+        self.requests = []
+        self.retries = 0
+
+    def request(self, docs, nbytes, latency):
+        """
+        record a bulk request
+
+        :param docs: number of documents in request
+        :param nbytes: size of request body in bytes
+        :param latency: duration of request in seconds
+
+        :returns: `None`
+        """
+
+        self.bytes_sent += nbytes
+        self.requests.append((docs, nbytes, latency))
+
+    def add_items(self, owners, response, retry=False):
+        """
+        record the results of a bulk request
+
+        :param owners: `list` of index of package of each action
+        :param response: bulk API response
+        :param retry: `bool` of whether retryable failures will be
+                      re-submitted (and are not recorded as errors)
+
+        :returns: `list` of positions of actions which failed with a
+                  retryable status
+        """
+
+        pending = []
+
+        for i, (owner, item) in enumerate(zip(owners, response['items'])):
+            status = next(iter(item.values())).get('status', 500)
+            if status in RETRY_STATUSES:
+                pending.append(i)
+                if retry:
+                    continue
+            self.add(owner, 200 <= status < 300, item)
+
+        return pending
+
+    def error(self, owner, response):
+        """
+        record a failed bulk API action, keeping counts by error type and
+        an example of the first few types rather than every response
+
+        :param owner: index of package of action
+        :param response: bulk API response item of action
+
+        :returns: `None`
+        """
+
+        self.results[owner] = False
+
+        error = next(iter(response.values()), {}).get('error', {})
+        if isinstance(error, dict):
+            error_type = error.get('type', 'unknown')
+        else:
+            error_type = 'unknown'
+
+        self.errors[error_type] += 1
+
+        if (error_type not in self.error_samples and
+                len(self.error_samples) < ERROR_SAMPLES):
+            self.error_samples[error_type] = response
+
+    def add(self, owner, ok, response):
+        """
+        record the result of a bulk API action
+
+        :param owner: index of package of action
+        :param ok: `bool` of whether action succeeded
+        :param response: bulk API response item of action
+
+        :returns: `None`
+        """
+
+        if not ok:
+            self.error(owner, response)
+            return
+
+        status = next(iter(response.values()))['result']
+
+        if status == 'created':
+            self.inserts += 1
+        elif status == 'updated':
+            self.updates += 1
+        elif status == 'noop':
+            self.noops += 1
+        else:
+            LOGGER.error(f'Unhandled status code {status}')
+            self.error(owner, response)
+
+    def report(self):
+        """
+        log and record metrics of results
+
+        :returns: `list` of `bool` of whether each package was successful
+        """
+
+        METRICS.inc('documents_total', self.inserts, result='created')
+        METRICS.inc('documents_total', self.updates, result='updated')
+        METRICS.inc('documents_total', self.noops, result='noop')
+        METRICS.inc(
+            'documents_total', sum(self.errors.values()), result='error'
+        )
+        METRICS.inc('bulk_bytes_total', self.bytes_sent)
+
+        total = self.inserts + self.updates + self.noops
+        LOGGER.info(
+            f'Inserted package of {total} documents ({self.inserts} '
+            f'inserts, {self.updates} updates, {self.noops} no-ops)'
+        )
+
+        if self.requests:
+            docs, nbytes, latency = zip(*self.requests)
+            LOGGER.info(
+                f'Sent {len(self.requests)} bulk requests of '
+                f'{min(docs)}-{max(docs)} documents (max {max(nbytes)} '
+                f'bytes, max {max(latency):.2f}s)'
+            )
+
+        if self.retries > 0:
+            LOGGER.info(f'Retried {self.retries} bulk actions')
+
+        if self.errors:
+            LOGGER.warning(
+                f'{sum(self.errors.values())} errors encountered in bulk '
+                f'insert: {dict(self.errors)}, e.g. '
+                f'{list(self.error_samples.values())}'
+            )
+
+        return self.results
+
+
+class BulkRetry:
+    """
+    re-submission policy of retryable bulk API failures: jittered
+    exponential backoff, a maximum number of attempts per action and a
+    budget of retry requests per call shared by all requests
+    """
+
+    def __init__(self, max_retries=MSC_PYGEOAPI_ES_BULK_MAX_RETRIES,
+                 initial_backoff=MSC_PYGEOAPI_ES_BULK_RETRY_BACKOFF,
+                 max_backoff=60, budget=MSC_PYGEOAPI_ES_BULK_RETRY_BUDGET):
+        """
+        initializer
+
+        :param max_retries: maximum number of retries of an action
+        :param initial_backoff: backoff of first retry in seconds
+        :param max_backoff: maximum backoff in seconds
+        :param budget: maximum number of retry requests
+
+        :returns: `msc_pygeoapi.connector.elasticsearch_.BulkRetry`
+        """
+
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+
+    def allow(self, attempt):
+        """
+        whether a request can be retried
+
+        :param attempt: number of retries already made of the request
+
+        :returns: `bool` of whether the request can be retried
+        """
+
+        return attempt < self.max_retries and self.budget > 0
+
+    def take(self, attempt):
+        """
+        use one retry of the budget
+
+        :param attempt: number of retries already made of the request
+
+        :returns: `float` of seconds to wait before retrying
+        """
+
+        self.budget -= 1
+        if self.budget == 0:
+            LOGGER.warning('Bulk retry budget exhausted')
+
+        # full jitter, so that concurrent requests spread their retries
+        return random.uniform(
+            0, min(self.max_backoff, self.initial_backoff * 2 ** attempt)
+        )
+
+    @staticmethod
+    def retryable(err):
+        """
+        whether a request-level error is worth retrying
+
+        :param err: exception raised by a bulk request
+
+        :returns: `bool` of whether the request can be retried
+        """
+
+        if isinstance(err, ApiError):
+            return err.meta.status in RETRY_STATUSES
+
+        # timed out requests may have been applied: replaying them is safe
+        # as loaders index and update documents by id
+        return isinstance(err, (ConnectionError, ConnectionTimeout))
+
+    def __repr__(self):
+        return f'<BulkRetry> {self.budget} retries left'
+
+
+class ChunkSizer:
+    """
+    adapts the number of documents per bulk request to observed latency:
+    shrinks on slow or rejected (HTTP 429) requests and grows back while
+    requests are fast, up to the caller's request size
+    """
+
+    def __init__(self, max_size, min_size=100,
+                 target_latency=MSC_PYGEOAPI_ES_BULK_TARGET_LATENCY):
+        """
+        initializer
+
+        :param max_size: maximum number of documents per request
+        :param min_size: minimum number of documents per request
+        :param target_latency: target duration of requests in seconds
+
+        :returns: `msc_pygeoapi.connector.elasticsearch_.ChunkSizer`
+        """
+
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.target_latency = target_latency
+        self.size = max_size
+
+    def observe(self, docs, latency, rejected=False):
+        """
+        adapt chunk size from the outcome of a bulk request
+
+        :param docs: number of documents in request
+        :param latency: duration of request in seconds
+        :param rejected: `bool` of whether documents were rejected because
+                         of a full queue (HTTP 429)
+
+        :returns: `int` of new chunk size
+        """
+
+        size = self.size
+
+        if rejected:
+            size = size // 2
+        elif latency > self.target_latency * 1.5:
+            size = int(docs * self.target_latency / latency)
+        elif latency < self.target_latency / 2 and docs >= self.size:
+            size = int(size * 1.5)
+
+        size = max(self.min_size, min(self.max_size, size))
+
+        if size != self.size:
+            LOGGER.debug(
+                f'Bulk chunk size {self.size} -> {size} documents '
+                f'({docs} documents in {latency:.2f}s, rejected: {rejected})'
+            )
+            self.size = size
+
+        return self.size
+
+    def __repr__(self):
+        return f'<ChunkSizer> {self.size} documents'
+
+
+class TemplateCache:
+    """
+    fingerprints of the index templates verified or written by this
+    process, per cluster, with entries expiring after a time-to-live and
+    optional persistence across processes and restarts
+
+    The time-to-live bounds how long a template deleted or changed
+    out-of-band goes unnoticed (and new indexes are created without the
+    expected mappings), so it is kept short.
+
+    Processes sharing a cache file merge their entries on save; an entry
+    lost to concurrent saves only costs a check against the cluster.
+    """
+
+    def __init__(self, ttl=300, filepath=None):
+        """
+        initializer
+
+        :param ttl: number of seconds a template is trusted without being
+                    checked against the cluster
+        :param filepath: path of JSON file to persist cache to
+                         (default does not persist cache)
+
+        :returns: `msc_pygeoapi.connector.elasticsearch_.TemplateCache`
+        """
+
+        self.ttl = ttl
+        self.filepath = filepath
+        self.entries = {}
+        self.discarded = set()
+        self.lock = threading.Lock()
+
+        if self.filepath is not None:
+            self.load()
+
+    def get(self, key):
+        """
+        get the fingerprint of a template
+
+        :param key: `str` of cluster URL and template name
+
+        :returns: `str` of fingerprint, or `None` if unknown or expired
+        """
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+        if entry is None or time.time() - entry[1] > self.ttl:
+            return None
+
+        return entry[0]
+
+    def set(self, key, fingerprint):
+        """
+        remember the fingerprint of a template
+
+        :param key: `str` of cluster URL and template name
+        :param fingerprint: `str` of fingerprint of template
+
+        :returns: `None`
+        """
+
+        with self.lock:
+            self.entries[key] = (fingerprint, time.time())
+
+        self.save()
+
+    def discard(self, key):
+        """
+        forget a template
+
+        :param key: `str` of cluster URL and template name
+
+        :returns: `None`
+        """
+
+        with self.lock:
+            removed = self.entries.pop(key, None)
+            self.discarded.add(key)
+
+        if removed is not None:
+            self.save()
+
+    def read(self):
+        """
+        read unexpired entries from cache file
+
+        :returns: `dict` of entries, or `None` if cache file cannot be read
+        """
+
+        try:
+            with open(self.filepath) as fh:
+                entries = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            LOGGER.warning(f'Cannot load cache {self.filepath}: {err}')
+            return None
+
+        now = time.time()
+
+        return {
+            key: (fingerprint, checked)
+            for key, (fingerprint, checked) in entries.items()
+            if now - checked <= self.ttl
+        }
+
+    def merge(self, entries):
+        """
+        merge entries into cache, keeping the most recently checked
+        fingerprint of each template
+
+        :param entries: `dict` of entries
+
+        :returns: `None`
+        """
+
+        with self.lock:
+            for key, entry in entries.items():
+                if key in self.discarded:
+                    continue
+                current = self.entries.get(key)
+                if current is None or current[1] < entry[1]:
+                    self.entries[key] = entry
+
+    def load(self):
+        """
+        load unexpired entries from cache file
+
+        :returns: `bool` of whether cache file was loaded
+        """
+
+        entries = self.read()
+
+        if not entries:
+            return False
+
+        self.merge(entries)
+
+        return True
+
+    def save(self):
+        """
+        save entries to cache file, merged with those saved meanwhile by
+        other processes
+
+        :returns: `bool` of whether cache file was saved
+        """
+
+        if self.filepath is None:
+            return False
+
+        self.merge(self.read() or {})
+
+        with self.lock:
+            entries = dict(self.entries)
+            self.discarded.clear()
+
+        tmp_filepath = f'{self.filepath}.{os.getpid()}.tmp'
+
+        try:
+            with open(tmp_filepath, 'w') as fh:
+                json.dump(entries, fh)
+            os.replace(tmp_filepath, self.filepath)
+        except OSError as err:
+            LOGGER.warning(f'Cannot save cache {self.filepath}: {err}')
+            return False
+
+        return True
+
+    def __repr__(self):
+        return f'<TemplateCache> {len(self.entries)} templates'
+
+
+TEMPLATES = TemplateCache(
+    MSC_PYGEOAPI_ES_TEMPLATE_CACHE_TTL, MSC_PYGEOAPI_ES_TEMPLATE_CACHE
+)
+
+
+def get_template_fingerprint(settings):
+    """
+    compute the fingerprint of an index template definition
+
+    :param settings: `dict` settings dictionnary for index template
+
+    :returns: `str` of fingerprint
+    """
+
+    definition = json.dumps(settings, sort_keys=True, default=str)
+
+    return hashlib.sha256(definition.encode()).hexdigest()
+
+
 class ElasticsearchConnector(BaseConnector):
     """Elasticsearch Connector"""
 
@@ -81,6 +720,7 @@ class ElasticsearchConnector(BaseConnector):
         else:
             self.auth = None
 
+        self.chunk_sizers = {}
         self.Elasticsearch = self.connect()
 
     def connect(self):
@@ -92,17 +732,7 @@ class ElasticsearchConnector(BaseConnector):
         if not self.url.startswith('http'):
             self.url = f'http://{self.url}'
 
-        es_args = {
-            'hosts': [self.url],
-            'verify_certs': self.verify_certs,
-            'retry_on_timeout': True,
-            'max_retries': 3
-        }
-
-        if self.auth:
-            es_args['http_auth'] = self.auth
-
-        return Elasticsearch(**es_args)
+        return get_client(self.url, self.auth, self.verify_certs)
 
     def create(self, index_name, mapping, overwrite=False):
         """
@@ -183,24 +813,55 @@ class ElasticsearchConnector(BaseConnector):
         """
         create an Elasticsearch index template
 
+        The fingerprint of the definition is stored as the template
+        version, and templates verified or written are cached (see
+        `MSC_PYGEOAPI_ES_TEMPLATE_CACHE`), so that an existing template, or
+        an unchanged one when overwriting, costs no request to the cluster.
+
         :param name: `str` index template name
         :param settings: `dict` settings dictionnary for index template
         :param overwrite: `bool` indicating whether to overwrite existing
-                          template
+                          template if its definition has changed
 
         :returns: `bool` of index template creation status
         """
 
-        template_exists = self.Elasticsearch.indices.exists_template(name=name)
+        fingerprint = get_template_fingerprint(settings)
+        key = f'{self.url}/{name}'
 
-        if template_exists and overwrite:
-            self.Elasticsearch.indices.delete_template(name=name)
-            self.Elasticsearch.indices.put_template(name=name, body=settings)
-        elif template_exists:
-            LOGGER.warning(f'Template {name} already exists')
+        cached = TEMPLATES.get(key)
+        if cached is not None and (not overwrite or cached == fingerprint):
+            LOGGER.debug(f'Template {name} exists (cached)')
             return False
+
+        # version is a (signed) 32-bit integer
+        version = int(fingerprint[:7], 16)
+
+        try:
+            current = self.Elasticsearch.indices.get_template(
+                name=name, filter_path='*.version'
+            )
+        except NotFoundError:
+            current = None
+
+        if current is None:
+            LOGGER.info(f'Creating template {name}')
+        elif current.get(name, {}).get('version') == version:
+            LOGGER.debug(f'Template {name} is up to date')
+            TEMPLATES.set(key, fingerprint)
+            return False
+        elif overwrite:
+            LOGGER.info(f'Updating template {name}')
         else:
-            self.Elasticsearch.indices.put_template(name=name, body=settings)
+            LOGGER.warning(f'Template {name} already exists')
+            # exists, with a definition other than this one
+            TEMPLATES.set(key, '')
+            return False
+
+        self.Elasticsearch.indices.put_template(
+            name=name, body=dict(settings, version=version)
+        )
+        TEMPLATES.set(key, fingerprint)
 
         return True
 
@@ -233,6 +894,8 @@ class ElasticsearchConnector(BaseConnector):
         if self.Elasticsearch.indices.exists_template(name=name):
             self.Elasticsearch.indices.delete_template(name=name)
 
+        TEMPLATES.discard(f'{self.url}/{name}')
+
         return True
 
     def create_alias(self, alias, index, overwrite=False):
@@ -283,66 +946,356 @@ class ElasticsearchConnector(BaseConnector):
 
         return index_list
 
+    @contextmanager
+    def bulk_load(self, index_name):
+        """
+        context manager for loading a whole index before it is searched
+        (i.e. before swapping an alias to it): refreshes and replicas are
+        disabled while loading, then the index is force-merged, refreshed
+        and its settings are restored (also on failure). Indexes which do
+        not exist yet are created, from matching index templates.
+
+        :param index_name: name of index (comma-separated if multiple)
+
+        :returns: `None`
+        """
+
+        indices = self.Elasticsearch.indices
+
+        for name in index_name.split(','):
+            if not indices.exists(index=name):
+                indices.create(
+                    index=name, request_timeout=MSC_PYGEOAPI_ES_TIMEOUT
+                )
+
+        current = indices.get_settings(
+            index=index_name, name=list(BULK_LOAD_SETTINGS),
+            flat_settings=True
+        )
+        # unset settings are restored to None, i.e. their default
+        restore = {
+            name: {
+                key: value['settings'].get(key) for key in BULK_LOAD_SETTINGS
+            }
+            for name, value in current.items()
+        }
+
+        LOGGER.info(f'Entering bulk load mode for {index_name}')
+        indices.put_settings(index=index_name, settings=BULK_LOAD_SETTINGS)
+
+        try:
+            yield
+
+            indices.refresh(index=index_name)
+            LOGGER.info(f'Force-merging {index_name}')
+            try:
+                # a merge outlasting the timeout keeps running on the
+                # cluster: do not let the transport re-issue it
+                self.Elasticsearch.options(
+                    max_retries=0, retry_on_timeout=False,
+                    request_timeout=MSC_PYGEOAPI_ES_TIMEOUT
+                ).indices.forcemerge(index=index_name, max_num_segments=1)
+            except ConnectionTimeout:
+                LOGGER.warning(
+                    f'Force-merge of {index_name} still running after '
+                    f'{MSC_PYGEOAPI_ES_TIMEOUT}s; continuing'
+                )
+        finally:
+            LOGGER.info(f'Leaving bulk load mode for {index_name}')
+            for name, settings in restore.items():
+                indices.put_settings(index=name, settings=settings)
+            indices.refresh(index=index_name)
+
     def submit_elastic_package(
-        self, package, request_size=10000, refresh=False
+        self, package, request_size=10000, refresh=False, thread_count=1,
+        max_chunk_bytes=MSC_PYGEOAPI_ES_BULK_MAX_BYTES
     ):
         """
         helper function to send an update request to Elasticsearch and
         log the status of the request. Returns True if the upload succeeded.
 
         :param package: Iterable of bulk API update actions.
-        :param request_size: Number of documents to upload per request.
+        :param request_size: Maximum number of documents per request.
         :param refresh: indicates whether to refresh the index
+        :param thread_count: Number of concurrent bulk requests.
+        :param max_chunk_bytes: Maximum size of a request in bytes.
         :returns: `bool` of whether the operation was successful.
         """
 
-        inserts = 0
-        updates = 0
-        noops = 0
-        errors = []
+        return self.submit_elastic_packages(
+            [package], request_size=request_size, refresh=refresh,
+            thread_count=thread_count, max_chunk_bytes=max_chunk_bytes
+        )[0]
 
-        try:
-            for ok, response in streaming_bulk(
-                self.Elasticsearch,
-                package,
-                chunk_size=request_size,
-                request_timeout=MSC_PYGEOAPI_ES_TIMEOUT,
-                raise_on_error=False,
-                refresh=refresh
-            ):
-                if not ok:
-                    errors.append(response)
-                else:
-                    status = response['update']['result']
-
-                    if status == 'created':
-                        inserts += 1
-                    elif status == 'updated':
-                        updates += 1
-                    elif status == 'noop':
-                        noops += 1
-                    else:
-                        LOGGER.error(f'Unhandled status code {status}')
-                        errors.append(response)
-        except BulkIndexError as err:
-            LOGGER.error(
-                f'Unable to perform bulk insert due to: {err.errors}'
+    def get_chunk_sizer(self, request_size):
+        """
+        get the chunk sizer of a request size, kept across calls so that
+        the chunk size learnt by a loader carries over to its next file
+
+        :param request_size: Maximum number of documents per request.
+
+        :returns: `msc_pygeoapi.connector.elasticsearch_.ChunkSizer`
+        """
+
+        if request_size not in self.chunk_sizers:
+            self.chunk_sizers[request_size] = ChunkSizer(request_size)
+
+        return self.chunk_sizers[request_size]
+
+    def chunk_actions(self, packages, sizer, max_chunk_bytes):
+        """
+        serialize bulk API actions and group them into requests bounded by
+        the chunk sizer's document count and by size in bytes
+
+        :param packages: `list` of iterables of bulk API actions.
+        :param sizer: `msc_pygeoapi.connector.elasticsearch_.ChunkSizer`
+        :param max_chunk_bytes: Maximum size of a request in bytes.
+
+        :returns: generator of (`list` of index of package of each action,
+                  `list` of serialized lines of each action, size in bytes)
+                  tuples
+        """
+
+        serializer = self.Elasticsearch.transport.serializers.get_serializer(
+            'application/json')
+
+        owners = []
+        actions = []
+        nbytes = 0
+
+        for i, package in enumerate(packages):
+            for action in package:
+                action_line, data = expand_action(action)
+                lines = [serializer.dumps(action_line)]
+                if data is not None:
+                    lines.append(serializer.dumps(data))
+                size = sum(len(line) + 1 for line in lines)
+
+                if owners and (len(owners) >= sizer.size or
+                               nbytes + size > max_chunk_bytes):
+                    yield owners, actions, nbytes
+                    owners = []
+                    actions = []
+                    nbytes = 0
+
+                owners.append(i)
+                actions.append(lines)
+                nbytes += size
+
+        if owners:
+            yield owners, actions, nbytes
+
+    def send_bulk(self, owners, actions, nbytes, refresh, summary, sizer,
+                  retry, attempt=0):
+        """
+        send a bulk request, re-submitting actions which failed with a
+        retryable status as allowed by the retry policy
+
+        :param owners: `list` of index of package of each action
+        :param actions: `list` of serialized lines of each action
+        :param nbytes: size of request in bytes
+        :param refresh: indicates whether to refresh the index
+        :param summary: `msc_pygeoapi.connector.elasticsearch_.BulkSummary`
+        :param sizer: `msc_pygeoapi.connector.elasticsearch_.ChunkSizer`
+        :param retry: `msc_pygeoapi.connector.elasticsearch_.BulkRetry`
+        :param attempt: number of retries already made of the actions
+
+        :returns: `None`
+        """
+
+        while owners:
+            start = time.monotonic()
+            try:
+                response = self.Elasticsearch.options(**BULK_OPTIONS).bulk(
+                    operations=list(chain.from_iterable(actions)),
+                    refresh=refresh,
+                    request_timeout=MSC_PYGEOAPI_ES_TIMEOUT
+                )
+            except (ApiError, ConnectionError, ConnectionTimeout) as err:
+                response = err
+
+            retried = self.handle_bulk_response(
+                owners, actions, nbytes, response, time.monotonic() - start,
+                summary, sizer, retry, attempt
             )
-            return False
+            if retried is None:
+                return
 
-        total = inserts + updates + noops
-        LOGGER.info(
-            f'Inserted package of {total} documents ({inserts} inserts, '
-            f'{updates} updates, {noops} no-ops)'
+            time.sleep(retry.take(attempt))
+            attempt += 1
+            owners, actions, nbytes = retried
+
+    @staticmethod
+    def handle_bulk_response(owners, actions, nbytes, response, latency,
+                             summary, sizer, retry, attempt):
+        """
+        record the outcome of a bulk request and select the actions to
+        re-submit, as allowed by the retry policy
+
+        :param owners: `list` of index of package of each action
+        :param actions: `list` of serialized lines of each action
+        :param nbytes: size of request in bytes
+        :param response: bulk API response, or exception raised by the
+                         request
+        :param latency: duration of request in seconds
+        :param summary: `msc_pygeoapi.connector.elasticsearch_.BulkSummary`
+        :param sizer: `msc_pygeoapi.connector.elasticsearch_.ChunkSizer`
+        :param retry: `msc_pygeoapi.connector.elasticsearch_.BulkRetry`
+        :param attempt: number of retries already made of the actions
+
+        :returns: `tuple` of owners, actions and size in bytes of actions
+                  to re-submit, or `None` if there are none. Raises the
+                  request error if it cannot be retried
+        """
+
+        if isinstance(response, Exception):
+            if not (retry.retryable(response) and retry.allow(attempt)):
+                raise response
+            LOGGER.warning(f'Bulk request failed: {response}')
+            sizer.observe(len(owners), 0, rejected=True)
+            pending = range(len(owners))
+        else:
+            summary.request(len(owners), nbytes, latency)
+            pending = summary.add_items(
+                owners, response, retry.allow(attempt)
+            )
+            sizer.observe(len(owners), latency, len(pending) > 0)
+            if not retry.allow(attempt):
+                return None
+
+        if not pending:
+            return None
+
+        LOGGER.debug(f'Retrying {len(pending)} bulk actions')
+        summary.retries += len(pending)
+        actions = [actions[i] for i in pending]
+
+        return (
+            [owners[i] for i in pending],
+            actions,
+            sum(len(line) + 1 for lines in actions for line in lines)
         )
 
-        if len(errors) > 0:
-            LOGGER.warning(
-                f'{len(errors)} errors encountered in bulk insert: {errors}'
+    def submit_elastic_packages(
+        self, packages, request_size=10000, refresh=False, thread_count=1,
+        max_chunk_bytes=MSC_PYGEOAPI_ES_BULK_MAX_BYTES
+    ):
+        """
+        helper function to send several packages of bulk API actions to
+        Elasticsearch through the same bulk requests and log the status of
+        the request. Status is reported for each package.
+
+        Requests are bounded by both document count and size in bytes. The
+        document count adapts to request latency and rejections, aiming for
+        `MSC_PYGEOAPI_ES_BULK_TARGET_LATENCY`, up to `request_size`.
+        Actions rejected with a retryable status (e.g. HTTP 429) are
+        re-submitted with backoff, within a retry budget.
+
+        With `thread_count` > 1, bulk requests are sent concurrently by a
+        thread pool: actions for the same document must then not be spread
+        over several requests, as requests may complete in any order.
+
+        :param packages: `list` of iterables of bulk API actions.
+        :param request_size: Maximum number of documents per request.
+        :param refresh: indicates whether to refresh the index
+        :param thread_count: Number of concurrent bulk requests.
+        :param max_chunk_bytes: Maximum size of a request in bytes.
+        :returns: `list` of `bool` of whether each package was successful.
+        """
+
+        if thread_count > 1:
+            return self.parallel_submit_elastic_packages(
+                packages, request_size, refresh, thread_count,
+                max_chunk_bytes
             )
-            return False
 
-        return True
+        summary = BulkSummary(len(packages))
+        sizer = self.get_chunk_sizer(request_size)
+        retry = BulkRetry()
+
+        with METRICS.timer('submit'):
+            for owners, actions, nbytes in self.chunk_actions(
+                packages, sizer, max_chunk_bytes
+            ):
+                self.send_bulk(
+                    owners, actions, nbytes, refresh, summary, sizer, retry
+                )
+
+        return summary.report()
+
+    def parallel_submit_elastic_packages(
+        self, packages, request_size, refresh, thread_count, max_chunk_bytes
+    ):
+        """
+        send several packages of bulk API actions to Elasticsearch through
+        concurrent bulk requests, with the current chunk size of
+        `request_size`. Status is reported for each package. The size of
+        requests sent by `parallel_bulk` is not recorded.
+
+        :param packages: `list` of iterables of bulk API actions.
+        :param request_size: Maximum number of documents per request.
+        :param refresh: indicates whether to refresh the index
+        :param thread_count: Number of concurrent bulk requests.
+        :param max_chunk_bytes: Maximum size of a request in bytes.
+        :returns: `list` of `bool` of whether each package was successful.
+        """
+
+        summary = BulkSummary(len(packages))
+        sizer = self.get_chunk_sizer(request_size)
+        chunk_size = sizer.size
+        retry = BulkRetry()
+
+        # parallel_bulk yields one result per action, in action order
+        owners = deque()
+        pending = [[] for package in packages]
+        rejected = []
+
+        def tag_actions():
+            for i, package in enumerate(packages):
+                for action in package:
+                    owners.append((i, action))
+                    yield action
+
+        LOGGER.debug(
+            f'Sending bulk requests of up to {chunk_size} documents with '
+            f'{thread_count} threads'
+        )
+
+        with METRICS.timer('submit'):
+            for ok, response in parallel_bulk(
+                self.Elasticsearch.options(**BULK_OPTIONS),
+                tag_actions(),
+                thread_count=thread_count,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                request_timeout=MSC_PYGEOAPI_ES_TIMEOUT,
+                raise_on_error=False,
+                refresh=refresh
+            ):
+                owner, action = owners.popleft()
+                status = next(iter(response.values())).get('status')
+                if not ok and status in RETRY_STATUSES:
+                    pending[owner].append(action)
+                    rejected.append((owner, response))
+                else:
+                    summary.add(owner, ok, response)
+
+            if any(pending) and retry.allow(0):
+                # re-submitted sequentially, after all other requests
+                time.sleep(retry.take(0))
+                for retry_owners, actions, nbytes in self.chunk_actions(
+                    pending, sizer, max_chunk_bytes
+                ):
+                    summary.retries += len(retry_owners)
+                    self.send_bulk(
+                        retry_owners, actions, nbytes, refresh, summary,
+                        sizer, retry, attempt=1
+                    )
+            else:
+                for owner, response in rejected:
+                    summary.add(owner, False, response)
+
+        return summary.report()
 
     def update_by_query(self, query, name):
         """
@@ -362,3 +1315,379 @@ class ElasticsearchConnector(BaseConnector):
 
     def __repr__(self):
         return f'<ElasticsearchConnector> {self.url}'
+
+
+class AsyncElasticsearchConnector(ElasticsearchConnector):
+    """
+    Elasticsearch Connector keeping several bulk requests in flight
+
+    Index management goes through the synchronous client; with a
+    `thread_count` > 1, bulk API actions are submitted with
+    `AsyncElasticsearch`, with at most `thread_count` concurrent bulk
+    requests. `submit_elastic_package(s)` keep their synchronous
+    signatures, so loaders opt in by changing their connector class only.
+    With a `thread_count` of 1, or if aiohttp is not installed, bulk
+    requests are sent by the synchronous connector. Requests in flight may
+    complete in any order, so loaders must not submit several actions for
+    the same document in one call.
+    """
+
+    def __init__(self, connector_def={}):
+        """
+        Elasticsearch connection initialization
+
+        :param connector_def: connection definition dictionnary
+
+        :returns: msc_pygeoapi.connector.elasticsearch_.AsyncElasticsearchConnector  # noqa
+        """
+
+        super().__init__(connector_def)
+
+        self.loop = asyncio.new_event_loop()
+        self.AsyncElasticsearch = self.connect_async()
+
+    def connect_async(self):
+        """
+        create asynchronous Elasticsearch connection
+
+        :returns: `elasticsearch.AsyncElasticsearch`, or `None` if the
+                  asynchronous transport (aiohttp) is not installed
+        """
+
+        es_args = {
+            'hosts': [self.url],
+            'verify_certs': self.verify_certs,
+            'retry_on_timeout': True,
+            'max_retries': 3,
+            'connections_per_node': MSC_PYGEOAPI_ES_CONNECTIONS_PER_NODE,
+            'serializer': get_serializer(),
+            'http_compress': MSC_PYGEOAPI_ES_HTTP_COMPRESS
+        }
+
+        if self.auth:
+            es_args['basic_auth'] = tuple(self.auth)
+
+        try:
+            return AsyncElasticsearch(**es_args)
+        except ValueError as err:
+            LOGGER.warning(
+                f'Asynchronous bulk requests unavailable ({err}); '
+                'falling back to synchronous bulk requests'
+            )
+            return None
+
+    async def async_submit_elastic_packages(
+        self, packages, request_size=10000, refresh=False, max_inflight=1,
+        max_chunk_bytes=MSC_PYGEOAPI_ES_BULK_MAX_BYTES
+    ):
+        """
+        send several packages of bulk API actions to Elasticsearch through
+        concurrent bulk requests. Status is reported for each package.
+
+        As with synchronous bulk requests, a request which fails and
+        cannot be retried stops the submission: requests in flight are
+        awaited, then the error is raised.
+
+        :param packages: `list` of iterables of bulk API actions.
+        :param request_size: Maximum number of documents per request.
+        :param refresh: indicates whether to refresh the index
+        :param max_inflight: maximum number of concurrent bulk requests
+        :param max_chunk_bytes: Maximum size of a request in bytes.
+        :returns: `list` of `bool` of whether each package was successful.
+        """
+
+        summary = BulkSummary(len(packages))
+        sizer = self.get_chunk_sizer(request_size)
+        retry = BulkRetry()
+        inflight = asyncio.Semaphore(max(1, max_inflight))
+        requests = []
+        failures = []
+
+        async def send(owners, actions, nbytes):
+            attempt = 0
+            try:
+                while owners:
+                    start = time.monotonic()
+                    try:
+                        response = await self.AsyncElasticsearch.options(
+                            **BULK_OPTIONS
+                        ).bulk(
+                            operations=list(chain.from_iterable(actions)),
+                            refresh=refresh,
+                            request_timeout=MSC_PYGEOAPI_ES_TIMEOUT
+                        )
+                    except (ApiError, ConnectionError,
+                            ConnectionTimeout) as err:
+                        response = err
+
+                    retried = self.handle_bulk_response(
+                        owners, actions, nbytes, response,
+                        time.monotonic() - start, summary, sizer, retry,
+                        attempt
+                    )
+                    if retried is None:
+                        return
+
+                    await asyncio.sleep(retry.take(attempt))
+                    attempt += 1
+                    owners, actions, nbytes = retried
+            except Exception as err:
+                LOGGER.error(f'Bulk request failed: {err}')
+                failures.append(err)
+            finally:
+                inflight.release()
+
+        for owners, actions, nbytes in self.chunk_actions(
+            packages, sizer, max_chunk_bytes
+        ):
+            # wait for a free slot before consuming more actions
+            await inflight.acquire()
+            if failures:
+                inflight.release()
+                break
+            requests.append(
+                asyncio.ensure_future(send(owners, actions, nbytes))
+            )
+
+        await asyncio.gather(*requests)
+
+        if failures:
+            raise failures[0]
+
+        return summary.report()
+
+    def submit_elastic_packages(
+        self, packages, request_size=10000, refresh=False, thread_count=1,
+        max_chunk_bytes=MSC_PYGEOAPI_ES_BULK_MAX_BYTES
+    ):
+        """
+        synchronous facade of `async_submit_elastic_packages`
+
+        :param packages: `list` of iterables of bulk API actions.
+        :param request_size: Maximum number of documents per request.
+        :param refresh: indicates whether to refresh the index
+        :param thread_count: Number of concurrent bulk requests (1 sends
+                             requests serially).
+        :param max_chunk_bytes: Maximum size of a request in bytes.
+        :returns: `list` of `bool` of whether each package was successful.
+        """
+
+        if self.AsyncElasticsearch is None or thread_count <= 1:
+            return super().submit_elastic_packages(
+                packages, request_size=request_size, refresh=refresh,
+                thread_count=thread_count, max_chunk_bytes=max_chunk_bytes
+            )
+
+        with METRICS.timer('submit'):
+            return self.loop.run_until_complete(
+                self.async_submit_elastic_packages(
+                    packages, request_size=request_size, refresh=refresh,
+                    max_inflight=thread_count,
+                    max_chunk_bytes=max_chunk_bytes
+                )
+            )
+
+    def close(self):
+        """
+        close asynchronous Elasticsearch connection
+
+        :returns: `None`
+        """
+
+        if self.AsyncElasticsearch is not None:
+            self.loop.run_until_complete(self.AsyncElasticsearch.close())
+
+        self.loop.close()
+
+    def __repr__(self):
+        return f'<AsyncElasticsearchConnector> {self.url}'
+
+
+class TimePartitionedIndex:
+    """
+    Time-partitioned index: documents are written to one index per time
+    interval (e.g. `cap_alerts.2024-01-01`), read through an alias named
+    after the dataset (e.g. `cap_alerts`) or the `<name>.*` pattern, and
+    expired by dropping whole partitions rather than with delete_by_query.
+    """
+
+    def __init__(self, conn, name, mappings, settings=None, interval='day'):
+        """
+        initializer
+
+        :param conn: `msc_pygeoapi.connector.elasticsearch_.ElasticsearchConnector`
+        :param name: `str` of dataset name, used as alias and index prefix
+        :param mappings: `dict` of index mappings
+        :param settings: `dict` of index settings
+        :param interval: `str` of partition interval (`day` or `hour`)
+
+        :returns: `msc_pygeoapi.connector.elasticsearch_.TimePartitionedIndex`
+        """  # noqa
+
+        if interval not in PARTITION_INTERVALS:
+            msg = f'Invalid partition interval: {interval}'
+            LOGGER.error(msg)
+            raise ValueError(msg)
+
+        self.conn = conn
+        self.name = name
+        self.pattern = f'{name}.*'
+        self.mappings = mappings
+        self.settings = settings or {
+            'number_of_shards': 1,
+            'number_of_replicas': 0
+        }
+        self.format, self.interval = PARTITION_INTERVALS[interval]
+
+    def setup(self):
+        """
+        create the index template of partitions, which adds new
+        partitions to the alias, failing if an index predating time
+        partitioning holds the alias name
+
+        :returns: `bool` of setup status
+        """
+
+        self.conn.create_template(f'{self.name}.', {
+            'order': 1,
+            'index_patterns': [self.pattern],
+            'settings': self.settings,
+            'mappings': self.mappings,
+            'aliases': {self.name: {}}
+        })
+
+        es = self.conn.Elasticsearch
+        if (es.indices.exists(index=self.name)
+                and not es.indices.exists_alias(name=self.name)):
+            # partitions cannot be created with the alias
+            msg = (f'Index {self.name} predates time partitioning and '
+                   f'prevents creating its alias: delete it to load '
+                   f'{self.pattern}')
+            LOGGER.error(msg)
+            raise RuntimeError(msg)
+
+        return True
+
+    def partition(self, datetime_):
+        """
+        get the partition (index name) of a datetime
+
+        :param datetime_: `datetime` (UTC) of document
+
+        :returns: `str` of index name
+        """
+
+        return f'{self.name}.{datetime_.strftime(self.format)}'
+
+    def delete_stale(self, targets):
+        """
+        delete copies of documents held in other partitions than the one
+        they are about to be written to (e.g. an amended product whose
+        partitioning datetime changed), which the alias would otherwise
+        return as duplicates
+
+        :param targets: `dict` of document id to target partition
+
+        :returns: `list` of deleted (index, id) tuples
+        """
+
+        es = self.conn.Elasticsearch
+        ids = list(targets)
+        deleted = []
+
+        # a document has at most one stale copy, so that the copies of a
+        # chunk of ids fit in a page of results
+        for i in range(0, len(ids), STALE_CHUNK_SIZE):
+            result = es.search(
+                index=self.pattern,
+                query={'ids': {'values': ids[i:i + STALE_CHUNK_SIZE]}},
+                _source=False,
+                size=STALE_CHUNK_SIZE * 2
+            )
+
+            for hit in result['hits']['hits']:
+                if hit['_index'] == targets[hit['_id']]:
+                    continue
+                LOGGER.debug(f"Deleting stale copy {hit['_id']} of "
+                             f"{hit['_index']}")
+                es.delete(index=hit['_index'], id=hit['_id'])
+                deleted.append((hit['_index'], hit['_id']))
+
+        return deleted
+
+    def partitions(self):
+        """
+        get existing partitions
+
+        :returns: `list` of index names
+        """
+
+        return self.conn.get(self.pattern)
+
+    def expired(self, before, partitions=None):
+        """
+        get partitions whose interval ends at or before a datetime
+
+        :param before: `datetime` (UTC) of retention limit
+        :param partitions: `list` of index names (default: existing
+                           partitions)
+
+        :returns: `list` of index names
+        """
+
+        if partitions is None:
+            partitions = self.partitions()
+
+        to_delete = []
+
+        for index in partitions:
+            suffix = index[len(self.name) + 1:]
+            try:
+                start = datetime.strptime(suffix, self.format)
+            except ValueError:
+                LOGGER.warning(f'Skipping unknown partition {index}')
+                continue
+
+            if start + self.interval <= before:
+                to_delete.append(index)
+
+        return sorted(to_delete)
+
+    def clean(self, before):
+        """
+        delete partitions whose interval ends at or before a datetime
+
+        :param before: `datetime` (UTC) of retention limit
+
+        :returns: `list` of deleted index names
+        """
+
+        to_delete = self.expired(before)
+
+        if to_delete:
+            self.conn.delete(','.join(to_delete))
+
+        return to_delete
+
+    def delete(self):
+        """
+        delete all partitions, and the index predating time partitioning
+        if any
+
+        :returns: `list` of deleted index names
+        """
+
+        to_delete = self.partitions()
+
+        es = self.conn.Elasticsearch
+        if (es.indices.exists(index=self.name)
+                and not es.indices.exists_alias(name=self.name)):
+            to_delete.append(self.name)
+
+        if to_delete:
+            self.conn.delete(','.join(to_delete))
+
+        return to_delete
+
+    def __repr__(self):
+        return f'<TimePartitionedIndex> {self.pattern}'
@@ -45,6 +45,31 @@ MSC_PYGEOAPI_OGC_API_URL = os.getenv('MSC_PYGEOAPI_OGC_API_URL'.rstrip('/'),
 
 MSC_PYGEOAPI_ES_URL = os.getenv('MSC_PYGEOAPI_ES_URL', None)
 MSC_PYGEOAPI_ES_TIMEOUT = int(os.getenv('MSC_PYGEOAPI_ES_TIMEOUT', 90))
+MSC_PYGEOAPI_ES_BULK_MAX_BYTES = int(
+    os.getenv('MSC_PYGEOAPI_ES_BULK_MAX_BYTES', 10485760))
+MSC_PYGEOAPI_ES_BULK_TARGET_LATENCY = float(
+    os.getenv('MSC_PYGEOAPI_ES_BULK_TARGET_LATENCY', 2))
+MSC_PYGEOAPI_ES_BULK_MAX_RETRIES = int(
+    os.getenv('MSC_PYGEOAPI_ES_BULK_MAX_RETRIES', 3))
+MSC_PYGEOAPI_ES_BULK_RETRY_BACKOFF = float(
+    os.getenv('MSC_PYGEOAPI_ES_BULK_RETRY_BACKOFF', 1))
+MSC_PYGEOAPI_ES_BULK_RETRY_BUDGET = int(
+    os.getenv('MSC_PYGEOAPI_ES_BULK_RETRY_BUDGET', 20))
+MSC_PYGEOAPI_ES_CONNECTIONS_PER_NODE = int(
+    os.getenv('MSC_PYGEOAPI_ES_CONNECTIONS_PER_NODE', 10))
+MSC_PYGEOAPI_ES_HTTP_COMPRESS = os.getenv(
+    'MSC_PYGEOAPI_ES_HTTP_COMPRESS', 'false').lower() in ('true', 'yes', '1')
+MSC_PYGEOAPI_ES_SERIALIZER = os.getenv('MSC_PYGEOAPI_ES_SERIALIZER', 'json')
+MSC_PYGEOAPI_ES_SNIFF = os.getenv(
+    'MSC_PYGEOAPI_ES_SNIFF', 'false').lower() in ('true', 'yes', '1')
+MSC_PYGEOAPI_ES_TEMPLATE_CACHE = os.getenv(
+    'MSC_PYGEOAPI_ES_TEMPLATE_CACHE', None)
+MSC_PYGEOAPI_ES_TEMPLATE_CACHE_TTL = int(
+    os.getenv('MSC_PYGEOAPI_ES_TEMPLATE_CACHE_TTL', 300))
+MSC_PYGEOAPI_ES_MAPPING_CACHE_TTL = int(
+    os.getenv('MSC_PYGEOAPI_ES_MAPPING_CACHE_TTL', 300))
+MSC_PYGEOAPI_QUERY_COALESCING = os.getenv(
+    'MSC_PYGEOAPI_QUERY_COALESCING', 'true').lower() in ('true', 'yes', '1')
 MSC_PYGEOAPI_CACHEDIR = os.getenv('MSC_PYGEOAPI_CACHEDIR', '/tmp')
 
 MSC_PYGEOAPI_ES_USERNAME = os.getenv('MSC_PYGEOAPI_ES_USERNAME', None)
@@ -59,6 +84,30 @@ if None in (MSC_PYGEOAPI_ES_USERNAME, MSC_PYGEOAPI_ES_PASSWORD):
 else:
     MSC_PYGEOAPI_ES_AUTH = (MSC_PYGEOAPI_ES_USERNAME, MSC_PYGEOAPI_ES_PASSWORD)
 
+MSC_PYGEOAPI_EVENT_BATCH = os.getenv(
+    'MSC_PYGEOAPI_EVENT_BATCH', 'false').lower() in ('true', 'yes', '1')
+MSC_PYGEOAPI_EVENT_THREADS = int(os.getenv('MSC_PYGEOAPI_EVENT_THREADS', 0))
+MSC_PYGEOAPI_EVENT_PROCESSES = int(
+    os.getenv('MSC_PYGEOAPI_EVENT_PROCESSES', 0))
+MSC_PYGEOAPI_EVENT_RETRY_MAX = int(
+    os.getenv('MSC_PYGEOAPI_EVENT_RETRY_MAX', 3))
+MSC_PYGEOAPI_EVENT_RETRY_BACKOFF = int(
+    os.getenv('MSC_PYGEOAPI_EVENT_RETRY_BACKOFF', 30))
+MSC_PYGEOAPI_EVENT_RETRY_BACKOFF_MAX = int(
+    os.getenv('MSC_PYGEOAPI_EVENT_RETRY_BACKOFF_MAX', 600))
+MSC_PYGEOAPI_EVENT_DEADLETTER_DIR = os.getenv(
+    'MSC_PYGEOAPI_EVENT_DEADLETTER_DIR', None)
+MSC_PYGEOAPI_EVENT_DEDUP_SIZE = int(
+    os.getenv('MSC_PYGEOAPI_EVENT_DEDUP_SIZE', 0))
+MSC_PYGEOAPI_EVENT_DEDUP_TTL = int(
+    os.getenv('MSC_PYGEOAPI_EVENT_DEDUP_TTL', 3600))
+MSC_PYGEOAPI_EVENT_DEDUP_FILE = os.getenv(
+    'MSC_PYGEOAPI_EVENT_DEDUP_FILE', None)
+
+MSC_PYGEOAPI_METRICS_FILE = os.getenv('MSC_PYGEOAPI_METRICS_FILE', None)
+MSC_PYGEOAPI_METRICS_INTERVAL = int(
+    os.getenv('MSC_PYGEOAPI_METRICS_INTERVAL', 60))
+
 MSC_PYGEOAPI_BASEPATH = os.path.dirname(os.path.realpath(__file__))
 
 GEOMET_HPFX_BASEPATH = os.getenv('GEOMET_HPFX_BASEPATH', None)
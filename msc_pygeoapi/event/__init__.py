@@ -32,10 +32,33 @@
 #
 # =================================================================
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import logging
+import multiprocessing
+import os
 
 from sarracenia.flowcb import FlowCB
 
+from msc_pygeoapi.env import (
+    MSC_PYGEOAPI_EVENT_BATCH,
+    MSC_PYGEOAPI_EVENT_DEADLETTER_DIR,
+    MSC_PYGEOAPI_EVENT_DEDUP_FILE,
+    MSC_PYGEOAPI_EVENT_DEDUP_SIZE,
+    MSC_PYGEOAPI_EVENT_DEDUP_TTL,
+    MSC_PYGEOAPI_EVENT_PROCESSES,
+    MSC_PYGEOAPI_EVENT_RETRY_BACKOFF,
+    MSC_PYGEOAPI_EVENT_RETRY_BACKOFF_MAX,
+    MSC_PYGEOAPI_EVENT_RETRY_MAX,
+    MSC_PYGEOAPI_EVENT_THREADS,
+    MSC_PYGEOAPI_LOGGING_LOGFILE,
+    MSC_PYGEOAPI_LOGGING_LOGLEVEL
+)
+from msc_pygeoapi.handler.dedup import DedupCache, get_key
+from msc_pygeoapi.handler.executor import KeyedThreadPool
+from msc_pygeoapi.handler.retry import RetryQueue
+from msc_pygeoapi.metrics import METRICS
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -50,35 +73,508 @@ class EventBase(FlowCB):
 
         super().__init__(options, LOGGER)
 
-    def process_message(self, worklist, worklist_type) -> bool:
+        self.retries = RetryQueue(
+            max_retries=MSC_PYGEOAPI_EVENT_RETRY_MAX,
+            backoff=MSC_PYGEOAPI_EVENT_RETRY_BACKOFF,
+            backoff_max=MSC_PYGEOAPI_EVENT_RETRY_BACKOFF_MAX,
+            deadletter_dir=MSC_PYGEOAPI_EVENT_DEADLETTER_DIR
+        )
+
+        self.executor = None
+        if MSC_PYGEOAPI_EVENT_THREADS > 1:
+            LOGGER.debug(f'Using {MSC_PYGEOAPI_EVENT_THREADS} threads')
+            self.executor = KeyedThreadPool(MSC_PYGEOAPI_EVENT_THREADS)
+
+        self.processes = None
+        if MSC_PYGEOAPI_EVENT_PROCESSES > 0:
+            LOGGER.debug(f'Using {MSC_PYGEOAPI_EVENT_PROCESSES} processes')
+            self.processes = self.create_process_pool()
+
+        self.dedup = None
+        if MSC_PYGEOAPI_EVENT_DEDUP_SIZE > 0:
+            dedup_file = None
+            if MSC_PYGEOAPI_EVENT_DEDUP_FILE is not None:
+                dedup_file = self.get_instance_filepath(
+                    MSC_PYGEOAPI_EVENT_DEDUP_FILE)
+
+            self.dedup = DedupCache(
+                max_entries=MSC_PYGEOAPI_EVENT_DEDUP_SIZE,
+                ttl=MSC_PYGEOAPI_EVENT_DEDUP_TTL,
+                filepath=dedup_file
+            )
+
+        if METRICS.enabled:
+            self.configure_metrics()
+
+    def get_instance(self) -> tuple:
+        """
+        Get the identity of the sarracenia instance
+
+        :returns: `tuple` of configuration name and instance number
+        """
+
+        config = str(getattr(self.o, 'config', None) or 'msc-pygeoapi')
+        instance = str(getattr(self.o, 'no', None) or os.getpid())
+
+        return config, instance
+
+    def get_instance_filepath(self, filepath) -> str:
+        """
+        Suffix a filepath with the identity of the sarracenia instance, so
+        that instances do not overwrite each other's files
+
+        :param filepath: path to file
+
+        :returns: `str` of instance filepath
+        """
+
+        config, instance = self.get_instance()
+        base, ext = os.path.splitext(filepath)
+
+        return f"{base}-{config.replace('/', '_')}-{instance}{ext}"
+
+    def configure_metrics(self) -> None:
+        """
+        Give each sarracenia instance its own metrics file and labels
+
+        :returns: `None`
+        """
+
+        config, instance = self.get_instance()
+        filepath = self.get_instance_filepath(METRICS.filepath)
+
+        LOGGER.debug(f'Exporting metrics to {filepath}')
+        METRICS.configure(
+            filepath, labels={'config': config, 'instance': instance})
+
+    def create_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Create the pool of worker processes used to parse CPU-bound files
+
+        Workers are spawned rather than forked so that they do not inherit
+        the AMQP connections and threads of the sarracenia instance.
+
+        :returns: `concurrent.futures.ProcessPoolExecutor`
+        """
+
+        from msc_pygeoapi.log import setup_logger
+
+        return ProcessPoolExecutor(
+            max_workers=MSC_PYGEOAPI_EVENT_PROCESSES,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=setup_logger,
+            initargs=(MSC_PYGEOAPI_LOGGING_LOGLEVEL,
+                      MSC_PYGEOAPI_LOGGING_LOGFILE)
+        )
+
+    def on_stop(self) -> None:
+        """
+        sarracenia on_stop hook
+
+        :returns: `None`
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown()
+
+        if self.processes is not None:
+            self.processes.shutdown()
+
+        if self.dedup is not None:
+            self.dedup.save()
+
+        METRICS.export()
+
+    def get_filepath(self, msg) -> str:
+        """
+        Get the path of the file of a sarracenia message
+
+        :param msg: `sarracenia.Message`
+
+        :returns: `str` of filepath
         """
-        Process sarracenia message
+
+        return f"{msg['new_dir']}/{msg['new_file']}"
+
+    def get_plugin_name(self, filepath) -> str:
+        """
+        Get the name of the loader plugin of a file
+
+        :param filepath: path to file
+
+        :returns: `str` of plugin name (`unmatched` if no loader matches)
+        """
+
+        from msc_pygeoapi.plugin import LOADER_ROUTER
+
+        return LOADER_ROUTER.route(filepath) or 'unmatched'
+
+    def get_ordering_key(self, filepath) -> str:
+        """
+        Get the key of a file for which processing order must be preserved
+
+        :param filepath: path to file
+
+        :returns: `str` of ordering key
+        """
+
+        from msc_pygeoapi.plugin import LOADER_ROUTER
+
+        plugin_name = LOADER_ROUTER.route(filepath)
+
+        if plugin_name is None:
+            return filepath
+
+        return LOADER_ROUTER.ordering_key(plugin_name, filepath)
+
+    def is_cpu_bound(self, filepath) -> bool:
+        """
+        Determine whether a file is parsed in the process pool
+
+        :param filepath: path to file
+
+        :returns: `bool`
+        """
+
+        from msc_pygeoapi.plugin import LOADER_ROUTER, PLUGINS
+
+        if self.processes is None:
+            return False
+
+        plugin_name = LOADER_ROUTER.route(filepath)
+
+        if plugin_name is None:
+            return False
+
+        return PLUGINS['loader'][plugin_name].get('cpu_bound', False)
+
+    def run_tasks(self, tasks) -> list:
+        """
+        Run tasks, concurrently if a thread pool is configured
+
+        :param tasks: `list` of (ordering key, callable, args) tuples
+
+        :returns: `list` of (result, error) tuples, in task order
+        """
+
+        outcomes = []
+
+        if self.executor is None:
+            for key, func, args in tasks:
+                try:
+                    outcomes.append((func(*args), None))
+                except Exception as err:
+                    outcomes.append((None, err))
+
+            return outcomes
+
+        futures = [
+            self.executor.submit(key, func, *args)
+            for key, func, args in tasks
+        ]
+
+        for future in futures:
+            try:
+                outcomes.append((future.result(), None))
+            except Exception as err:
+                outcomes.append((None, err))
+
+        return outcomes
+
+    def get_dedup_key(self, msg) -> str:
+        """
+        Get the deduplication cache key of a sarracenia message
+
+        :param msg: `sarracenia.Message`
+
+        :returns: `str` of cache key, or `None` if the message cannot be
+                  deduplicated
+        """
+
+        if self.dedup is None:
+            return None
+
+        identity = msg.get('identity', msg.get('integrity'))
+
+        return get_key(self.get_filepath(msg), identity)
+
+    def message_duplicate(self, msg, keys) -> bool:
+        """
+        Determine whether a message announces a file which was already
+        processed (retransmissions, mirror re-announcements, overlapping
+        subscriptions)
+
+        :param msg: `sarracenia.Message`
+        :param keys: `set` of cache keys of messages of the current
+                     worklist, updated in place
+
+        :returns: `bool`
+        """
+
+        key = self.get_dedup_key(msg)
+
+        if key is None:
+            return False
+
+        if key in keys or self.dedup.seen(key):
+            filepath = self.get_filepath(msg)
+            LOGGER.debug(f'Skipping duplicate {filepath}')
+            METRICS.inc('messages_total', status='duplicate',
+                        loader=self.get_plugin_name(filepath))
+            return True
+
+        keys.add(key)
+
+        return False
+
+    def message_ready(self, worklist, msg) -> bool:
+        """
+        Determine whether a message is due for processing, deferring
+        messages still in their retry backoff period
 
         :param worklist: `sarracenia.flow.worklist`
+        :param msg: `sarracenia.Message`
 
         :returns: `bool`
         """
 
+        filepath = self.get_filepath(msg)
+
+        if self.retries.ready(filepath):
+            return True
+
+        LOGGER.debug(f'Deferring {filepath} (retry backoff)')
+        worklist.failed.append(msg)
+        METRICS.inc('messages_total', status='deferred',
+                    loader=self.get_plugin_name(filepath))
+
+        return False
+
+    def message_succeeded(self, msg) -> None:
+        """
+        Record a successfully processed message
+
+        :param msg: `sarracenia.Message`
+
+        :returns: `None`
+        """
+
+        filepath = self.get_filepath(msg)
+        self.retries.succeeded(filepath)
+
+        key = self.get_dedup_key(msg)
+        if key is not None:
+            self.dedup.add(key)
+
+        METRICS.inc('messages_total', status='ok',
+                    loader=self.get_plugin_name(filepath))
+
+    def message_failed(self, worklist, msg, err) -> None:
+        """
+        Record a failed message, queueing it for retry or rejecting it
+        once its retry budget is exhausted
+
+        :param worklist: `sarracenia.flow.worklist`
+        :param msg: `sarracenia.Message`
+        :param err: error raised when processing message
+
+        :returns: `None`
+        """
+
+        filepath = self.get_filepath(msg)
+        LOGGER.error(f'Error handling message {filepath}: {err}')
+
+        if self.retries.failed(filepath, err):
+            worklist.failed.append(msg)
+            status = 'retry'
+        else:
+            worklist.rejected.append(msg)
+            status = 'rejected'
+
+        METRICS.inc('messages_total', status=status,
+                    loader=self.get_plugin_name(filepath))
+
+    def handle_file(self, filepath) -> tuple:
+        """
+        Handle a file with its loader
+
+        :param filepath: path to file
+
+        :returns: `tuple` of plugin name and `None` (as returned by
+                  `msc_pygeoapi.handler.core.prepare_file` for files
+                  handled directly)
+        """
+
+        from msc_pygeoapi.handler.core import CoreHandler
+
+        LOGGER.debug(f'Filepath: {filepath}')
+        handler = CoreHandler(filepath)
+        result = handler.handle()
+        LOGGER.debug(f'Result: {result}')
+
+        return handler.plugin_name, None
+
+    def prepare_messages(self, msgs) -> list:
+        """
+        Handle files, or generate their bulk API actions when batching.
+
+        Files of CPU-bound loaders are parsed in the process pool (if
+        configured); only their bulk API actions and the metrics recorded
+        by the workers are sent back, and Elasticsearch I/O remains in this
+        process.
+
+        :param msgs: `list` of `sarracenia.Message`
+
+        :returns: `list` of (result, error) tuples, in message order, where
+                  result is a tuple of plugin name and `list` of bulk API
+                  actions (`None` if the file was handled directly)
+        """
+
+        from msc_pygeoapi.handler.core import (
+            prepare_file, prepare_file_in_worker
+        )
+
+        outcomes = [None] * len(msgs)
+        futures = {}
+        tasks = []
+
+        for i, msg in enumerate(msgs):
+            filepath = self.get_filepath(msg)
+
+            if self.is_cpu_bound(filepath):
+                futures[i] = self.processes.submit(
+                    prepare_file_in_worker, filepath)
+                continue
+
+            key = self.get_ordering_key(filepath)
+            if MSC_PYGEOAPI_EVENT_BATCH:
+                tasks.append((i, (key, prepare_file, (filepath,))))
+            else:
+                tasks.append((i, (key, self.handle_file, (filepath,))))
+
+        results = self.run_tasks([task for i, task in tasks])
+        for (i, task), outcome in zip(tasks, results):
+            outcomes[i] = outcome
+
+        broken = False
+        for i, future in futures.items():
+            try:
+                result, err, metrics = future.result()
+                METRICS.merge(metrics)
+                outcomes[i] = (result, err)
+            except BrokenProcessPool as err:
+                broken = True
+                outcomes[i] = (None, err)
+            except Exception as err:
+                outcomes[i] = (None, err)
+
+        if broken:
+            LOGGER.error('Process pool broken; restarting worker processes')
+            self.processes.shutdown(wait=False)
+            self.processes = self.create_process_pool()
+
+        return outcomes
+
+    def submit_packages(self, plugin_name, packages) -> list:
+        """
+        Submit packages of bulk API actions with a loader's connector and
+        submit options (request size, refresh), as when the loader submits
+        a single file itself
+
+        :param plugin_name: plugin name
+        :param packages: `list` of `list` of bulk API actions
+
+        :returns: `list` of `bool` of whether each package was successful
+        """
+
+        from msc_pygeoapi.plugin import LOADER_POOL
+
+        LOGGER.debug(f'Submitting {len(packages)} files for {plugin_name}')
+        loader = LOADER_POOL.get(plugin_name)
+
+        try:
+            with METRICS.loader(plugin_name):
+                return loader.conn.submit_elastic_packages(
+                    packages, **loader.submit_options
+                )
+        except Exception:
+            LOADER_POOL.invalidate(plugin_name)
+            raise
+
+    def process_message(self, worklist, worklist_type) -> bool:
+        """
+        Process sarracenia messages
+
+        Messages are handled one at a time, except when batching is enabled
+        or their loader is CPU-bound and a process pool is configured: their
+        bulk API actions are then grouped by target loader and each group
+        is submitted together.
+
+        Failures are isolated per message: a failed message is queued for
+        retry and the remaining messages are still processed. Duplicates of
+        recently processed files are acknowledged without being handled.
+
+        :param worklist: `sarracenia.flow.worklist`
+
+        :returns: `bool` of whether all messages were processed
+        """
+
         new_msgs = []
+        groups = {}
+        failures = 0
 
+        msgs = []
+        keys = set()
         for msg in getattr(worklist, worklist_type):
-            try:
-                from msc_pygeoapi.handler.core import CoreHandler
+            if not self.message_ready(worklist, msg):
+                continue
 
-                filepath = f"{msg['new_dir']}/{msg['new_file']}"
-                LOGGER.debug(f'Filepath: {filepath}')
-                handler = CoreHandler(filepath)
-                result = handler.handle()
-                LOGGER.debug(f'Result: {result}')
+            if self.message_duplicate(msg, keys):
                 new_msgs.append(msg)
-            except Exception as err:
-                LOGGER.error(f'Error handling message: {err}')
-                worklist.failed.append(msg)
-                return False
+            else:
+                msgs.append(msg)
+
+        for msg, (result, err) in zip(msgs, self.prepare_messages(msgs)):
+            if err is not None:
+                self.message_failed(worklist, msg, err)
+                failures += 1
+                continue
+
+            plugin_name, actions = result
+            if actions is None:
+                self.message_succeeded(msg)
+                new_msgs.append(msg)
+            else:
+                groups.setdefault(plugin_name, []).append((msg, actions))
+
+        tasks = []
+        for plugin_name, group in groups.items():
+            packages = [actions for msg, actions in group]
+            tasks.append(
+                (plugin_name, self.submit_packages, (plugin_name, packages))
+            )
+
+        for group, (results, err) in zip(groups.values(),
+                                         self.run_tasks(tasks)):
+            if err is not None:
+                LOGGER.error(f'Error submitting batch: {err}')
+                results = [False] * len(group)
+            else:
+                err = 'Bulk API errors'
+
+            for (msg, actions), result in zip(group, results):
+                if result:
+                    self.message_succeeded(msg)
+                    new_msgs.append(msg)
+                else:
+                    self.message_failed(worklist, msg, err)
+                    failures += 1
 
         setattr(worklist, worklist_type, new_msgs)
 
-        return True
+        METRICS.flush()
+
+        return failures == 0
 
 
 class EventAfterWork(EventBase):
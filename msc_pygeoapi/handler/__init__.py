@@ -26,3 +26,61 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 #
 # =================================================================
+
+from collections import Counter
+import time
+
+import click
+
+from msc_pygeoapi import cli_options
+from msc_pygeoapi.plugin import LOADER_ROUTER
+
+
+@click.group()
+def handler():
+    """Event handling"""
+    pass
+
+
+@click.command()
+@click.pass_context
+@cli_options.OPTION_FILE(
+    required=True,
+    help='Path to file of paths to route (one per line)'
+)
+@click.option('--repeat', '-r', type=click.IntRange(1), default=1,
+              help='Number of times to route the list of paths (default=1)')
+@click.option('--verbose', '-v', is_flag=True,
+              help='Print the plugin selected for each path')
+def route(ctx, file_, repeat, verbose):
+    """Benchmark loader routing over a list of paths"""
+
+    with open(file_) as fh:
+        paths = [line.strip() for line in fh if line.strip()]
+
+    if not paths:
+        raise click.ClickException(f'No paths found in {file_}')
+
+    routes = Counter()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            LOADER_ROUTER.route(path)
+    elapsed = time.perf_counter() - start
+
+    for path in paths:
+        plugin_name = LOADER_ROUTER.route(path) or 'unmatched'
+        routes[plugin_name] += 1
+        if verbose:
+            click.echo(f'{path} -> {plugin_name}')
+
+    total = len(paths) * repeat
+    click.echo(f'Routed {total} paths in {elapsed:.6f}s '
+               f'({elapsed / total * 1e6:.3f} µs/path)')
+
+    for plugin_name, count in routes.most_common():
+        click.echo(f'{plugin_name}: {count}')
+
+
+handler.add_command(route)
@@ -28,9 +28,11 @@
 # =================================================================
 
 import logging
+import time
 
 from msc_pygeoapi.handler.base import BaseHandler
-from msc_pygeoapi.plugin import PLUGINS, load_plugin
+from msc_pygeoapi.metrics import METRICS
+from msc_pygeoapi.plugin import LOADER_POOL, LOADER_ROUTER
 
 LOGGER = logging.getLogger(__name__)
 
@@ -48,33 +50,115 @@ class CoreHandler(BaseHandler):
         """
 
         self.plugin = None
+        self.plugin_name = None
 
         BaseHandler.__init__(self, filepath)
 
-    def handle(self):
+    def route(self):
         """
-        handle incoming file
+        select and prepare the loader for the incoming file
 
-        :returns: `bool` of status result
+        :returns: loader object
         """
 
         LOGGER.debug('Detecting filename pattern')
-        for key in PLUGINS['loader'].keys():
-            if PLUGINS['loader'][key]['filename_pattern'] in self.filepath:
-                plugin_def = PLUGINS['loader'][key]
-                LOGGER.debug(f'Loading plugin {plugin_def}')
-                self.plugin = load_plugin('loader', plugin_def)
+        start = time.perf_counter()
+        self.plugin_name = LOADER_ROUTER.route(self.filepath)
+        METRICS.observe('route', time.perf_counter() - start,
+                        self.plugin_name or 'unmatched')
 
-        if self.plugin is None:
+        if self.plugin_name is None:
             msg = 'Plugin not found'
             LOGGER.error(msg)
             raise RuntimeError(msg)
 
+        self.plugin = LOADER_POOL.get(self.plugin_name)
+        self.plugin.reset()
+
+        return self.plugin
+
+    def handle(self):
+        """
+        handle incoming file
+
+        :returns: `bool` of status result
+        """
+
+        self.route()
+
         LOGGER.debug('Handling file')
-        status = self.plugin.load_data(self.filepath)
+        try:
+            with METRICS.loader(self.plugin_name), METRICS.timer('load'):
+                status = self.plugin.load_data(self.filepath)
+        except Exception:
+            # the loader may be left in an inconsistent state (stale
+            # connection, partial per-file state); rebuild it on next use
+            LOADER_POOL.invalidate(self.plugin_name)
+            raise
+
         LOGGER.debug(f'Status: {status}')
 
         return True
 
+    def generate_actions(self):
+        """
+        generate bulk API actions for incoming file without submitting them
+
+        :returns: `list` of bulk API actions, or `None` if the loader does
+                  not support batching
+        """
+
+        self.route()
+
+        LOGGER.debug('Generating actions')
+        try:
+            with METRICS.loader(self.plugin_name), METRICS.timer('generate'):
+                return self.plugin.generate_actions(self.filepath)
+        except Exception:
+            LOADER_POOL.invalidate(self.plugin_name)
+            raise
+
     def __repr__(self):
         return f'<CoreHandler> {self.filepath}'
+
+
+def prepare_file(filepath):
+    """
+    Generate the bulk API actions of a file, falling back to handling
+    the file directly if its loader does not support batching
+
+    Module level so that it can be dispatched to a process pool.
+
+    :param filepath: path to file
+
+    :returns: `tuple` of plugin name and `list` of bulk API actions
+              (`None` if the file was handled directly)
+    """
+
+    LOGGER.debug(f'Filepath: {filepath}')
+    handler = CoreHandler(filepath)
+    actions = handler.generate_actions()
+
+    if actions is None:
+        result = handler.handle()
+        LOGGER.debug(f'Result: {result}')
+
+    return handler.plugin_name, actions
+
+
+def prepare_file_in_worker(filepath):
+    """
+    Generate the bulk API actions of a file in a worker process (see
+    `prepare_file`), returning the metrics recorded meanwhile so that the
+    parent process exports them
+
+    :param filepath: path to file
+
+    :returns: `tuple` of `prepare_file` result (`None` on error), error
+              (`None` on success) and `dict` of metrics
+    """
+
+    try:
+        return prepare_file(filepath), None, METRICS.drain()
+    except Exception as err:
+        return None, err, METRICS.drain()
@@ -0,0 +1,189 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+from collections import OrderedDict
+import json
+import logging
+import os
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DedupCache:
+    """
+    bounded LRU cache of recently processed files, keyed by path and
+    content checksum, with entries expiring after a time-to-live and
+    optional persistence across restarts
+    """
+
+    def __init__(self, max_entries=10000, ttl=3600, filepath=None):
+        """
+        initializer
+
+        :param max_entries: maximum number of files tracked
+        :param ttl: number of seconds a processed file is remembered
+        :param filepath: path of JSON file to persist cache to
+                         (default does not persist cache)
+
+        :returns: `msc_pygeoapi.handler.dedup.DedupCache`
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.filepath = filepath
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        if self.filepath is not None:
+            self.load()
+
+    def seen(self, key):
+        """
+        determine whether a file was recently processed
+
+        :param key: cache key (see `msc_pygeoapi.handler.dedup.get_key`)
+
+        :returns: `bool` of whether file is a duplicate
+        """
+
+        with self.lock:
+            added = self.entries.get(key)
+
+            if added is None:
+                return False
+
+            if time.time() - added > self.ttl:
+                del self.entries[key]
+                return False
+
+            self.entries.move_to_end(key)
+
+        return True
+
+    def add(self, key):
+        """
+        remember a processed file
+
+        :param key: cache key (see `msc_pygeoapi.handler.dedup.get_key`)
+
+        :returns: `None`
+        """
+
+        with self.lock:
+            self.entries[key] = time.time()
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def load(self):
+        """
+        load unexpired entries from cache file
+
+        :returns: `bool` of whether cache file was loaded
+        """
+
+        try:
+            with open(self.filepath) as fh:
+                entries = json.load(fh)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as err:
+            LOGGER.warning(f'Cannot load cache {self.filepath}: {err}')
+            return False
+
+        now = time.time()
+
+        with self.lock:
+            for key, added in sorted(entries.items(), key=lambda e: e[1]):
+                if now - added <= self.ttl:
+                    self.entries[key] = added
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        LOGGER.debug(f'Loaded {len(self.entries)} files from {self.filepath}')
+
+        return True
+
+    def save(self):
+        """
+        save entries to cache file
+
+        :returns: `bool` of whether cache file was saved
+        """
+
+        if self.filepath is None:
+            return False
+
+        with self.lock:
+            entries = dict(self.entries)
+
+        tmp_filepath = f'{self.filepath}.{os.getpid()}.tmp'
+
+        try:
+            with open(tmp_filepath, 'w') as fh:
+                json.dump(entries, fh)
+            os.replace(tmp_filepath, self.filepath)
+        except OSError as err:
+            LOGGER.warning(f'Cannot save cache {self.filepath}: {err}')
+            return False
+
+        return True
+
+    def __repr__(self):
+        return f'<DedupCache> {len(self.entries)} files'
+
+
+def get_key(filepath, identity):
+    """
+    build the cache key of a file
+
+    :param filepath: path to file
+    :param identity: `dict` of sarracenia message identity (checksum)
+                     with `method` and `value` keys
+
+    :returns: `str` of cache key, or `None` if the checksum cannot
+              identify the file content
+    """
+
+    if not isinstance(identity, dict):
+        return None
+
+    method = identity.get('method')
+    value = identity.get('value')
+
+    # checksums computed on download or randomized are not content based
+    if not value or method in ('cod', 'random'):
+        return None
+
+    return f'{filepath}:{method}:{value}'
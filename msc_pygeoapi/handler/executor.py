@@ -0,0 +1,93 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+class KeyedThreadPool:
+    """
+    bounded thread pool preserving submission order per key
+
+    Each worker thread has its own queue; tasks are assigned to a worker
+    by hashing their key, so tasks sharing a key run sequentially in
+    submission order while tasks with different keys run concurrently.
+    """
+
+    def __init__(self, size):
+        """
+        initializer
+
+        :param size: number of worker threads
+
+        :returns: `msc_pygeoapi.handler.executor.KeyedThreadPool`
+        """
+
+        self.size = size
+        self.workers = [
+            ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f'msc-pygeoapi-{i}'
+            )
+            for i in range(size)
+        ]
+
+    def submit(self, key, func, *args, **kwargs):
+        """
+        submit a task
+
+        :param key: ordering key of task
+        :param func: callable to run
+        :param args: positional arguments of callable
+        :param kwargs: keyword arguments of callable
+
+        :returns: `concurrent.futures.Future`
+        """
+
+        worker = self.workers[hash(key) % self.size]
+
+        return worker.submit(func, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """
+        shutdown worker threads
+
+        :param wait: whether to wait for pending tasks to complete
+
+        :returns: `None`
+        """
+
+        LOGGER.debug(f'Shutting down {self.size} worker threads')
+        for worker in self.workers:
+            worker.shutdown(wait=wait)
+
+    def __repr__(self):
+        return f'<KeyedThreadPool> {self.size} workers'
@@ -0,0 +1,192 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+from collections import OrderedDict
+from datetime import datetime
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RetryQueue:
+    """
+    per-process tracking of failed files with capped exponential backoff
+    and a dead-letter directory for files exceeding their retry budget
+    """
+
+    def __init__(self, max_retries=3, backoff=30, backoff_max=600,
+                 deadletter_dir=None, max_entries=10000):
+        """
+        initializer
+
+        :param max_retries: number of retries before a file is dead-lettered
+        :param backoff: initial backoff delay in seconds
+        :param backoff_max: maximum backoff delay in seconds
+        :param deadletter_dir: directory to copy dead-lettered files to
+                               (default does not copy files)
+        :param max_entries: maximum number of files tracked
+
+        :returns: `msc_pygeoapi.handler.retry.RetryQueue`
+        """
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.deadletter_dir = deadletter_dir
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def delay(self, attempts):
+        """
+        calculate backoff delay for a given number of failed attempts
+
+        :param attempts: number of failed attempts
+
+        :returns: `float` of delay in seconds
+        """
+
+        return min(self.backoff * 2 ** (attempts - 1), self.backoff_max)
+
+    def ready(self, filepath):
+        """
+        determine whether a file is due for (re)processing
+
+        :param filepath: path to file
+
+        :returns: `bool` of whether file can be processed now
+        """
+
+        with self.lock:
+            entry = self.entries.get(filepath)
+
+        if entry is None:
+            return True
+
+        return time.monotonic() >= entry['next_attempt']
+
+    def succeeded(self, filepath):
+        """
+        forget a file after successful processing
+
+        :param filepath: path to file
+
+        :returns: `None`
+        """
+
+        with self.lock:
+            self.entries.pop(filepath, None)
+
+    def failed(self, filepath, error):
+        """
+        record a failed attempt for a file
+
+        :param filepath: path to file
+        :param error: error raised when processing file
+
+        :returns: `bool` of whether file should be retried (`False` if
+                  file was dead-lettered)
+        """
+
+        with self.lock:
+            entry = self.entries.pop(filepath, {'attempts': 0})
+            entry['attempts'] += 1
+
+            if entry['attempts'] > self.max_retries:
+                retry = False
+            else:
+                retry = True
+                entry['next_attempt'] = (
+                    time.monotonic() + self.delay(entry['attempts'])
+                )
+                self.entries[filepath] = entry
+
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+        if retry:
+            LOGGER.warning(
+                f'Failed attempt {entry["attempts"]} for {filepath}; '
+                f'retrying in {self.delay(entry["attempts"])}s'
+            )
+        else:
+            LOGGER.error(
+                f'Giving up on {filepath} after {entry["attempts"]} attempts'
+            )
+            self.deadletter(filepath, error, entry['attempts'])
+
+        return retry
+
+    def deadletter(self, filepath, error, attempts):
+        """
+        copy a file and its error report to the dead-letter directory
+
+        :param filepath: path to file
+        :param error: error raised when processing file
+        :param attempts: number of failed attempts
+
+        :returns: `bool` of whether file was copied
+        """
+
+        if self.deadletter_dir is None:
+            return False
+
+        filename = os.path.basename(filepath)
+        report = {
+            'filepath': filepath,
+            'attempts': attempts,
+            'error': str(error),
+            'datetime': datetime.utcnow().isoformat()
+        }
+
+        try:
+            os.makedirs(self.deadletter_dir, exist_ok=True)
+            if os.path.exists(filepath):
+                shutil.copy2(filepath, self.deadletter_dir)
+            report_file = os.path.join(
+                self.deadletter_dir, f'{filename}.error.json'
+            )
+            with open(report_file, 'w') as fh:
+                json.dump(report, fh)
+        except OSError as err:
+            LOGGER.error(f'Unable to dead-letter {filepath}: {err}')
+            return False
+
+        LOGGER.info(f'Dead-lettered {filepath} to {self.deadletter_dir}')
+
+        return True
+
+    def __repr__(self):
+        return f'<RetryQueue> {len(self.entries)} files'
@@ -32,28 +32,14 @@
 #
 # =================================================================
 
-from importlib import import_module
 import logging
 
 import click
 
-from msc_pygeoapi.loader.discovery_metadata import discovery_metadata
+from msc_pygeoapi.util import LazyGroup
 
 LOGGER = logging.getLogger(__name__)
 
-
-@click.group()
-def data():
-    """Data publishing"""
-    pass
-
-
-@click.group()
-def metadata():
-    """Metadata publishing"""
-    pass
-
-
 commands = (
     ('msc_pygeoapi.loader.bulletins_realtime', 'bulletins_realtime'),
     ('msc_pygeoapi.loader.citypageweather_realtime', 'citypageweather'),
@@ -85,16 +71,23 @@ commands = (
     ('msc_pygeoapi.loader.alerts_realtime_dev', 'alerts_realtime_dev')
 )
 
-for module, name in commands:
-    try:
-        mod = import_module(module)
-        data.add_command(getattr(mod, name))
-    except ImportError as err:
-        command_name = name.replace('_', '-')
-        LOGGER.info(f'msc-pygeoapi data {command_name} command unavailable')
-        module_name = f'{module}.{name}'
-        msg = f'Import error when loading {module_name}: {err}'
-        LOGGER.debug(msg)
+
+lazy_commands = {
+    name.replace('_', '-'): (module, name) for module, name in commands
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=lazy_commands)
+def data():
+    """Data publishing"""
+    pass
 
 
-metadata.add_command(discovery_metadata)
+@click.group(cls=LazyGroup, lazy_commands={
+    'discovery-metadata': (
+        'msc_pygeoapi.loader.discovery_metadata', 'discovery_metadata'
+    )
+})
+def metadata():
+    """Metadata publishing"""
+    pass
@@ -547,6 +547,7 @@ CTL_HELP = '''
 @cli_options.OPTION_ES_PASSWORD()
 @cli_options.OPTION_ES_IGNORE_CERTS()
 @cli_options.OPTION_BATCH_SIZE()
+@cli_options.OPTION_THREAD_COUNT()
 @cli_options.OPTION_DATASET(
     type=click.Choice(
         ['all', 'stations', 'trends', 'annual', 'seasonal', 'monthly']
@@ -561,6 +562,7 @@ def add(
     ignore_certs,
     dataset,
     batch_size,
+    thread_count,
 ):
     """Loads AHCCD data from JSON into Elasticsearch"""
 
@@ -593,7 +595,10 @@ def add(
             click.echo(f'Populating {dtp} index')
             loader.create_index(dtp)
             dtp_data = loader.generate_docs(ctl_dict[dtp], dtp)
-            loader.conn.submit_elastic_package(dtp_data, batch_size)
+            with loader.conn.bulk_load(f'ahccd_{dtp}'):
+                loader.conn.submit_elastic_package(
+                    dtp_data, batch_size, thread_count=thread_count
+                )
         except Exception as err:
             msg = f'Could not populate {dtp} index: {err}'
             raise click.ClickException(msg)
@@ -270,6 +270,15 @@ class AlertsRealtimeLoader(BaseLoader):
         BaseLoader.__init__(self)
 
         self.conn = ElasticsearchConnector(conn_config)
+        self.reset()
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
         self.filepath = None
         self.date_ = None
         self.index_date = None
@@ -48,6 +48,7 @@ from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import (
     configure_es_connection,
     check_es_indexes_to_delete,
+    latest_state_action
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -58,6 +59,9 @@ DAYS_TO_KEEP = 3
 # index settings
 INDEX_BASENAME = 'aqhi-{}-realtime.'
 
+# latest observation of each location, read by `latest=true` queries
+LATEST_INDEX_NAME = 'latest-aqhi-observations'
+
 MAPPINGS = {
     'forecasts': {
         'properties': {
@@ -171,11 +175,7 @@ class AQHIRealtimeLoader(BaseLoader):
         BaseLoader.__init__(self)
 
         self.conn = ElasticsearchConnector(conn_config)
-        self.filepath = None
-        self.type = None
-        self.region = None
-        self.date_ = None
-        self.items = []
+        self.reset()
 
         # only create index templates with forecasts and observations mappings
         template_mappings = {
@@ -189,6 +189,24 @@ class AQHIRealtimeLoader(BaseLoader):
             SETTINGS['mappings'] = MAPPINGS[aqhi_type]
             self.conn.create_template(template_name, SETTINGS)
 
+        self.conn.create(LATEST_INDEX_NAME, {
+            'settings': SETTINGS['settings'],
+            'mappings': MAPPINGS['observations']
+        })
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
+        self.filepath = None
+        self.type = None
+        self.region = None
+        self.date_ = None
+        self.items = []
+
     def parse_filename(self):
         """
         Parses a aqhi filename in order to get the date, forecast issued
@@ -239,7 +257,8 @@ class AQHIRealtimeLoader(BaseLoader):
                 self.date_.strftime('%Y-%m-%d'),
             )
             if self.type == 'observations':
-                feature['properties']['latest'] = True
+                # current state is held by the latest-state index
+                feature['properties']['latest'] = False
 
             self.items.append(feature)
 
@@ -253,45 +272,17 @@ class AQHIRealtimeLoader(BaseLoader):
 
             yield action
 
-    def update_latest_status(self):
-        """
-        update old observation AQHI status to False
-
-        :return `bool` of update status
-        """
-
-        lt_date = self.date_.strftime('%Y-%m-%dT%H:%M:%SZ')
-
-        query = {"script": {
-            "source": "ctx._source.properties.latest=false",
-            "lang": "painless"
-            },
-            "query": {
-                    "bool": {
-                        "must": [{
-                            "match": {
-                                "properties.location_id": self.region
-                            }
-                        }, {
-                            "range": {
-                                "properties.observation_datetime": {
-                                    "lt": lt_date,
-                                }
-                            }
-                        }]
-                    }
-                }
-            }
-
-        # create list of today and yesterday index
-        index_ = '{}*'.format(INDEX_BASENAME.format(self.type))
-
-        try:
-            self.conn.update_by_query(query, index_)
-        except Exception as err:
-            LOGGER.warning(f'Failed to update ES index: {err}')
-
-        return True
+            if self.type == 'observations':
+                latest = dict(feature)
+                latest['properties'] = dict(
+                    feature['properties'], latest=True
+                )
+                yield latest_state_action(
+                    LATEST_INDEX_NAME,
+                    feature['properties']['location_id'],
+                    latest,
+                    'observation_datetime'
+                )
 
     def load_data(self, filepath):
         """
@@ -310,10 +301,6 @@ class AQHIRealtimeLoader(BaseLoader):
         package = self.generate_geojson_features()
         self.conn.submit_elastic_package(package, request_size=80000)
 
-        if self.type == 'observations':
-            LOGGER.debug('Updating Observation status')
-            self.update_latest_status()
-
         return True
 
 
@@ -390,6 +377,17 @@ def clean_indexes(ctx, days, dataset, es, username, password, ignore_certs):
             click.echo(f'Deleting indexes {indexes_to_delete}')
             conn.delete(','.join(indexes_to_delete))
 
+    if dataset in ('all', 'observations'):
+        click.echo(f'Deleting observations older than {days} days from '
+                   f'{LATEST_INDEX_NAME}')
+        conn.Elasticsearch.delete_by_query(
+            index=LATEST_INDEX_NAME,
+            query={'range': {
+                'properties.observation_datetime': {'lt': f'now-{days}d'}
+            }},
+            ignore_unavailable=True
+        )
+
     click.echo('Done')
 
 
@@ -412,7 +410,11 @@ def delete_indexes(ctx, dataset, es, username, password, ignore_certs,
     conn = ElasticsearchConnector(conn_config)
 
     if dataset == 'all':
-        indexes = 'aqhi-*'
+        indexes = f'aqhi-*,{LATEST_INDEX_NAME}'
+    elif dataset == 'observations':
+        indexes = '{}*,{}'.format(
+            INDEX_BASENAME.format(dataset), LATEST_INDEX_NAME
+        )
     else:
         indexes = '{}*'.format(INDEX_BASENAME.format(dataset))
 
@@ -34,6 +34,18 @@ LOGGER = logging.getLogger(__name__)
 
 class BaseLoader(object):
     def __init__(self):
+        # keyword arguments of `submit_elastic_package(s)`, so that files
+        # submitted in batches are sent with the loader's own settings
+        self.submit_options = {}
+
+    def reset(self):
+        """
+        resets per-file state so that a pooled loader instance can be
+        reused for the next file
+
+        :returns: `None`
+        """
+
         pass
 
     def load_data(self, filepath):
@@ -47,6 +59,20 @@ class BaseLoader(object):
 
         raise NotImplementedError()
 
+    def generate_actions(self, filepath):
+        """
+        generates Elasticsearch bulk API actions for a file without
+        submitting them, so that actions of several files can be sent
+        together (with the loader's `submit_options`)
+
+        :param filepath: filepath to data on disk
+
+        :returns: `list` of bulk API actions, or `None` if the loader
+                  does not support batching
+        """
+
+        return None
+
 
 class LoaderError(Exception):
     """setup error"""
@@ -130,11 +130,20 @@ class BulletinsRealtimeLoader(BaseLoader):
 
         BaseLoader.__init__(self)
 
-        today_date = datetime.today().strftime('%Y%m%d')
-        self.DD_URL = f'https://dd.weather.gc.ca/{today_date}/WXO-DD/bulletins/alphanumeric' # noqa
+        self.reset()
         self.conn = ElasticsearchConnector(conn_config)
         self.conn.create_template(INDEX_BASENAME, SETTINGS)
 
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
+        today_date = datetime.today().strftime('%Y%m%d')
+        self.DD_URL = f'https://dd.weather.gc.ca/{today_date}/WXO-DD/bulletins/alphanumeric' # noqa
+
     def load_data(self, filepath):
         """
         loads data from event to target
@@ -147,11 +156,7 @@ class BulletinsRealtimeLoader(BaseLoader):
         LOGGER.debug(filepath)
 
         data = self.bulletin2dict(filepath)
-
-        b_dt = datetime.strptime(data['properties']['datetime'],
-                                 '%Y-%m-%dT%H:%M')
-        b_dt2 = b_dt.strftime('%Y-%m-%d')
-        es_index = f'{INDEX_BASENAME}{b_dt2}'
+        es_index = self.get_index_name(data)
 
         try:
             r = self.conn.Elasticsearch.index(
@@ -163,6 +168,38 @@ class BulletinsRealtimeLoader(BaseLoader):
             LOGGER.warning(f'Error indexing: {err}')
             return False
 
+    def generate_actions(self, filepath):
+        """
+        generates Elasticsearch bulk API actions for a file
+
+        :param filepath: filepath to data on disk
+
+        :returns: `list` of bulk API actions
+        """
+
+        data = self.bulletin2dict(filepath)
+
+        return [{
+            '_id': data['id'],
+            '_index': self.get_index_name(data),
+            '_op_type': 'index',
+            '_source': data
+        }]
+
+    def get_index_name(self, data):
+        """
+        get the daily index name of a bulletin
+
+        :param data: `dict` of bulletin GeoJSON
+
+        :returns: `str` of index name
+        """
+
+        b_dt = datetime.strptime(data['properties']['datetime'],
+                                 '%Y-%m-%dT%H:%M')
+
+        return f"{INDEX_BASENAME}{b_dt.strftime('%Y-%m-%d')}"
+
     def bulletin2dict(self, filepath):
         """
         convert a bulletin into a GeoJSON object
@@ -37,7 +37,10 @@ import os
 import re
 
 from msc_pygeoapi import cli_options
-from msc_pygeoapi.connector.elasticsearch_ import ElasticsearchConnector
+from msc_pygeoapi.connector.elasticsearch_ import (
+    ElasticsearchConnector,
+    TimePartitionedIndex
+)
 from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import (
     configure_es_connection,
@@ -53,9 +56,12 @@ DAYS_TO_KEEP = 30
 # Alerts by increasing severity
 ALERTS_LEVELS = ['advisory', 'statement', 'watch', 'warning']
 
-# Index settings
+# Index settings: daily indexes (cap_alerts.YYYY-MM-DD) by expiry date,
+# read through the cap_alerts alias
 INDEX_NAME = 'cap_alerts'
 
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
 SETTINGS = {
     'settings': {
         'number_of_shards': 1,
@@ -184,7 +190,17 @@ class CapAlertsRealtimeLoader(BaseLoader):
         BaseLoader.__init__(self)
 
         self.conn = ElasticsearchConnector(conn_config)
-        self.conn.create(INDEX_NAME, mapping=SETTINGS)
+        self.index = get_index(self.conn)
+        self.index.setup()
+        self.reset()
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
         self.references_arr = []
 
     def load_data(self, filepath):
@@ -200,19 +216,25 @@ class CapAlertsRealtimeLoader(BaseLoader):
 
         try:
             self.bulk_data = []
+            targets = {}
             for doc in data:
+                expires = datetime.strptime(
+                    doc['properties']['expires'], DATETIME_FORMAT
+                )
                 op_dict = {
                     'index': {
-                        '_index': INDEX_NAME,
+                        '_index': self.index.partition(expires),
                         '_type': '_doc'
                     }
                 }
                 op_dict['index']['_id'] = doc['properties']['identifier']
+                targets[op_dict['index']['_id']] = op_dict['index']['_index']
                 self.bulk_data.append(op_dict)
                 self.bulk_data.append(doc)
-            r = self.conn.Elasticsearch.bulk(
-                index=INDEX_NAME, body=self.bulk_data
-            )
+
+            # a reissued alert changing its expiry moves to another partition
+            self.index.delete_stale(targets)
+            r = self.conn.Elasticsearch.bulk(body=self.bulk_data)
 
             LOGGER.debug(f'Result: {r}')
 
@@ -443,6 +465,20 @@ class CapAlertsRealtimeLoader(BaseLoader):
         return data
 
 
+def get_index(conn):
+    """
+    helper function to get the time-partitioned cap alerts index
+
+    :param conn: `msc_pygeoapi.connector.elasticsearch_.ElasticsearchConnector`
+
+    :returns: `msc_pygeoapi.connector.elasticsearch_.TimePartitionedIndex`
+    """
+
+    return TimePartitionedIndex(
+        conn, INDEX_NAME, SETTINGS['mappings'], SETTINGS['settings']
+    )
+
+
 @click.group()
 def cap_alerts():
     """Manages cap alerts index"""
@@ -501,21 +537,11 @@ def clean_records(ctx, days, es, username, password, ignore_certs):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    older_than = (datetime.now() - timedelta(days=days)).strftime(
-        '%Y-%m-%dT%H:%M:%SZ')
+    older_than = datetime.utcnow() - timedelta(days=days)
     click.echo(f'Deleting documents older than {older_than} ({days} days)')
 
-    query = {
-        'query': {
-            'range': {
-                'properties.expires': {
-                    'lte': older_than
-                }
-            }
-        }
-    }
-
-    conn.Elasticsearch.delete_by_query(index=INDEX_NAME, body=query)
+    deleted = get_index(conn).clean(older_than)
+    click.echo(f'Deleted indexes {deleted}')
 
 
 @click.command()
@@ -533,7 +559,8 @@ def delete_index(ctx, es, username, password, ignore_certs):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    conn.delete(INDEX_NAME)
+    deleted = get_index(conn).delete()
+    click.echo(f'Deleted indexes {deleted}')
 
 
 cap_alerts.add_command(add)
@@ -1653,12 +1653,21 @@ class CitypageweatherRealtimeLoader(BaseLoader):
             '{datetime}_MSC_CitypageWeather_{sitecode}_{lang}.xml'  # noqa
         )
         self.conn.create(INDEX_NAME, mapping=SETTINGS)
+        self.wxo_lookup = None
+        self.reset()
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
         self.xml_root = None
         self.lang = None
         self.filepath_en = None
         self.filepath_fr = None
         self.parsed_filename = None
-        self.wxo_lookup = None
         self.sitecode = None
         self.citycode = None
         self.cpw_feature = {
@@ -1668,13 +1677,13 @@ class CitypageweatherRealtimeLoader(BaseLoader):
             }
         }
 
-    def load_data(self, filepath: str) -> bool:
+    def generate_actions(self, filepath: str) -> list:
         """
-        fonction from base to load the data in ES
+        generates Elasticsearch bulk API actions for a CPW file
 
         :param filepath: filepath for parsing the CPW file
 
-        :returns: True/False
+        :returns: `list` of bulk API actions
         """
 
         LOGGER.debug(f'Received {filepath} for loading...')
@@ -1715,7 +1724,7 @@ class CitypageweatherRealtimeLoader(BaseLoader):
                 f'No associated {alt_lang} Citypage XML files found for '
                 f'{current_filepath}. Skipping file...'
             )
-            return False
+            return []
 
         LOGGER.debug(
             f'Processing XML: {self.filepath_en} and {self.filepath_fr}'
@@ -1734,7 +1743,7 @@ class CitypageweatherRealtimeLoader(BaseLoader):
             }
         except Exception as err:
             LOGGER.error(f'ERROR: cannot process data: {err}')
-            return False
+            return []
 
         xml_creation_dates = [
             datetime.strptime(
@@ -1754,7 +1763,7 @@ class CitypageweatherRealtimeLoader(BaseLoader):
                 f'{MAX_XML_DATETIME_DIFF_SECONDS} seconds. '
                 'Skipping loading...'
             )
-            return False
+            return []
         else:
             LOGGER.debug(
                 f'File creation times differ by {xml_creation_diff_seconds} '
@@ -1769,27 +1778,51 @@ class CitypageweatherRealtimeLoader(BaseLoader):
                 f'ERROR: cannot find sitecode {self.sitecode} key in WxO '
                 'lookup table.'
             )
-            return False
+            return []
 
         data = self.xml2json_cpw()
 
-        if data:
-            try:
-                r = self.conn.Elasticsearch.update(
-                    index=INDEX_NAME,
-                    id=data['properties']['identifier'],
-                    doc_as_upsert=True,
-                    doc=data
-                )
-                LOGGER.debug(f'Result: {r}')
-                return True
-            except Exception as err:
-                LOGGER.warning(f'Error indexing: {err}')
-                return False
-        else:
+        if not data:
             LOGGER.warning(
                 'No data found in XML files. Skipping indexing...'
             )
+            return []
+
+        return [{
+            '_id': data['properties']['identifier'],
+            '_index': INDEX_NAME,
+            '_op_type': 'update',
+            'doc': data,
+            'doc_as_upsert': True
+        }]
+
+    def load_data(self, filepath: str) -> bool:
+        """
+        fonction from base to load the data in ES
+
+        :param filepath: filepath for parsing the CPW file
+
+        :returns: True/False
+        """
+
+        actions = self.generate_actions(filepath)
+
+        if not actions:
+            return False
+
+        data = actions[0]['doc']
+
+        try:
+            r = self.conn.Elasticsearch.update(
+                index=INDEX_NAME,
+                id=data['properties']['identifier'],
+                doc_as_upsert=True,
+                doc=data
+            )
+            LOGGER.debug(f'Result: {r}')
+            return True
+        except Exception as err:
+            LOGGER.warning(f'Error indexing: {err}')
             return False
 
     def _sort_by_datetime_diff(self, file):
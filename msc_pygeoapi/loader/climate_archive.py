@@ -32,6 +32,7 @@
 # =================================================================
 
 import collections
+from contextlib import nullcontext
 from datetime import datetime
 import logging
 
@@ -39,7 +40,9 @@ import click
 import cx_Oracle
 
 from msc_pygeoapi import cli_options
-from msc_pygeoapi.connector.elasticsearch_ import ElasticsearchConnector
+from msc_pygeoapi.connector.elasticsearch_ import (
+    AsyncElasticsearchConnector
+)
 from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import configure_es_connection
 
@@ -60,7 +63,7 @@ class ClimateArchiveLoader(BaseLoader):
 
         super().__init__()
 
-        self.conn = ElasticsearchConnector(conn_config)
+        self.conn = AsyncElasticsearchConnector(conn_config)
 
         # setup DB connection
         try:
@@ -1137,6 +1140,7 @@ def climate_archive():
 @cli_options.OPTION_ES_PASSWORD()
 @cli_options.OPTION_ES_IGNORE_CERTS()
 @cli_options.OPTION_BATCH_SIZE()
+@cli_options.OPTION_THREAD_COUNT()
 @cli_options.OPTION_DATASET(
     type=click.Choice(
         ['all', 'stations', 'normals', 'monthly', 'daily', 'hourly']
@@ -1162,6 +1166,7 @@ def add(
     ignore_certs,
     dataset,
     batch_size,
+    thread_count,
     station=None,
     starting_from=None,
     date=None,
@@ -1189,128 +1194,153 @@ def add(
 
     click.echo(f'Processing dataset(s): {datasets_to_process}')
 
-    if 'stations' in datasets_to_process:
-        try:
-            click.echo('Populating stations index')
-            index_name = loader.create_index('stations')
-            stations = loader.generate_stations(index_name)
-            loader.conn.submit_elastic_package(stations, batch_size)
-        except Exception as err:
-            msg = f'Could not populate stations index: {err}'
-            raise click.ClickException(msg)
-
-    if 'normals' in datasets_to_process:
-        try:
-            click.echo('Populating normals index')
-            stn_dict = loader.get_station_data(station, starting_from)
-            normals_dict = loader.get_normals_data()
-            periods_dict = loader.get_normals_periods()
+    try:
+        if 'stations' in datasets_to_process:
+            try:
+                click.echo('Populating stations index')
+                index_name = loader.create_index('stations')
+                stations = loader.generate_stations(index_name)
+                with loader.conn.bulk_load(index_name):
+                    loader.conn.submit_elastic_package(
+                        stations, batch_size, thread_count=thread_count
+                    )
+            except Exception as err:
+                msg = f'Could not populate stations index: {err}'
+                raise click.ClickException(msg)
 
-            index_name = loader.create_index('normals')
+        if 'normals' in datasets_to_process:
+            try:
+                click.echo('Populating normals index')
+                stn_dict = loader.get_station_data(station, starting_from)
+                normals_dict = loader.get_normals_data()
+                periods_dict = loader.get_normals_periods()
 
-            normals = loader.generate_normals(
-                stn_dict, normals_dict, periods_dict, index_name
-            )
-            indexing_succesful = loader.conn.submit_elastic_package(
-                normals, batch_size
-            )
+                index_name = loader.create_index('normals')
 
-            if indexing_succesful and full_reindex:
-                loader.conn.create_alias(
-                    'climate_normals_data', index_name, overwrite=True
+                normals = loader.generate_normals(
+                    stn_dict, normals_dict, periods_dict, index_name
                 )
-        except Exception as err:
-            msg = f'Could not populate normals index: {err}'
-            raise click.ClickException(msg)
-
-    if 'monthly' in datasets_to_process:
-        try:
-            click.echo('Populating monthly index')
-            stn_dict = loader.get_station_data(station, starting_from)
+                with loader.conn.bulk_load(index_name):
+                    indexing_succesful = loader.conn.submit_elastic_package(
+                        normals, batch_size, thread_count=thread_count
+                    )
 
-            if full_reindex:
-                index_name = loader.create_index('monthly_summary')
-            else:
-                index_name = loader.conn.get_alias_indices('climate_public_climate_summary')[0]  # noqa
-                if index_name is None:
-                    raise click.ClickException(
-                        'No associated index found for alias climate_public_climate_summary.'  # noqa
+                if indexing_succesful and full_reindex:
+                    loader.conn.create_alias(
+                        'climate_normals_data', index_name, overwrite=True
                     )
+            except Exception as err:
+                msg = f'Could not populate normals index: {err}'
+                raise click.ClickException(msg)
 
-            monthlies = loader.generate_monthly_data(
-                stn_dict, index_name, date
-            )
-            indexing_succesful = loader.conn.submit_elastic_package(
-                monthlies, batch_size
-            )
+        if 'monthly' in datasets_to_process:
+            try:
+                click.echo('Populating monthly index')
+                stn_dict = loader.get_station_data(station, starting_from)
 
-            if indexing_succesful and full_reindex:
-                loader.conn.create_alias(
-                    'climate_public_climate_summary',
-                    index_name,
-                    overwrite=True
-                )
-        except Exception as err:
-            msg = f'Could not populate montly index: {err}'
-            raise click.ClickException(msg)
+                if full_reindex:
+                    index_name = loader.create_index('monthly_summary')
+                    bulk_load = loader.conn.bulk_load(index_name)
+                else:
+                    # incremental update of the live index
+                    bulk_load = nullcontext()
+                    index_name = loader.conn.get_alias_indices('climate_public_climate_summary')[0]  # noqa
+                    if index_name is None:
+                        raise click.ClickException(
+                            'No associated index found for alias climate_public_climate_summary.'  # noqa
+                        )
 
-    if 'daily' in datasets_to_process:
-        try:
-            click.echo('Populating daily index')
-            stn_dict = loader.get_station_data(station, starting_from)
+                monthlies = loader.generate_monthly_data(
+                    stn_dict, index_name, date
+                )
+                with bulk_load:
+                    indexing_succesful = loader.conn.submit_elastic_package(
+                        monthlies, batch_size, thread_count=thread_count
+                    )
 
-            if full_reindex:
-                index_name = loader.create_index('daily_summary')
-            else:
-                index_name = loader.conn.get_alias_indices('climate_public_daily_data')[0]  # noqa
-                if index_name is None:
-                    raise click.ClickException(
-                        'No index found for alias climate_public_daily_data.'
+                if indexing_succesful and full_reindex:
+                    loader.conn.create_alias(
+                        'climate_public_climate_summary',
+                        index_name,
+                        overwrite=True
                     )
+            except Exception as err:
+                msg = f'Could not populate montly index: {err}'
+                raise click.ClickException(msg)
 
-            dailies = loader.generate_daily_data(stn_dict, index_name, date)
-            indexing_succesful = loader.conn.submit_elastic_package(
-                dailies, batch_size
-            )
+        if 'daily' in datasets_to_process:
+            try:
+                click.echo('Populating daily index')
+                stn_dict = loader.get_station_data(station, starting_from)
 
-            if indexing_succesful and full_reindex:
-                loader.conn.create_alias(
-                    'climate_public_daily_data', index_name, overwrite=True
+                if full_reindex:
+                    index_name = loader.create_index('daily_summary')
+                    bulk_load = loader.conn.bulk_load(index_name)
+                else:
+                    # incremental update of the live index
+                    bulk_load = nullcontext()
+                    index_name = loader.conn.get_alias_indices('climate_public_daily_data')[0]  # noqa
+                    if index_name is None:
+                        raise click.ClickException(
+                            'No index found for alias '
+                            'climate_public_daily_data.'
+                        )
+
+                dailies = loader.generate_daily_data(
+                    stn_dict, index_name, date
                 )
+                with bulk_load:
+                    indexing_succesful = loader.conn.submit_elastic_package(
+                        dailies, batch_size, thread_count=thread_count
+                    )
 
-        except Exception as err:
-            msg = f'Could not populate daily index: {err}'
-            raise click.ClickException(msg)
+                if indexing_succesful and full_reindex:
+                    loader.conn.create_alias(
+                        'climate_public_daily_data', index_name, overwrite=True
+                    )
 
-    if 'hourly' in datasets_to_process:
-        try:
-            click.echo('Populating hourly index')
-            stn_dict = loader.get_station_data(station, starting_from)
+            except Exception as err:
+                msg = f'Could not populate daily index: {err}'
+                raise click.ClickException(msg)
 
-            if full_reindex:
-                index_name = loader.create_index('hourly_summary')
-            else:
-                index_name = loader.conn.get_alias_indices('climate_public_hourly_data')[0]  # noqa
-                if index_name is None:
-                    raise click.ClickException(
-                        'No index found for alias climate_public_hourly_data.'
-                    )
+        if 'hourly' in datasets_to_process:
+            try:
+                click.echo('Populating hourly index')
+                stn_dict = loader.get_station_data(station, starting_from)
 
-            hourlies = loader.generate_hourly_data(stn_dict, index_name, date)
-            indexing_succesful = loader.conn.submit_elastic_package(
-                hourlies, batch_size
-            )
+                if full_reindex:
+                    index_name = loader.create_index('hourly_summary')
+                    bulk_load = loader.conn.bulk_load(index_name)
+                else:
+                    # incremental update of the live index
+                    bulk_load = nullcontext()
+                    index_name = loader.conn.get_alias_indices('climate_public_hourly_data')[0]  # noqa
+                    if index_name is None:
+                        raise click.ClickException(
+                            'No index found for alias '
+                            'climate_public_hourly_data.'
+                        )
 
-            if indexing_succesful and full_reindex:
-                loader.conn.create_alias(
-                    'climate_public_hourly_data', index_name, overwrite=True
+                hourlies = loader.generate_hourly_data(
+                    stn_dict, index_name, date
                 )
+                with bulk_load:
+                    indexing_succesful = loader.conn.submit_elastic_package(
+                        hourlies, batch_size, thread_count=thread_count
+                    )
 
-        except Exception as err:
-            msg = f'Could not populate hourly index: {err}'
-            raise click.ClickException(msg)
+                if indexing_succesful and full_reindex:
+                    loader.conn.create_alias(
+                        'climate_public_hourly_data', index_name,
+                        overwrite=True
+                    )
 
-    loader.db_conn.close()
+            except Exception as err:
+                msg = f'Could not populate hourly index: {err}'
+                raise click.ClickException(msg)
+    finally:
+        loader.db_conn.close()
+        loader.conn.close()
 
 
 climate_archive.add_command(add)
@@ -38,13 +38,17 @@ import re
 import click
 
 from msc_pygeoapi import cli_options
-from msc_pygeoapi.connector.elasticsearch_ import ElasticsearchConnector
+from msc_pygeoapi.connector.elasticsearch_ import (
+    ElasticsearchConnector,
+    TimePartitionedIndex
+)
 from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import configure_es_connection
 
 LOGGER = logging.getLogger(__name__)
 
-# index settings
+# index settings: hourly indexes (<INDEX_NAME>.YYYY-MM-DDtHH) by
+# expiration datetime, read through the <INDEX_NAME> alias
 INDEX_NAME = 'coastal_flood_risk_index'
 
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
@@ -88,10 +92,8 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
         self.datetime = None
         self.conn = ElasticsearchConnector(conn_config)
 
-        SETTINGS['mappings'] = MAPPINGS
-        if not self.conn.exists(INDEX_NAME):
-            LOGGER.debug(f'Creating index {INDEX_NAME}')
-            self.conn.create(INDEX_NAME, SETTINGS)
+        self.index = get_index(self.conn)
+        self.index.setup()
 
     def generate_geojson_features(self):
         """
@@ -150,10 +152,24 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
             is_newer = self.check_if_newer(file_id, amendment)
 
             if is_newer['update']:
+                targets = {}
+                for outlook in features:
+                    expiration = datetime.strptime(
+                        outlook['properties']['expiration_datetime'],
+                        DATETIME_FORMAT
+                    )
+                    targets[outlook['properties']['id']] = \
+                        self.index.partition(expiration)
+
+                # an amendment changing the expiration of an outlook moves
+                # it to another partition
+                self.index.delete_stale(targets)
+
                 for outlook in features:
+                    id_ = outlook['properties']['id']
                     action = {
-                        '_id': outlook['properties']['id'],
-                        '_index': INDEX_NAME,
+                        '_id': id_,
+                        '_index': targets[id_],
                         '_op_type': 'update',
                         'doc': outlook,
                         'doc_as_upsert': True
@@ -161,9 +177,10 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
 
                     yield action
 
-                for id_ in is_newer['id_list']:
-                    self.conn.Elasticsearch.delete(index=INDEX_NAME,
-                                                   id=id_)
+                # outlooks of the amendment replace their previous copies
+                for index, id_ in is_newer['id_list']:
+                    if id_ not in targets:
+                        self.conn.Elasticsearch.delete(index=index, id=id_)
         else:
             LOGGER.warning(f'empty flood risk index json in {filename}')
 
@@ -177,8 +194,9 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
                         }
                     }
                 }
-                self.conn.Elasticsearch.delete_by_query(index=INDEX_NAME,
-                                                        body=query)
+                self.conn.Elasticsearch.delete_by_query(
+                    index=self.index.pattern, body=query
+                )
 
     def flatten_json(self, key, values, parent_key=''):
         """
@@ -202,7 +220,7 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
         """
         check if the coastal flood risk index is the newest version
 
-        :returns: `bool` if latest, id_list for ids to delete
+        :returns: `bool` if latest, id_list for (index, id) to delete
         """
 
         upt_ = True
@@ -218,7 +236,7 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
 
         # Fetch the document
         try:
-            result = self.conn.Elasticsearch.search(index=INDEX_NAME,
+            result = self.conn.Elasticsearch.search(index=self.index.pattern,
                                                     body=query)
             if result:
                 hit = result['hits']['hits'][0]
@@ -227,7 +245,7 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
                     upt_ = False
                 else:
                     for id_ in result['hits']['hits']:
-                        id_list.append(id_['_id'])
+                        id_list.append((id_['_index'], id_['_id']))
         except Exception:
             LOGGER.warning(f'Item ({file_id}) does not exist in index')
 
@@ -255,6 +273,20 @@ class CoastalFloodRiskIndexLoader(BaseLoader):
             return False
 
 
+def get_index(conn):
+    """
+    helper function to get the time-partitioned coastal flood risk index
+
+    :param conn: `msc_pygeoapi.connector.elasticsearch_.ElasticsearchConnector`
+
+    :returns: `msc_pygeoapi.connector.elasticsearch_.TimePartitionedIndex`
+    """
+
+    return TimePartitionedIndex(
+        conn, INDEX_NAME, MAPPINGS, SETTINGS['settings'], interval='hour'
+    )
+
+
 @click.group()
 def coastal_flood_risk_index():
     """Manages coastal flood risk index outlook index"""
@@ -310,20 +342,10 @@ def clean_index(ctx, es, username, password, ignore_certs):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    click.echo('Deleting documents older than datetime.now()')
-    now = datetime.now().strftime(DATETIME_FORMAT)
-
-    query = {
-        'query': {
-            'range': {
-                'properties.expiration_datetime': {
-                    'lte': now
-                }
-            }
-        }
-    }
+    click.echo('Deleting documents older than datetime.utcnow()')
 
-    conn.Elasticsearch.delete_by_query(index=INDEX_NAME, body=query)
+    deleted = get_index(conn).clean(datetime.utcnow())
+    click.echo(f'Deleted indexes {deleted}')
 
 
 @click.command()
@@ -342,12 +364,12 @@ def delete_index(ctx, es, username, password, ignore_certs, index_template):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    click.echo(f'Deleting indexes {INDEX_NAME}')
-    conn.delete(INDEX_NAME)
+    deleted = get_index(conn).delete()
+    click.echo(f'Deleted indexes {deleted}')
 
     if index_template:
-        click.echo(f'Deleting index template {INDEX_NAME}')
-        conn.delete_template(INDEX_NAME)
+        click.echo(f'Deleting index template {INDEX_NAME}.')
+        conn.delete_template(f'{INDEX_NAME}.')
 
     click.echo('Done')
 
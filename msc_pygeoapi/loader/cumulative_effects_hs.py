@@ -93,6 +93,8 @@ class CumulativeEffectsHSLoader(BaseLoader):
 
         BaseLoader.__init__(self)
 
+        self.submit_options = {'request_size': 80000}
+
         self.filepath = None
         self.datetime = None
         self.conn = ElasticsearchConnector(conn_config)
@@ -151,13 +153,28 @@ class CumulativeEffectsHSLoader(BaseLoader):
         # generate geojson features
         package = self.generate_geojson_features()
         try:
-            r = self.conn.submit_elastic_package(package, request_size=80000)
+            r = self.conn.submit_elastic_package(
+                package, **self.submit_options
+            )
             LOGGER.debug(f'Result: {r}')
             return True
         except Exception as err:
             LOGGER.warning(f'Error indexing: {err}')
             return False
 
+    def generate_actions(self, filepath):
+        """
+        generates Elasticsearch bulk API actions for a file
+
+        :param filepath: filepath to data on disk
+
+        :returns: `list` of bulk API actions
+        """
+
+        self.filepath = Path(filepath)
+
+        return list(self.generate_geojson_features())
+
 
 @click.group()
 def cumulative_effects_hs():
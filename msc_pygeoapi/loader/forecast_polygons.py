@@ -256,15 +256,24 @@ class ForecastPolygonsLoader(BaseLoader):
         BaseLoader.__init__(self)
 
         self.conn = ElasticsearchConnector(conn_config)
-        self.filepath = None
-        self.version = None
-        self.zone = None
-        self.items = []
+        self.reset()
 
         # create forecast polygon indices if they don't exist
         for index in INDICES:
             self.conn.create(index, SETTINGS)
 
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
+        self.filepath = None
+        self.version = None
+        self.zone = None
+        self.items = []
+
     def parse_filename(self):
         """
         Parses a meteocode filename in order to get the version,
@@ -42,7 +42,8 @@ from msc_pygeoapi.env import GEOMET_LOCAL_BASEPATH
 from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import (
     configure_es_connection,
-    check_es_indexes_to_delete
+    check_es_indexes_to_delete,
+    latest_set_actions
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -57,6 +58,10 @@ TEMPLATE_MAPPINGS = ['cyclone', 'track', 'error_cone', 'wind_radii']
 # index settings
 INDEX_BASENAME = 'hurricanes-{}'
 
+# features of the latest publication of each storm, read by
+# `latest_publication=true` and `active=true` queries
+LATEST_INDEX_BASENAME = 'latest-hurricanes-{}'
+
 DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 MAPPINGS = {
@@ -116,12 +121,7 @@ class HurricanesRealtimeLoader(BaseLoader):
 
         BaseLoader.__init__(self)
 
-        self.filepath = None
-        self.datetime = None
-        self.es_index = None
-        self.storm_number = None
-        self.file_id = None
-        self.newer = None
+        self.reset()
         self.conn = ElasticsearchConnector(conn_config)
 
         for hurricane_type in TEMPLATE_MAPPINGS:
@@ -142,6 +142,24 @@ class HurricanesRealtimeLoader(BaseLoader):
                 index_setting,
                 overwrite=True
                 )
+            self.conn.create(
+                LATEST_INDEX_BASENAME.format(hurricane_type),
+                index_setting
+                )
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
+        self.filepath = None
+        self.datetime = None
+        self.es_index = None
+        self.storm_number = None
+        self.file_id = None
+        self.newer = None
 
     def generate_geojson_features(self):
         """
@@ -157,6 +175,7 @@ class HurricanesRealtimeLoader(BaseLoader):
             data = json.load(f)['features']
 
         filename = f.name.split('/')[-1]
+        latest = {type_: {} for type_ in TEMPLATE_MAPPINGS}
 
         if len(data) > 0:
             for feature in data:
@@ -181,8 +200,8 @@ class HurricanesRealtimeLoader(BaseLoader):
                 self.file_id = filename
                 feature['properties']['file_name'] = self.file_id
 
-                # set default status to inactive
-                # active status will be set later with an ES request
+                # set default status to inactive: current status is held
+                # by the latest-state indexes
                 feature['properties']['active'] = False
                 feature['properties']['latest_publication'] = False
 
@@ -199,18 +218,25 @@ class HurricanesRealtimeLoader(BaseLoader):
 
                 if is_newer['update']:
                     self.newer = True
-                    feature['properties']['latest_publication'] = True
+                    # if this file is newer, its features replace the
+                    # previous publication of this hurricane storm number
+                    # in the latest-state indexes
+                    self.storm_number = feature['properties']['storm_number']
 
                     now = datetime.utcnow()
-                    gte = (now - timedelta(hours=48)).strftime(DATETIME_FORMAT)
-                    if feature['properties']['validity_datetime'] >= gte:
-                        feature['properties']['active'] = True
-
-                    # if this file is newer
-                    # set all previous forecast publication latest
-                    # to False for this hurricane storm number
-                    # before adding the latest file with status latest = True
-                    self.storm_number = feature['properties']['storm_number']
+                    gte = (now - timedelta(hours=ACTIVE_HOURS)).strftime(
+                        DATETIME_FORMAT
+                    )
+                    validity = feature['properties']['validity_datetime']
+
+                    latest_feature = dict(feature)
+                    latest_feature['properties'] = dict(
+                        feature['properties'],
+                        latest_publication=True,
+                        active=validity >= gte
+                    )
+                    latest.setdefault(type_, {})[
+                        feature['properties']['id']] = latest_feature
 
                 action = {
                     '_id': feature['properties']['id'],
@@ -226,11 +252,20 @@ class HurricanesRealtimeLoader(BaseLoader):
                     self.conn.Elasticsearch.delete(index=self.es_index,
                                                    id=id_)
 
-                # update active hurricane status
-                # self.update_active_status(type_)
+            if self.newer:
+                query = {
+                    'match': {'properties.storm_number': self.storm_number}
+                }
+                for type_, docs in latest.items():
+                    yield from latest_set_actions(
+                        self.conn.Elasticsearch,
+                        LATEST_INDEX_BASENAME.format(type_),
+                        docs,
+                        query
+                    )
 
-            else:
-                LOGGER.warning(f'empty hurricane json in {filename}')
+        else:
+            LOGGER.warning(f'empty hurricane json in {filename}')
 
     def flatten_json(self, key, values, parent_key=''):
         """
@@ -285,49 +320,9 @@ class HurricanesRealtimeLoader(BaseLoader):
 
         return {'update': upt_, 'id_list': id_list}
 
-    def update_latest_status(self, storm_number, file_id):
-        """
-        update latest status for the latest hurricane publication
-
-        :return `bool` of update status
-        """
-
-        query = {'script': {
-                    'source': '''
-                        ctx._source.properties.latest_publication = false;
-                        ctx._source.properties.active = false;
-                    ''',
-                    'lang': 'painless'
-                },
-                'query': {
-                        'bool': {
-                            'must': [{
-                                'match': {
-                                    'properties.storm_number': storm_number
-                                }
-                            }],
-                            'must_not': [{
-                                'match': {
-                                    'properties.file_name': file_id
-                                    }
-                            }]
-                        }
-                    }
-                }
-
-        # create list of today and yesterday index
-        wildcard = '*'
-        index_ = f'{INDEX_BASENAME.format(wildcard)}.*'
-        try:
-            self.conn.update_by_query(query, index_)
-        except Exception as err:
-            LOGGER.warning(f'Failed to update ES index: {err}')
-
-        return True
-
     def update_active_status(self, in_hours):
         """
-        update active status for the latest hurricane
+        update active status of the latest hurricane publications
 
         :return `bool` of update status
         """
@@ -356,9 +351,7 @@ class HurricanesRealtimeLoader(BaseLoader):
                 }
             }
 
-        # create list of today and yesterday index
-        wildcard = '*'
-        index_ = f'{INDEX_BASENAME.format(wildcard)}.*'
+        index_ = LATEST_INDEX_BASENAME.format('*')
 
         try:
             self.conn.update_by_query(query, index_)
@@ -395,7 +388,7 @@ class HurricanesRealtimeLoader(BaseLoader):
                 'query': {'match_all': {}}
             }
 
-            features = []
+            features = {}
 
             try:
                 count_result = self.conn.Elasticsearch.count(
@@ -420,16 +413,27 @@ class HurricanesRealtimeLoader(BaseLoader):
                     )
                     hits = result.get('hits', {}).get('hits', [])
                     for hit in hits:
-                        features.append(hit['_source'])
+                        features[hit['_id']] = hit['_source']
                     offset += page_size
 
+                # current status of the latest publications
+                result = self.conn.Elasticsearch.search(
+                    index=LATEST_INDEX_BASENAME.format(hurricane_feature_type),
+                    body=query,
+                    size=page_size,
+                    ignore_unavailable=True
+                )
+                for hit in result['hits']['hits']:
+                    if hit['_id'] in features:
+                        features[hit['_id']] = hit['_source']
+
             except Exception as err:
                 LOGGER.warning(f'Failed to query ES for local copy: {err}')
                 return False
 
             feature_collection = {
                 'type': 'FeatureCollection',
-                'features': features
+                'features': list(features.values())
             }
 
             json_filename = f'all-hurricanes-{hurricane_feature_type}.json'
@@ -467,11 +471,6 @@ class HurricanesRealtimeLoader(BaseLoader):
             r = self.conn.submit_elastic_package(package)
             LOGGER.debug(f'Result: {r}')
 
-            if self.newer:
-                self.update_latest_status(self.storm_number, self.file_id)
-                msg = f'Update active and latest status: storm #{self.storm_number} - {self.file_id}' # noqa
-                LOGGER.debug(msg)
-
             self.generate_local_copy()
 
             return True
@@ -545,8 +544,10 @@ def clean_indexes(ctx, es, username, password, dataset, days, ignore_certs):
     if dataset == 'all':
         wildcard = '*'
         indexes_to_fetch = f'{INDEX_BASENAME.format(wildcard)}.*'
+        latest_index = LATEST_INDEX_BASENAME.format(wildcard)
     else:
         indexes_to_fetch = f'{INDEX_BASENAME.format(dataset)}.*'
+        latest_index = LATEST_INDEX_BASENAME.format(dataset)
 
     indexes = conn.get(indexes_to_fetch)
 
@@ -556,6 +557,16 @@ def clean_indexes(ctx, es, username, password, dataset, days, ignore_certs):
             click.echo(f'Deleting indexes {indexes_to_delete}')
             conn.delete(','.join(indexes_to_delete))
 
+        click.echo(f'Deleting publications older than {days} days from '
+                   f'{latest_index}')
+        conn.Elasticsearch.delete_by_query(
+            index=latest_index,
+            query={'range': {
+                'properties.publication_datetime': {'lt': f'now-{days}d'}
+            }},
+            ignore_unavailable=True
+        )
+
         loader = HurricanesRealtimeLoader(conn_config)
         loader.generate_local_copy()
 
@@ -605,9 +616,11 @@ def delete_indexes(ctx, dataset, es, username, password, ignore_certs,
 
     if dataset == 'all':
         wildcard = '*'
-        indexes = f'{INDEX_BASENAME.format(wildcard)}'
+        indexes = (f'{INDEX_BASENAME.format(wildcard)},'
+                   f'{LATEST_INDEX_BASENAME.format(wildcard)}')
     else:
-        indexes = f'{INDEX_BASENAME.format(dataset)}*'
+        indexes = (f'{INDEX_BASENAME.format(dataset)}*,'
+                   f'{LATEST_INDEX_BASENAME.format(dataset)}*')
 
     matching = list(conn.get(indexes))
     click.echo(f'Deleting indexes {matching}')
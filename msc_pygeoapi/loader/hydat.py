@@ -1190,6 +1190,7 @@ def hydat():
 @click.command()
 @click.pass_context
 @cli_options.OPTION_BATCH_SIZE()
+@cli_options.OPTION_THREAD_COUNT()
 @cli_options.OPTION_DB(help='Path to HYDAT SQLite database')
 @cli_options.OPTION_ELASTICSEARCH()
 @cli_options.OPTION_ES_USERNAME()
@@ -1215,6 +1216,7 @@ def add(
     ignore_certs,
     dataset,
     batch_size,
+    thread_count,
 ):
     """Loads HYDAT data into Elasticsearch"""
 
@@ -1257,7 +1259,10 @@ def add(
             loader.create_index('stations')
             stations = loader.generate_stations(
                 station_table, annual_peaks_table, annual_stats_table)
-            loader.conn.submit_elastic_package(stations, batch_size)
+            with loader.conn.bulk_load('hydrometric_stations'):
+                loader.conn.submit_elastic_package(
+                    stations, batch_size, thread_count=thread_count
+                )
         except Exception as err:
             msg = f'Could not populate stations index: {err}'
             raise click.ClickException(msg)
@@ -1268,7 +1273,12 @@ def add(
             loader.create_index('observations')
             means = loader.generate_means(discharge_var, level_var,
                                           station_table, symbol_table)
-            loader.conn.submit_elastic_package(means, batch_size)
+            with loader.conn.bulk_load(
+                'hydrometric_daily_mean,hydrometric_monthly_mean'
+            ):
+                loader.conn.submit_elastic_package(
+                    means, batch_size, thread_count=thread_count
+                )
         except Exception as err:
             msg = f'Could not populate observations indexes: {err}'
             raise click.ClickException(msg)
@@ -1280,7 +1290,10 @@ def add(
             stats = loader.generate_annual_stats(annual_stats_table,
                                                  data_types_table,
                                                  station_table, symbol_table)
-            loader.conn.submit_elastic_package(stats, batch_size)
+            with loader.conn.bulk_load('hydrometric_annual_statistics'):
+                loader.conn.submit_elastic_package(
+                    stats, batch_size, thread_count=thread_count
+                )
         except Exception as err:
             msg = f'Could not populate annual statistics index: {err}'
             raise click.ClickException(msg)
@@ -1292,7 +1305,10 @@ def add(
             peaks = loader.generate_annual_peaks(annual_peaks_table,
                                                  data_types_table,
                                                  symbol_table, station_table)
-            loader.conn.submit_elastic_package(peaks, batch_size)
+            with loader.conn.bulk_load('hydrometric_annual_peaks'):
+                loader.conn.submit_elastic_package(
+                    peaks, batch_size, thread_count=thread_count
+                )
         except Exception as err:
             msg = f'Could not populate annual peaks index: {err}'
             raise click.ClickException(msg)
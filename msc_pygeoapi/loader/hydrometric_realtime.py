@@ -175,30 +175,32 @@ class HydrometricRealtimeLoader(BaseLoader):
 
         BaseLoader.__init__(self)
 
+        self.submit_options = {'request_size': 80000}
+
         self.conn = ElasticsearchConnector(conn_config)
 
-        index_template = self.conn.get_template(INDEX_BASENAME)
-
-        # compare index template mappping with mapping defined in SETTINGS
-        if index_template:
-            # if mappings are different, update the index template
-            if (
-                index_template[INDEX_BASENAME]['mappings']
-                != SETTINGS['mappings']
-            ):
-                LOGGER.info(
-                    f'Updating "{INDEX_BASENAME}" index template with'
-                    ' mapping changes in provider.'
-                )
-                self.conn.create_template(
-                    INDEX_BASENAME, SETTINGS, overwrite=True
-                )
-        else:
-            self.conn.create_template(INDEX_BASENAME, SETTINGS)
+        # updates the index template if SETTINGS have changed
+        self.conn.create_template(INDEX_BASENAME, SETTINGS, overwrite=True)
 
         self.stations = {}
+        self.stations_mtime = None
         self.read_stations_list()
 
+    def reset(self):
+        """
+        resets per-file state, re-reading the stations list only if the
+        local copy has changed since it was last read
+
+        :returns: `None`
+        """
+
+        if not os.path.exists(STATIONS_CACHE):
+            return
+
+        if os.path.getmtime(STATIONS_CACHE) != self.stations_mtime:
+            LOGGER.debug('Stations list changed; reloading')
+            self.read_stations_list()
+
     def read_stations_list(self):
         """
         Parses the local copy of the hydrometric stations list, creating
@@ -211,6 +213,8 @@ class HydrometricRealtimeLoader(BaseLoader):
         if not os.path.exists(STATIONS_CACHE):
             download_stations()
 
+        self.stations_mtime = os.path.getmtime(STATIONS_CACHE)
+
         with open(STATIONS_CACHE) as stations_file:
             reader = csv.reader(stations_file)
 
@@ -396,10 +400,24 @@ class HydrometricRealtimeLoader(BaseLoader):
         LOGGER.debug(f'Received file {filepath}')
 
         package = self.generate_observations(filepath)
-        self.conn.submit_elastic_package(package, request_size=80000)
+        self.conn.submit_elastic_package(package, **self.submit_options)
 
         return True
 
+    def generate_actions(self, filepath):
+        """
+        generates Elasticsearch bulk API actions for a file
+
+        :param filepath: filepath to data on disk
+
+        :returns: `list` of bulk API actions
+        """
+
+        if filepath.endswith('hydrometric_StationList.csv'):
+            return []
+
+        return list(self.generate_observations(filepath))
+
 
 def download_stations():
     """
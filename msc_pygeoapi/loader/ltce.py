@@ -1018,6 +1018,7 @@ def ltce():
 @click.command()
 @click.pass_context
 @cli_options.OPTION_BATCH_SIZE()
+@cli_options.OPTION_THREAD_COUNT()
 @cli_options.OPTION_DB()
 @cli_options.OPTION_ELASTICSEARCH()
 @cli_options.OPTION_ES_USERNAME()
@@ -1045,6 +1046,7 @@ def add(
     ignore_certs,
     dataset,
     batch_size,
+    thread_count,
 ):
     """
     Loads Long Term Climate Extremes(LTCE) data from Oracle DB
@@ -1078,7 +1080,11 @@ def add(
         try:
             stations = loader.generate_stations()
             if stations:
-                loader.conn.submit_elastic_package(stations, batch_size)
+                index_name = f'ltce_stations.{loader.date}'
+                with loader.conn.bulk_load(index_name):
+                    loader.conn.submit_elastic_package(
+                        stations, batch_size, thread_count=thread_count
+                    )
                 LOGGER.info('Stations populated.')
                 LOGGER.info(
                     f'Setting alias ltce_station to point '
@@ -1086,7 +1092,7 @@ def add(
                 )
                 loader.conn.create_alias(
                     'ltce_stations',
-                    f'ltce_stations.{loader.date}',
+                    index_name,
                     overwrite=True,
                 )
             else:
@@ -1099,7 +1105,11 @@ def add(
         try:
             temp_extremes = loader.generate_daily_temp_extremes()
             if temp_extremes:
-                loader.conn.submit_elastic_package(temp_extremes, batch_size)
+                index_name = f'ltce_temp_extremes.{loader.date}'
+                with loader.conn.bulk_load(index_name):
+                    loader.conn.submit_elastic_package(
+                        temp_extremes, batch_size, thread_count=thread_count
+                    )
                 LOGGER.info('Daily temperature extremes populated.')
                 LOGGER.info(
                     f'Setting alias ltce_temp_extremes to '
@@ -1107,7 +1117,7 @@ def add(
                 )
                 loader.conn.create_alias(
                     'ltce_temp_extremes',
-                    f'ltce_temp_extremes.{loader.date}',
+                    index_name,
                     overwrite=True,
                 )
             else:
@@ -1123,7 +1133,11 @@ def add(
         try:
             precip_extremes = loader.generate_daily_precip_extremes()
             if precip_extremes:
-                loader.conn.submit_elastic_package(precip_extremes, batch_size)
+                index_name = f'ltce_precip_extremes.{loader.date}'
+                with loader.conn.bulk_load(index_name):
+                    loader.conn.submit_elastic_package(
+                        precip_extremes, batch_size, thread_count=thread_count
+                    )
                 LOGGER.info('Daily precipitation extremes populated.')
                 LOGGER.info(
                     f'Setting alias ltce_precip_extremes to '
@@ -1131,7 +1145,7 @@ def add(
                 )
                 loader.conn.create_alias(
                     'ltce_precip_extremes',
-                    f'ltce_precip_extremes.{loader.date}',
+                    index_name,
                     overwrite=True,
                 )
             else:
@@ -1147,7 +1161,11 @@ def add(
         try:
             snow_extremes = loader.generate_daily_snow_extremes()
             if snow_extremes:
-                loader.conn.submit_elastic_package(snow_extremes, batch_size)
+                index_name = f'ltce_snow_extremes.{loader.date}'
+                with loader.conn.bulk_load(index_name):
+                    loader.conn.submit_elastic_package(
+                        snow_extremes, batch_size, thread_count=thread_count
+                    )
                 LOGGER.info('Daily snowfall extremes populated.')
                 LOGGER.info(
                     f'Setting alias ltce_snow_extremes to '
@@ -1155,7 +1173,7 @@ def add(
                 )
                 loader.conn.create_alias(
                     'ltce_snow_extremes',
-                    f'ltce_snow_extremes.{loader.date}',
+                    index_name,
                     overwrite=True,
                 )
             else:
@@ -596,8 +596,22 @@ class MarineWeatherRealtimeLoader(BaseLoader):
 
         BaseLoader.__init__(self)
 
+        self.submit_options = {'refresh': True}
+
         self.conn = ElasticsearchConnector(conn_config)
         self.filename_pattern = '{datetime}_MSC_MarineWeather_{region_name_code}_{lang}.xml'  # noqa
+        self.reset()
+
+        # create marine weather indices if it don't exist
+        self.conn.create(INDEX_NAME, SETTINGS)
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
         self.filepath_en = None
         self.filepath_fr = None
         self.parsed_filename = parse(self.filename_pattern, '')
@@ -616,9 +630,6 @@ class MarineWeatherRealtimeLoader(BaseLoader):
             }
         }
 
-        # create marine weather indices if it don't exist
-        self.conn.create(INDEX_NAME, SETTINGS)
-
     def _sort_by_datetime_diff(self, file):
         """
         Sort files by absolute datetime difference between filename and
@@ -1179,10 +1190,13 @@ class MarineWeatherRealtimeLoader(BaseLoader):
 
         return self.marine_weather_feature
 
-    def load_data(self, filepath):
+    def generate_actions(self, filepath):
         """
-        loads data from event to target
-        :returns: `bool` of status result
+        generates Elasticsearch bulk API actions for a marine weather file
+
+        :param filepath: filepath of marine weather XML file
+
+        :returns: `list` of bulk API actions
         """
 
         self.filepath = Path(filepath)
@@ -1211,7 +1225,7 @@ class MarineWeatherRealtimeLoader(BaseLoader):
                 f'No associated {alt_lang} file found for '
                 f'{self.filepath.name}'
             )
-            return False
+            return []
 
         LOGGER.debug(
             f'Processing XML: '
@@ -1226,7 +1240,7 @@ class MarineWeatherRealtimeLoader(BaseLoader):
             }
         except Exception as err:
             LOGGER.error(f'ERROR: cannot process data: {err}')
-            return False
+            return []
 
         xml_creation_dates = [
             datetime.strptime(
@@ -1246,7 +1260,7 @@ class MarineWeatherRealtimeLoader(BaseLoader):
                 f'{MAX_XML_DATETIME_DIFF_SECONDS} seconds. '
                 'Skipping loading...'
             )
-            return False
+            return []
         else:
             LOGGER.debug(
                 f'File creation times differ by {xml_creation_diff_seconds} '
@@ -1256,17 +1270,27 @@ class MarineWeatherRealtimeLoader(BaseLoader):
         # populate self.marine_weather_feature
         self.xml2json_marine_weather()
 
-        # load self.marine_weather_feature
-        action = {
+        return [{
             '_id': self.region_name_code,
             '_index': INDEX_NAME,
             '_op_type': 'update',
             'doc': self.marine_weather_feature,
             'doc_as_upsert': True
-        }
+        }]
+
+    def load_data(self, filepath):
+        """
+        loads data from event to target
+        :returns: `bool` of status result
+        """
+
+        actions = self.generate_actions(filepath)
+
+        if not actions:
+            return False
 
         try:
-            self.conn.submit_elastic_package([action], refresh=True)
+            self.conn.submit_elastic_package(actions, **self.submit_options)
             return True
         except Exception as err:
             LOGGER.error(f'ERROR: cannot process data: {err}')
@@ -47,7 +47,8 @@ from msc_pygeoapi.env import (
 from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import (
     check_es_indexes_to_delete,
-    configure_es_connection
+    configure_es_connection,
+    latest_set_actions
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -60,6 +61,9 @@ DAYS_TO_KEEP = 7
 
 INDEX_BASENAME = 'metnotes'
 
+# MetNotes of the latest file, read by `metnote_status=active` queries
+LATEST_INDEX_NAME = 'latest-metnotes'
+
 MAPPINGS = {
     'properties': {
         'geometry': {
@@ -198,6 +202,7 @@ class MetNotesRealtimeLoader(BaseLoader):
             index_setting,
             overwrite=True
             )
+        self.conn.create(LATEST_INDEX_NAME, index_setting)
 
     def load_data(self, filepath):
         """
@@ -219,56 +224,61 @@ class MetNotesRealtimeLoader(BaseLoader):
 
         if len(data) == 0:
             LOGGER.debug('No active MetNotes')
-        else:
-            for feature in data:
-
-                b_dt = datetime.strptime(
-                    feature['properties']['publication_datetime'],
-                    '%Y-%m-%dT%H:%M:%S.%fZ'
-                )
-                b_dt2 = b_dt.strftime('%Y-%m-%d')
-                es_index = f'{INDEX_BASENAME}.{b_dt2}'
-
-                id_ = f"{feature['id']}_{feature['properties']['publication_version']}"  # noqa
-
-                feature['properties']['metnote_id'] = feature['id']
-                feature['id'] = feature['properties']['id'] = id_
-                feature['properties']['metnote_status'] = 'inactive'
-                feature['properties']['filename'] = self.filename
-
-                try:
-                    self.update_es_index(es_index, id_, feature)
-                except Exception as err:
-                    LOGGER.warning(f'Error indexing: {err}')
-                    return False
 
+        # the MetNotes of the latest file replace the active ones
         self.update_temporal_config()
-        # update metnote status to active
-        self.set_active_metnote()
+
+        package = self.generate_geojson_features(data)
+        if not self.conn.submit_elastic_package(package):
+            LOGGER.warning('Error indexing MetNotes')
+            return False
 
         return True
 
-    def update_es_index(self, es_index, id, feature):
+    def generate_geojson_features(self, data):
         """
-        Create/update the temporal configuration file
-        for the metnotes
+        Generates and yields the MetNotes of a file as Elasticsearch bulk
+        API index actions, and the actions replacing the active MetNotes if
+        the file is the latest one
 
-        :param es_index: ES index name
-        :param id: id to use for feature
-        :param feature: feature to add to ES
+        :param data: `list` of MetNotes GeoJSON features
 
-        returns: `bool` of update status
+        :returns: Generator of Elasticsearch actions
         """
 
-        try:
-            r = self.conn.Elasticsearch.index(
-                index=es_index, id=id, body=feature, refresh=True
+        active = {}
+
+        for feature in data:
+            b_dt = datetime.strptime(
+                feature['properties']['publication_datetime'],
+                '%Y-%m-%dT%H:%M:%S.%fZ'
+            )
+            b_dt2 = b_dt.strftime('%Y-%m-%d')
+            es_index = f'{INDEX_BASENAME}.{b_dt2}'
+
+            id_ = f"{feature['id']}_{feature['properties']['publication_version']}"  # noqa
+
+            feature['properties']['metnote_id'] = feature['id']
+            feature['id'] = feature['properties']['id'] = id_
+            feature['properties']['metnote_status'] = 'inactive'
+            feature['properties']['filename'] = self.filename
+
+            yield {
+                '_op_type': 'index',
+                '_index': es_index,
+                '_id': id_,
+                '_source': feature
+            }
+
+            active[id_] = dict(feature)
+            active[id_]['properties'] = dict(
+                feature['properties'], metnote_status='active'
+            )
+
+        if self.latest_file == self.filename:
+            yield from latest_set_actions(
+                self.conn.Elasticsearch, LATEST_INDEX_NAME, active
             )
-            LOGGER.debug(f'Result: {r}')
-            return True
-        except Exception as err:
-            LOGGER.warning(f'Error indexing: {err}')
-            return False
 
     def update_temporal_config(self):
         """
@@ -320,36 +330,6 @@ class MetNotesRealtimeLoader(BaseLoader):
 
         return True
 
-    def set_active_metnote(self):
-        """
-        Update the metote status
-
-        returns: `bool` of update status
-        """
-
-        script_source = f"""
-            if (ctx._source.properties.filename == '{self.latest_file}') {{
-                ctx._source.properties.metnote_status = 'active'
-            }}
-            else {{
-                ctx._source.properties.metnote_status = 'inactive'
-            }}
-        """
-
-        query = {
-            "script": {
-                "source": script_source.strip(),
-                "lang": "painless"
-            }
-        }
-
-        try:
-            self.conn.update_by_query(query, f'{INDEX_BASENAME}.*')
-        except Exception as err:
-            LOGGER.warning(f'Failed to update ES index: {err}')
-
-        return True
-
 
 @click.group()
 def metnotes():
@@ -421,7 +401,7 @@ def delete_index(ctx, es, username, password, ignore_certs, index_template):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    all_indexes = f'{INDEX_BASENAME}*'
+    all_indexes = f'{INDEX_BASENAME}*,{LATEST_INDEX_NAME}'
 
     click.echo(f'Deleting indexes {all_indexes}')
     conn.delete(all_indexes)
@@ -189,6 +189,15 @@ class PROGNOSRealtimeLoader(BaseLoader):
         BaseLoader.__init__(self)
 
         self.conn = ElasticsearchConnector(conn_config)
+        self.reset()
+
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
         self.filepath = None
         self.date_ = None
         self.model = None
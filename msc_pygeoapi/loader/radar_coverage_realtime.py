@@ -39,7 +39,10 @@ from elasticsearch import logger as elastic_logger
 from parse import parse
 
 from msc_pygeoapi import cli_options
-from msc_pygeoapi.connector.elasticsearch_ import ElasticsearchConnector
+from msc_pygeoapi.connector.elasticsearch_ import (
+    ElasticsearchConnector,
+    TimePartitionedIndex
+)
 from msc_pygeoapi.env import (
     MSC_PYGEOAPI_CACHEDIR,
     MSC_PYGEOAPI_LOGGING_LOGLEVEL
@@ -71,6 +74,8 @@ COVERAGE_TYPES = {
         'pattern': '{datetime}_MSC_Radar-Coverage_{precip_type}-Merged-Inv.json'  # noqa
     }
 }
+# hourly indexes (<INDEX_BASENAME>.YYYY-MM-DDtHH), read through the
+# <INDEX_BASENAME> alias
 INDEX_BASENAME = 'radar_coverage-{}-{}-realtime'
 
 SETTINGS = {
@@ -115,6 +120,9 @@ class RadarCoverageRealtimeLoader(BaseLoader):
         self.filepath = None
         self.precip_type = None
         self.product_type = None
+        self.index = None
+        # indexes set up by this loader, by (precip_type, product_type)
+        self.indexes = {}
         self.datetime = None
         # radar coverage settings
         self.interval_minutes = 6
@@ -172,10 +180,7 @@ class RadarCoverageRealtimeLoader(BaseLoader):
 
         for feature in features:
             # set ES index name for feature
-            es_index = INDEX_BASENAME.format(
-                self.precip_type,
-                self.product_type
-            )
+            es_index = self.index.partition(self.datetime)
 
             # add properties
             feature['properties']['precip_type'] = self.precip_type.upper()
@@ -237,7 +242,7 @@ class RadarCoverageRealtimeLoader(BaseLoader):
         }
 
         results = self.conn.Elasticsearch.search(
-            index=f'radar_coverage-{self.precip_type}-{self.product_type}-realtime',  # noqa
+            index=self.index.name,
             body=query,
             _source=['properties.datetime'],
             size=len(expected_intervals)
@@ -353,6 +358,13 @@ class RadarCoverageRealtimeLoader(BaseLoader):
         LOGGER.debug('Parsing filename...')
         self.parse_filename()
 
+        key = (self.precip_type, self.product_type)
+        if key not in self.indexes:
+            index = get_index(self.conn, *key)
+            index.setup()
+            self.indexes[key] = index
+        self.index = self.indexes[key]
+
         # generate geojson features
         LOGGER.debug('Generating ES documents from features...')
         package = self.generate_geojson_features()
@@ -368,6 +380,47 @@ class RadarCoverageRealtimeLoader(BaseLoader):
         return True
 
 
+def get_index(conn, precip_type, product_type):
+    """
+    helper function to get a time-partitioned radar coverage index
+
+    :param conn: `msc_pygeoapi.connector.elasticsearch_.ElasticsearchConnector`
+    :param precip_type: `str` of precipitation type (`mmhr` or `cmhr`)
+    :param product_type: `str` of product type (`merged` or
+                         `merged_inverted`)
+
+    :returns: `msc_pygeoapi.connector.elasticsearch_.TimePartitionedIndex`
+    """
+
+    return TimePartitionedIndex(
+        conn,
+        INDEX_BASENAME.format(precip_type, product_type),
+        SETTINGS['mappings'],
+        SETTINGS['settings'],
+        interval='hour'
+    )
+
+
+def get_indexes(conn, dataset):
+    """
+    helper function to get the time-partitioned radar coverage indexes of
+    a dataset
+
+    :param conn: `msc_pygeoapi.connector.elasticsearch_.ElasticsearchConnector`
+    :param dataset: `str` of dataset (`all`, `mmhr` or `cmhr`)
+
+    :returns: `list` of `TimePartitionedIndex`
+    """
+
+    precip_types = PRECIP_TYPES if dataset == 'all' else [dataset]
+
+    return [
+        get_index(conn, precip_type, coverage_type['type'])
+        for precip_type in precip_types
+        for coverage_type in COVERAGE_TYPES.values()
+    ]
+
+
 @click.group()
 def radar_coverage_realtime():
     """Manages radar coverage indexes"""
@@ -412,11 +465,11 @@ def add(ctx, file_, directory, es, username, password, ignore_certs):
 
 
 def confirm(ctx, param, value):
-    if not value and ctx.params['datetime']:
+    if not value and ctx.params['datetime_']:
         click.confirm(
             f'Are you sure you want to delete {ctx.params["dataset"]} '
-            / 'radar coverage documents older than '
-            / f'{click.style(ctx.params["datetime"], fg="red")} ?',
+            'radar coverage documents older than '
+            f'{click.style(ctx.params["datetime_"], fg="red")} ?',
             abort=True,
         )
 
@@ -429,6 +482,7 @@ def confirm(ctx, param, value):
 )
 @click.option(
     '--datetime',
+    'datetime_',
     help='Delete radar coverage forecast hours older than YYYY-MM-DDTHH:MM:SSZ',  # noqa
     required=False,
 )
@@ -438,21 +492,21 @@ def confirm(ctx, param, value):
 @cli_options.OPTION_ES_IGNORE_CERTS()
 @cli_options.OPTION_YES(callback=confirm)
 def clean_indexes(
-    ctx, dataset, datetime, es, username, password, ignore_certs
+    ctx, dataset, datetime_, es, username, password, ignore_certs
 ):
     """Delete old radar coverage documents older than n hours"""
 
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    if dataset == 'all':
-        indexes_to_delete = 'radar_coverage-*'
+    if datetime_:
+        older_than = datetime.strptime(datetime_, DATETIME_RFC3339_FMT)
     else:
-        indexes_to_delete = f'radar_coverage-{dataset}*'
-
-    query = {'query': {'range': {'properties.datetime': {'lt': datetime}}}}
+        older_than = datetime.utcnow() - timedelta(hours=HOURS_TO_KEEP)
 
-    conn.Elasticsearch.delete_by_query(indexes_to_delete, query)
+    for index in get_indexes(conn, dataset):
+        deleted = index.clean(older_than)
+        click.echo(f'Deleted indexes {deleted}')
 
     click.echo('Done')
 
@@ -476,14 +530,13 @@ def delete_indexes(
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    if dataset == 'all':
-        indexes = 'radar_coverage-*'
-    else:
-        indexes = '{}*'.format(INDEX_BASENAME.format(dataset))
-
-    click.echo(f'Deleting indexes {indexes}')
+    for index in get_indexes(conn, dataset):
+        deleted = index.delete()
+        click.echo(f'Deleted indexes {deleted}')
 
-    conn.delete(indexes)
+        if index_template:
+            click.echo(f'Deleting index template {index.name}.')
+            conn.delete_template(f'{index.name}.')
 
     if index_template:
         click.echo('Deleting index template radar_coverage...')
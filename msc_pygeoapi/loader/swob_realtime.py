@@ -291,10 +291,21 @@ class SWOBRealtimeLoader(BaseLoader):
 
         BaseLoader.__init__(self)
 
+        self.submit_options = {'request_size': 80000}
+
         self.conn = ElasticsearchConnector(conn_config)
-        self.items = []
+        self.reset()
         self.conn.create_template(INDEX_BASENAME, SETTINGS)
 
+    def reset(self):
+        """
+        resets per-file state
+
+        :returns: `None`
+        """
+
+        self.items = []
+
     def generate_observations(self, filepath):
         """
         Generates and yields a series of observations, one for each row in
@@ -340,13 +351,23 @@ class SWOBRealtimeLoader(BaseLoader):
         """
 
         LOGGER.debug(f'Received file {filepath}')
-        chunk_size = 80000
 
         package = self.generate_observations(filepath)
-        self.conn.submit_elastic_package(package, request_size=chunk_size)
+        self.conn.submit_elastic_package(package, **self.submit_options)
 
         return True
 
+    def generate_actions(self, filepath):
+        """
+        generates Elasticsearch bulk API actions for a file
+
+        :param filepath: filepath to data on disk
+
+        :returns: `list` of bulk API actions
+        """
+
+        return list(self.generate_observations(filepath))
+
 
 @click.group()
 def swob_realtime():
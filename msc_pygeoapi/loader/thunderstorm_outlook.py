@@ -38,13 +38,17 @@ import re
 import click
 
 from msc_pygeoapi import cli_options
-from msc_pygeoapi.connector.elasticsearch_ import ElasticsearchConnector
+from msc_pygeoapi.connector.elasticsearch_ import (
+    ElasticsearchConnector,
+    TimePartitionedIndex
+)
 from msc_pygeoapi.loader.base import BaseLoader
 from msc_pygeoapi.util import configure_es_connection
 
 LOGGER = logging.getLogger(__name__)
 
-# index settings
+# index settings: hourly indexes (<INDEX_NAME>.YYYY-MM-DDtHH) by
+# expiration datetime, read through the <INDEX_NAME> alias
 INDEX_NAME = 'thunderstorm_outlook'
 
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
@@ -88,10 +92,8 @@ class ThunderstormOutlookLoader(BaseLoader):
         self.datetime = None
         self.conn = ElasticsearchConnector(conn_config)
 
-        SETTINGS['mappings'] = MAPPINGS
-        if not self.conn.exists(INDEX_NAME):
-            LOGGER.debug(f'Creating index {INDEX_NAME}')
-            self.conn.create(INDEX_NAME, SETTINGS)
+        self.index = get_index(self.conn)
+        self.index.setup()
 
     def generate_geojson_features(self):
         """
@@ -140,10 +142,24 @@ class ThunderstormOutlookLoader(BaseLoader):
             is_newer = self.check_if_newer(file_id, amendment)
 
             if is_newer['update']:
+                targets = {}
+                for outlook in features:
+                    expiration = datetime.strptime(
+                        outlook['properties']['expiration_datetime'],
+                        DATETIME_FORMAT
+                    )
+                    targets[outlook['properties']['id']] = \
+                        self.index.partition(expiration)
+
+                # an amendment changing the expiration of an outlook moves
+                # it to another partition
+                self.index.delete_stale(targets)
+
                 for outlook in features:
+                    id_ = outlook['properties']['id']
                     action = {
-                        '_id': outlook['properties']['id'],
-                        '_index': INDEX_NAME,
+                        '_id': id_,
+                        '_index': targets[id_],
                         '_op_type': 'update',
                         'doc': outlook,
                         'doc_as_upsert': True
@@ -151,9 +167,10 @@ class ThunderstormOutlookLoader(BaseLoader):
 
                     yield action
 
-                for id_ in is_newer['id_list']:
-                    self.conn.Elasticsearch.delete(index=INDEX_NAME,
-                                                   id=id_)
+                # outlooks of the amendment replace their previous copies
+                for index, id_ in is_newer['id_list']:
+                    if id_ not in targets:
+                        self.conn.Elasticsearch.delete(index=index, id=id_)
         else:
             LOGGER.warning(f'empty thunderstorm outlook json in {filename}')
 
@@ -167,8 +184,9 @@ class ThunderstormOutlookLoader(BaseLoader):
                         }
                     }
                 }
-                self.conn.Elasticsearch.delete_by_query(index=INDEX_NAME,
-                                                        body=query)
+                self.conn.Elasticsearch.delete_by_query(
+                    index=self.index.pattern, body=query
+                )
 
     def flatten_json(self, key, values, parent_key=''):
         """
@@ -192,7 +210,7 @@ class ThunderstormOutlookLoader(BaseLoader):
         """
         check if the thunderstorm outlook is the newest version
 
-        :returns: `bool` if latest, id_list for ids to delete
+        :returns: `bool` if latest, id_list for (index, id) to delete
         """
 
         upt_ = True
@@ -208,7 +226,7 @@ class ThunderstormOutlookLoader(BaseLoader):
 
         # Fetch the document
         try:
-            result = self.conn.Elasticsearch.search(index=INDEX_NAME,
+            result = self.conn.Elasticsearch.search(index=self.index.pattern,
                                                     body=query)
             if result:
                 hit = result['hits']['hits'][0]
@@ -217,7 +235,7 @@ class ThunderstormOutlookLoader(BaseLoader):
                     upt_ = False
                 else:
                     for id_ in result['hits']['hits']:
-                        id_list.append(id_['_id'])
+                        id_list.append((id_['_index'], id_['_id']))
         except Exception:
             LOGGER.warning(f'Item ({file_id}) does not exist in index')
 
@@ -245,6 +263,20 @@ class ThunderstormOutlookLoader(BaseLoader):
             return False
 
 
+def get_index(conn):
+    """
+    helper function to get the time-partitioned thunderstorm outlook index
+
+    :param conn: `msc_pygeoapi.connector.elasticsearch_.ElasticsearchConnector`
+
+    :returns: `msc_pygeoapi.connector.elasticsearch_.TimePartitionedIndex`
+    """
+
+    return TimePartitionedIndex(
+        conn, INDEX_NAME, MAPPINGS, SETTINGS['settings'], interval='hour'
+    )
+
+
 @click.group()
 def thunderstorm_outlook():
     """Manages thunderstorm outlook index"""
@@ -300,20 +332,10 @@ def clean_outlooks(ctx, es, username, password, ignore_certs):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    click.echo('Deleting documents older than datetime.now()')
-    now = datetime.now().strftime(DATETIME_FORMAT)
-
-    query = {
-        'query': {
-            'range': {
-                'properties.expiration_datetime': {
-                    'lte': now
-                }
-            }
-        }
-    }
+    click.echo('Deleting documents older than datetime.utcnow()')
 
-    conn.Elasticsearch.delete_by_query(index=INDEX_NAME, body=query)
+    deleted = get_index(conn).clean(datetime.utcnow())
+    click.echo(f'Deleted indexes {deleted}')
 
 
 @click.command()
@@ -332,12 +354,12 @@ def delete_index(ctx, es, username, password, ignore_certs, index_template):
     conn_config = configure_es_connection(es, username, password, ignore_certs)
     conn = ElasticsearchConnector(conn_config)
 
-    click.echo(f'Deleting indexes {INDEX_NAME}')
-    conn.delete(INDEX_NAME)
+    deleted = get_index(conn).delete()
+    click.echo(f'Deleted indexes {deleted}')
 
     if index_template:
-        click.echo(f'Deleting index template {INDEX_NAME}')
-        conn.delete_template(INDEX_NAME)
+        click.echo(f'Deleting index template {INDEX_NAME}.')
+        conn.delete_template(f'{INDEX_NAME}.')
 
     click.echo('Done')
 
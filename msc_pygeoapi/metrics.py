@@ -0,0 +1,324 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from contextlib import contextmanager, nullcontext
+import logging
+import os
+import threading
+import time
+
+from msc_pygeoapi.env import (
+    MSC_PYGEOAPI_METRICS_FILE,
+    MSC_PYGEOAPI_METRICS_INTERVAL
+)
+
+LOGGER = logging.getLogger(__name__)
+
+PREFIX = 'msc_pygeoapi'
+
+COUNTERS = {
+    'documents_total': 'Documents submitted to Elasticsearch by result',
+    'bulk_bytes_total': 'Bytes of bulk API actions sent to Elasticsearch',
+    'messages_total': 'Sarracenia messages processed by status'
+}
+
+
+class Metrics:
+    """
+    ingest metrics registry, exported in Prometheus text format
+
+    Timings are recorded per loader and stage (routing, loader
+    construction, loading, action generation, bulk submission). All
+    recording methods are no-ops unless an export file is configured.
+    """
+
+    def __init__(self, filepath=None, interval=60, labels={}):
+        """
+        initializer
+
+        :param filepath: path of Prometheus text file to export metrics to
+                         (`None` disables metrics)
+        :param interval: minimum number of seconds between exports
+        :param labels: `dict` of labels added to every sample
+
+        :returns: `msc_pygeoapi.metrics.Metrics`
+        """
+
+        self.filepath = filepath
+        self.interval = interval
+        self.labels = labels
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.timings = {}
+        self.counters = {}
+        self.last_export = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        whether metrics are recorded
+
+        :returns: `bool`
+        """
+
+        return self.filepath is not None
+
+    def configure(self, filepath=None, labels={}):
+        """
+        set export file and constant labels
+
+        :param filepath: path of Prometheus text file to export metrics to
+        :param labels: `dict` of labels added to every sample
+
+        :returns: `None`
+        """
+
+        if filepath is not None:
+            self.filepath = filepath
+
+        self.labels = labels
+
+    @contextmanager
+    def loader(self, name):
+        """
+        set the loader to which metrics of the current thread are
+        attributed (e.g. by the connector, which does not know its loader)
+
+        :param name: loader plugin name
+
+        :returns: context manager
+        """
+
+        previous = getattr(self.local, 'loader', None)
+        self.local.loader = name
+
+        try:
+            yield
+        finally:
+            self.local.loader = previous
+
+    def current_loader(self) -> str:
+        """
+        get the loader to which metrics of the current thread are attributed
+
+        :returns: `str` of loader plugin name
+        """
+
+        return getattr(self.local, 'loader', None) or 'unknown'
+
+    def timer(self, stage, loader=None):
+        """
+        time a block of code
+
+        :param stage: stage name
+        :param loader: loader plugin name (defaults to current loader)
+
+        :returns: context manager
+        """
+
+        if not self.enabled:
+            return nullcontext()
+
+        return self._timer(stage, loader)
+
+    @contextmanager
+    def _timer(self, stage, loader):
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, loader)
+
+    def observe(self, stage, seconds, loader=None):
+        """
+        record the duration of a stage
+
+        :param stage: stage name
+        :param seconds: duration in seconds
+        :param loader: loader plugin name (defaults to current loader)
+
+        :returns: `None`
+        """
+
+        if not self.enabled:
+            return
+
+        key = (loader or self.current_loader(), stage)
+
+        with self.lock:
+            timing = self.timings.setdefault(key, [0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+
+    def inc(self, name, value=1, **labels):
+        """
+        increment a counter
+
+        :param name: counter name (key of `COUNTERS`)
+        :param value: increment
+        :param labels: counter labels (loader defaults to current loader)
+
+        :returns: `None`
+        """
+
+        if not self.enabled or not value:
+            return
+
+        labels.setdefault('loader', self.current_loader())
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def drain(self) -> dict:
+        """
+        take the metrics recorded so far, resetting them (e.g. in worker
+        processes, whose metrics are exported by their parent)
+
+        :returns: `dict` of timings and counters
+        """
+
+        with self.lock:
+            recorded = {'timings': self.timings, 'counters': self.counters}
+            self.timings = {}
+            self.counters = {}
+
+        return recorded
+
+    def merge(self, recorded) -> None:
+        """
+        add metrics drained from another registry
+
+        :param recorded: `dict` of timings and counters (see `drain`)
+
+        :returns: `None`
+        """
+
+        if not self.enabled:
+            return
+
+        with self.lock:
+            for key, (count, total) in recorded['timings'].items():
+                timing = self.timings.setdefault(key, [0, 0.0])
+                timing[0] += count
+                timing[1] += total
+
+            for key, value in recorded['counters'].items():
+                self.counters[key] = self.counters.get(key, 0) + value
+
+    def _format_labels(self, labels) -> str:
+        labels = {**self.labels, **dict(labels)}
+        values = ','.join(
+            '{}="{}"'.format(k, str(v).replace('\\', '\\\\')
+                             .replace('"', '\\"'))
+            for k, v in sorted(labels.items())
+        )
+
+        return f'{{{values}}}'
+
+    def render(self) -> str:
+        """
+        render metrics in Prometheus text format
+
+        :returns: `str` of metrics
+        """
+
+        with self.lock:
+            timings = sorted(self.timings.items())
+            counters = sorted(self.counters.items())
+
+        name = f'{PREFIX}_stage_seconds'
+        lines = [
+            f'# HELP {name} Time spent in ingest stages',
+            f'# TYPE {name} summary'
+        ]
+
+        for (loader, stage), (count, total) in timings:
+            labels = self._format_labels({'loader': loader, 'stage': stage})
+            lines.append(f'{name}_count{labels} {count}')
+            lines.append(f'{name}_sum{labels} {total:.6f}')
+
+        for counter, help_ in COUNTERS.items():
+            name = f'{PREFIX}_{counter}'
+            lines.append(f'# HELP {name} {help_}')
+            lines.append(f'# TYPE {name} counter')
+
+            for (key, labels), value in counters:
+                if key == counter:
+                    labels = self._format_labels(labels)
+                    lines.append(f'{name}{labels} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def export(self) -> bool:
+        """
+        write metrics to export file, atomically so that scrapers never
+        read a partial file
+
+        :returns: `bool` of export status
+        """
+
+        if not self.enabled:
+            return False
+
+        tmp_filepath = f'{self.filepath}.{os.getpid()}.tmp'
+
+        try:
+            with open(tmp_filepath, 'w') as fh:
+                fh.write(self.render())
+            os.replace(tmp_filepath, self.filepath)
+        except OSError as err:
+            LOGGER.warning(f'Cannot write metrics to {self.filepath}: {err}')
+            return False
+        finally:
+            self.last_export = time.monotonic()
+
+        return True
+
+    def flush(self) -> bool:
+        """
+        export metrics if the export interval has elapsed
+
+        :returns: `bool` of whether metrics were exported
+        """
+
+        if not self.enabled:
+            return False
+
+        if time.monotonic() - self.last_export < self.interval:
+            return False
+
+        return self.export()
+
+    def __repr__(self):
+        return f'<Metrics> {self.filepath}'
+
+
+METRICS = Metrics(MSC_PYGEOAPI_METRICS_FILE, MSC_PYGEOAPI_METRICS_INTERVAL)
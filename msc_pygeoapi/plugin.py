@@ -34,6 +34,10 @@
 
 import importlib
 import logging
+import re
+import threading
+
+from msc_pygeoapi.metrics import METRICS
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,14 +45,18 @@ PLUGINS = {
     'loader': {
         'hydrometric_realtime': {
             'filename_pattern': 'hydrometric',
+            'ordering_key': r'(?P<key>[A-Z]{2}_\w+?)_(?:hourly|daily)_',
             'handler': 'msc_pygeoapi.loader.hydrometric_realtime.HydrometricRealtimeLoader'  # noqa
         },
         'bulletins_realtime': {
             'filename_pattern': 'bulletins/alphanumeric',
+            'ordering_key': r'(?P<key>.+)',
             'handler': 'msc_pygeoapi.loader.bulletins_realtime.BulletinsRealtimeLoader'  # noqa
         },
         'citypageweather_realtime': {
             'filename_pattern': 'citypage_weather',
+            'ordering_key': r'_MSC_CitypageWeather_(?P<key>[^_]+)_',
+            'cpu_bound': True,
             'handler': 'msc_pygeoapi.loader.citypageweather_realtime.CitypageweatherRealtimeLoader'  # noqa
         },
         'hurricanes_realtime': {
@@ -61,6 +69,8 @@ PLUGINS = {
         },
         'marine_weather_realtime': {
             'filename_pattern': 'marine_weather',
+            'ordering_key': r'_MSC_MarineWeather_(?P<key>.+)_(?:en|fr)\.xml',
+            'cpu_bound': True,
             'handler': 'msc_pygeoapi.loader.marine_weather_realtime.MarineWeatherRealtimeLoader'  # noqa
         },
         'cap_alerts_realtime': {
@@ -85,10 +95,13 @@ PLUGINS = {
         },
         'swob_realtime': {
             'filename_pattern': 'observations/swob-ml',
+            'ordering_key': r'\d{4}-\d{2}-\d{2}-\d{4}-(?P<key>[^-]+)-',
+            'cpu_bound': True,
             'handler': 'msc_pygeoapi.loader.swob_realtime.SWOBRealtimeLoader'
         },
         'aqhi_realtime': {
             'filename_pattern': 'air_quality/aqhi',
+            'ordering_key': r'_MSC_AQHI-[^_]+_(?P<key>[^.]+)\.json',
             'handler': 'msc_pygeoapi.loader.aqhi_realtime.AQHIRealtimeLoader'
         },
         'metnotes_realtime': {
@@ -147,6 +160,183 @@ def load_plugin(plugin_type, plugin_def, **kwargs):
     return plugin
 
 
+class PluginPool:
+    """
+    per-process pool of warm plugin instances keyed by plugin name
+
+    Plugins may hold per-file state, so each thread gets its own instances.
+    """
+
+    def __init__(self, plugin_type):
+        """
+        initializer
+
+        :param plugin_type: type of plugin (loader, etc.)
+
+        :returns: `msc_pygeoapi.plugin.PluginPool`
+        """
+
+        if plugin_type not in PLUGINS.keys():
+            msg = f'Plugin {plugin_type} not found'
+            LOGGER.exception(msg)
+            raise InvalidPluginError(msg)
+
+        self.plugin_type = plugin_type
+        self.plugins = {}
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        """
+        get a plugin instance, creating it on first use
+
+        :param name: plugin name (key of `PLUGINS[plugin_type]`)
+
+        :returns: plugin object
+        """
+
+        key = (threading.get_ident(), name)
+
+        with self.lock:
+            if key not in self.plugins:
+                try:
+                    plugin_def = PLUGINS[self.plugin_type][name]
+                except KeyError:
+                    msg = f'Plugin {name} not found'
+                    LOGGER.error(msg)
+                    raise InvalidPluginError(msg)
+
+                LOGGER.debug(f'Loading plugin {plugin_def}')
+                with METRICS.timer('construct', name):
+                    self.plugins[key] = load_plugin(
+                        self.plugin_type, plugin_def)
+
+            return self.plugins[key]
+
+    def invalidate(self, name=None):
+        """
+        drop cached plugin instance(s) so that they are rebuilt on next use
+
+        :param name: plugin name (default drops all plugin instances)
+
+        :returns: `None`
+        """
+
+        with self.lock:
+            if name is None:
+                LOGGER.debug(f'Invalidating all {self.plugin_type} plugins')
+                self.plugins.clear()
+            else:
+                LOGGER.debug(f'Invalidating {self.plugin_type} plugin {name}')
+                for key in [k for k in self.plugins if k[1] == name]:
+                    del self.plugins[key]
+
+    def __repr__(self):
+        return f'<PluginPool> {self.plugin_type}'
+
+
+class FilenameRouter:
+    """
+    compiled filename router
+
+    All plugin filename patterns are compiled into a single regular
+    expression so that a path is routed to exactly one plugin in one
+    forward scan. Precedence follows plugin definition order regardless of
+    where the pattern occurs in the path: when several patterns match, the
+    plugin defined last wins, as with the previous per-plugin substring
+    scan.
+    """
+
+    def __init__(self, plugin_defs):
+        """
+        initializer
+
+        :param plugin_defs: `dict` of plugin name to plugin definition
+
+        :returns: `msc_pygeoapi.plugin.FilenameRouter`
+        """
+
+        self.names = list(plugin_defs.keys())
+        self.ordering_keys = {}
+
+        rules = []
+        for i, name in enumerate(self.names):
+            pattern = re.escape(plugin_defs[name]['filename_pattern'])
+            rules.append(f'(?P<rule{i}>{pattern})')
+
+            if 'ordering_key' in plugin_defs[name]:
+                self.ordering_keys[name] = re.compile(
+                    plugin_defs[name]['ordering_key']
+                )
+
+        # regexes[i] matches the rules defined from i onwards; branches are
+        # tried in order at each position, so the rule defined last is
+        # listed first
+        self.regexes = [
+            re.compile('|'.join(reversed(rules[i:])))
+            for i in range(len(rules))
+        ]
+        self.regexes.append(None)
+
+    def route(self, filepath):
+        """
+        find the plugin matching a given path
+
+        The leftmost match is found first; only rules defined after it can
+        take precedence, and only by matching further in the path, so the
+        rest of the path is scanned for those rules alone.
+
+        :param filepath: path to file
+
+        :returns: `str` of plugin name, or `None` if no plugin matches
+        """
+
+        rule = None
+        pos = 0
+        regex = self.regexes[0]
+
+        while regex is not None:
+            match = regex.search(filepath, pos)
+            if match is None:
+                break
+            rule = int(match.lastgroup[4:])
+            pos = match.start() + 1
+            regex = self.regexes[rule + 1]
+
+        if rule is None:
+            return None
+
+        return self.names[rule]
+
+    def ordering_key(self, name, filepath):
+        """
+        get the key of a path for which processing order must be preserved
+
+        Files sharing an ordering key are processed in arrival order.
+        Plugins without an `ordering_key` pattern are serialized as a whole.
+
+        :param name: plugin name
+        :param filepath: path to file
+
+        :returns: `str` of ordering key
+        """
+
+        regex = self.ordering_keys.get(name)
+
+        if regex is not None:
+            match = regex.search(filepath)
+            if match is not None:
+                return f'{name}:{match.group("key")}'
+
+        return name
+
+    def __repr__(self):
+        return f'<FilenameRouter> {len(self.names)} rules'
+
+
 class InvalidPluginError(Exception):
     """Invalid plugin"""
     pass
+
+
+LOADER_POOL = PluginPool('loader')
+LOADER_ROUTER = FilenameRouter(PLUGINS['loader'])
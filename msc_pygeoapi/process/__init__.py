@@ -34,15 +34,14 @@
 
 import click
 
-from msc_pygeoapi.process.cccs import cccs
-from msc_pygeoapi.process.weather import weather
+from msc_pygeoapi.util import LazyGroup
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands={
+    'cccs': ('msc_pygeoapi.process.cccs', 'cccs'),
+    'climate': ('msc_pygeoapi.process.climate', 'climate'),
+    'weather': ('msc_pygeoapi.process.weather', 'weather')
+})
 def process():
     """Processing workflow"""
     pass
-
-
-process.add_command(cccs)
-process.add_command(weather)
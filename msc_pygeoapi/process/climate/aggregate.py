@@ -0,0 +1,329 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import json
+import logging
+
+import click
+
+LOGGER = logging.getLogger(__name__)
+
+# collections whose provider supports aggregations
+COLLECTIONS = ['climate-daily', 'climate-hourly']
+
+PROCESS_METADATA = {
+    'version': '0.1.0',
+    'id': 'climate-aggregate',
+    'title': 'Climate observations aggregation',
+    'description': 'Summarize daily or hourly climate observations '
+                   '(statistics and percentiles), optionally grouped by '
+                   'a property and/or a calendar interval',
+    'keywords': ['climate', 'statistics', 'aggregation'],
+    'links': [
+        {
+            'type': 'text/html',
+            'rel': 'canonical',
+            'title': 'information',
+            'href': 'https://climate.weather.gc.ca',
+            'hreflang': 'en-CA'
+        },
+        {
+            'type': 'text/html',
+            'rel': 'alternate',
+            'title': 'information',
+            'href': 'https://climat.meteo.gc.ca/index_f.html',
+            'hreflang': 'fr-CA'
+        }
+    ],
+    'jobControlOptions': ['sync-execute'],
+    'inputs': {
+        'collection': {
+            'title': 'Collection',
+            'description': 'Collection to aggregate.',
+            'schema': {'type': 'string', 'enum': COLLECTIONS},
+            'minOccurs': 1,
+            'maxOccurs': 1
+        },
+        'fields': {
+            'title': 'Fields',
+            'description': 'Numeric properties to summarize.',
+            'schema': {'type': 'array', 'items': {'type': 'string'}},
+            'minOccurs': 1,
+            'maxOccurs': 1
+        },
+        'statistics': {
+            'title': 'Statistics',
+            'description': 'Statistics to compute (count, min, max, avg, '
+                           'sum). Defaults to all.',
+            'schema': {'type': 'array', 'items': {'type': 'string'}},
+            'minOccurs': 0,
+            'maxOccurs': 1
+        },
+        'percentiles': {
+            'title': 'Percentiles',
+            'description': 'Percentiles to compute (e.g. [5, 50, 95]).',
+            'schema': {'type': 'array', 'items': {'type': 'number'}},
+            'minOccurs': 0,
+            'maxOccurs': 1
+        },
+        'group_by': {
+            'title': 'Group by',
+            'description': 'Property to group by (e.g. CLIMATE_IDENTIFIER).',
+            'schema': {'type': 'string'},
+            'minOccurs': 0,
+            'maxOccurs': 1
+        },
+        'interval': {
+            'title': 'Interval',
+            'description': 'Calendar interval to group by (hour, day, '
+                           'week, month, quarter or year).',
+            'schema': {'type': 'string'},
+            'minOccurs': 0,
+            'maxOccurs': 1
+        },
+        'bbox': {
+            'title': 'Bounding box',
+            'description': 'Bounding box (minx, miny, maxx, maxy).',
+            'schema': {
+                'type': 'array',
+                'items': {'type': 'number'},
+                'minItems': 4,
+                'maxItems': 4
+            },
+            'minOccurs': 0,
+            'maxOccurs': 1
+        },
+        'datetime': {
+            'title': 'Datetime',
+            'description': 'Datetime instant or range in RFC 3339 format.',
+            'schema': {'type': 'string'},
+            'minOccurs': 0,
+            'maxOccurs': 1
+        },
+        'properties': {
+            'title': 'Properties',
+            'description': 'Property filters (e.g. '
+                           '{"CLIMATE_IDENTIFIER": "7025250"}).',
+            'schema': {'type': 'object'},
+            'minOccurs': 0,
+            'maxOccurs': 1
+        }
+    },
+    'outputs': {
+        'aggregation': {
+            'title': 'Aggregation',
+            'description': 'Result table (columns and rows).',
+            'schema': {
+                'type': 'object',
+                'contentMediaType': 'application/json'
+            }
+        }
+    },
+    'example': {
+        'inputs': {
+            'collection': 'climate-daily',
+            'fields': ['MAX_TEMPERATURE', 'TOTAL_PRECIPITATION'],
+            'statistics': ['min', 'max', 'avg'],
+            'percentiles': [50, 95],
+            'interval': 'month',
+            'datetime': '2020-01-01T00:00:00Z/2020-12-31T00:00:00Z',
+            'properties': {'CLIMATE_IDENTIFIER': '7025250'}
+        }
+    }
+}
+
+
+def get_provider(collection):
+    """
+    Load the feature provider of a collection from pygeoapi configuration
+
+    :param collection: `str` of collection identifier
+
+    :returns: `msc_pygeoapi.provider.elasticsearch.MSCElasticsearchProvider`
+    """
+
+    from pygeoapi.config import get_config
+    from pygeoapi.plugin import load_plugin
+    from pygeoapi.util import get_provider_by_type
+
+    if collection not in COLLECTIONS:
+        raise ValueError(f'Invalid collection: {collection}')
+
+    resources = get_config()['resources']
+    provider_def = get_provider_by_type(
+        resources[collection]['providers'], 'feature'
+    )
+
+    return load_plugin('provider', provider_def)
+
+
+def aggregate(collection, fields, statistics=None, percentiles=[],
+              group_by=None, interval=None, bbox=[], datetime_=None,
+              properties={}):
+    """
+    Summarize climate observations of a collection
+
+    :param collection: `str` of collection identifier
+    :param fields: `list` of numeric properties to summarize
+    :param statistics: `list` of statistics (defaults to all)
+    :param percentiles: `list` of percentiles
+    :param group_by: `str` of property to group by
+    :param interval: `str` of calendar interval
+    :param bbox: `list` of bounding box (minx, miny, maxx, maxy)
+    :param datetime_: `str` of datetime instant or range
+    :param properties: `dict` of property filters
+
+    :returns: `dict` of result table (columns and rows)
+    """
+
+    from pygeoapi.provider.base import ProviderGenericError
+
+    if not fields:
+        raise ValueError('At least one field is required')
+
+    try:
+        percentiles = [float(p) for p in percentiles]
+        bbox = [float(c) for c in bbox]
+    except (TypeError, ValueError):
+        raise ValueError('Invalid percentiles or bbox')
+
+    if bbox and len(bbox) != 4:
+        raise ValueError('Invalid bbox')
+
+    kwargs = {}
+    if statistics is not None:
+        kwargs['statistics'] = statistics
+
+    try:
+        provider = get_provider(collection)
+        return provider.aggregate(
+            bbox=bbox,
+            datetime_=datetime_,
+            properties=[(k, str(v)) for k, v in properties.items()],
+            group_by=group_by,
+            interval=interval,
+            fields=fields,
+            percents=percentiles,
+            **kwargs
+        )
+    except ProviderGenericError as err:
+        raise ValueError(err)
+
+
+@click.group('execute')
+def aggregate_execute():
+    pass
+
+
+@click.command('aggregate')
+@click.pass_context
+@click.option('--collection', '-c', 'collection',
+              type=click.Choice(COLLECTIONS), required=True,
+              help='Collection')
+@click.option('--field', '-f', 'fields', multiple=True, required=True,
+              help='Numeric property to summarize')
+@click.option('--statistic', '-s', 'statistics', multiple=True,
+              help='Statistic (count, min, max, avg or sum)')
+@click.option('--percentile', '-p', 'percentiles', multiple=True,
+              type=float, help='Percentile')
+@click.option('--group-by', '-g', 'group_by', help='Property to group by')
+@click.option('--interval', '-i', 'interval', help='Calendar interval')
+@click.option('--datetime', '-d', 'datetime_',
+              help='Datetime instant or range in RFC 3339 format')
+@click.option('--property', 'properties', multiple=True,
+              help='Property filter (name=value)')
+def aggregate_cli(ctx, collection, fields, statistics, percentiles,
+                  group_by, interval, datetime_, properties):
+
+    output = aggregate(
+        collection,
+        list(fields),
+        statistics=list(statistics) or None,
+        percentiles=list(percentiles),
+        group_by=group_by,
+        interval=interval,
+        datetime_=datetime_,
+        properties=dict(p.split('=', 1) for p in properties)
+    )
+
+    click.echo(json.dumps(output, ensure_ascii=False))
+
+
+aggregate_execute.add_command(aggregate_cli)
+
+try:
+    from pygeoapi.process.base import BaseProcessor, ProcessorExecuteError
+
+    class ClimateAggregateProcessor(BaseProcessor):
+        """Climate Aggregate Processor"""
+
+        def __init__(self, provider_def):
+            """
+            Initialize object
+
+            :param provider_def: provider definition
+
+            :returns: msc_pygeoapi.process.climate.aggregate.ClimateAggregateProcessor  # noqa
+            """
+
+            BaseProcessor.__init__(self, provider_def, PROCESS_METADATA)
+
+        def execute(self, data, outputs=None):
+            mimetype = 'application/json'
+
+            required = ['collection', 'fields']
+            if not all([param in data for param in required]):
+                msg = 'Missing required parameters.'
+                LOGGER.error(msg)
+                raise ProcessorExecuteError(msg)
+
+            try:
+                output = aggregate(
+                    data['collection'],
+                    data['fields'],
+                    statistics=data.get('statistics'),
+                    percentiles=data.get('percentiles') or [],
+                    group_by=data.get('group_by'),
+                    interval=data.get('interval'),
+                    bbox=data.get('bbox') or [],
+                    datetime_=data.get('datetime'),
+                    properties=data.get('properties') or {}
+                )
+            except ValueError as err:
+                msg = f'Process execution error: {err}'
+                LOGGER.error(msg)
+                raise ProcessorExecuteError(msg)
+
+            return mimetype, output
+
+        def __repr__(self):
+            return f'<ClimateAggregateProcessor> {self.name}'
+
+except (ImportError, RuntimeError) as err:
+    LOGGER.warning(f'Import errors: {err}')
@@ -32,12 +32,14 @@ import click
 import json
 import logging
 
-from elasticsearch import Elasticsearch, exceptions
+from elasticsearch import exceptions
 import rasterio
 import rasterio.mask
 from rasterio.crs import CRS
 from rasterio.io import MemoryFile
 
+from msc_pygeoapi.connector.elasticsearch_ import get_client
+
 LOGGER = logging.getLogger(__name__)
 
 PROCESS_METADATA = {
@@ -137,7 +139,7 @@ def get_files(layers, fh, mr):
 
     :returns: list of three file paths
     """
-    es = Elasticsearch()
+    es = get_client()
     list_files = []
 
     for layer in layers:
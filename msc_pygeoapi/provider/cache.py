@@ -0,0 +1,503 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from msc_pygeoapi.env import MSC_PYGEOAPI_CACHEDIR
+
+LOGGER = logging.getLogger(__name__)
+
+# seconds during which results are not stored after an index changed,
+# as changes may not be searchable before the next refresh
+REFRESH_GRACE = 2
+
+# number of lookups between logs of cache statistics
+STATS_INTERVAL = 1000
+
+# query caches by provider data, as providers are built per request
+CACHES = {}
+CACHES_LOCK = threading.Lock()
+
+
+def dumps(data):
+    """
+    serialize a query result
+
+    :param data: `dict` of query result
+
+    :returns: `bytes` of JSON
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data)
+
+    return json.dumps(data).encode()
+
+
+def loads(data):
+    """
+    deserialize a query result
+
+    :param data: `bytes` of JSON
+
+    :returns: `dict` of query result
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+class MemoryBackend:
+    """
+    in-process LRU store of serialized query results, bounded in bytes
+    """
+
+    def __init__(self, max_bytes):
+        """
+        initializer
+
+        :param max_bytes: maximum size of stored results in bytes
+
+        :returns: `msc_pygeoapi.provider.cache.MemoryBackend`
+        """
+
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        get a stored result
+
+        :param key: `str` of cache key
+
+        :returns: `tuple` of result `bytes`, expiry time and watermark,
+                  or `None`
+        """
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+
+        return entry
+
+    def set(self, key, value, expires, watermark):
+        """
+        store a result, evicting least recently used results beyond
+        `max_bytes`
+
+        :param key: `str` of cache key
+        :param value: `bytes` of serialized result
+        :param expires: `float` of expiry time (epoch)
+        :param watermark: `str` of index watermark of result
+
+        :returns: `bool` of whether result was stored
+        """
+
+        if len(value) > self.max_bytes:
+            return False
+
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[0])
+
+            self.entries[key] = (value, expires, watermark)
+            self.size += len(value)
+
+            while self.size > self.max_bytes:
+                evicted = self.entries.popitem(last=False)[1]
+                self.size -= len(evicted[0])
+                self.evictions += 1
+
+        return True
+
+    def __repr__(self):
+        return f'<MemoryBackend> {len(self.entries)} results'
+
+
+class FileBackend:
+    """
+    store of serialized query results in a directory, shared by the
+    worker processes of a host and bounded in bytes (least recently used
+    files are pruned)
+    """
+
+    # number of stores between prunings
+    PRUNE_INTERVAL = 64
+
+    def __init__(self, path, max_bytes):
+        """
+        initializer
+
+        :param path: path of cache directory
+        :param max_bytes: maximum size of stored results in bytes
+
+        :returns: `msc_pygeoapi.provider.cache.FileBackend`
+        """
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.stores = 0
+
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_filepath(self, key):
+        """
+        get the file of a cache key
+
+        :param key: `str` of cache key
+
+        :returns: `str` of filepath
+        """
+
+        filename = hashlib.sha256(key.encode()).hexdigest()
+
+        return os.path.join(self.path, filename)
+
+    def get(self, key):
+        """
+        get a stored result
+
+        :param key: `str` of cache key
+
+        :returns: `tuple` of result `bytes`, expiry time and watermark,
+                  or `None`
+        """
+
+        filepath = self.get_filepath(key)
+
+        try:
+            with open(filepath, 'rb') as fh:
+                header = json.loads(fh.readline())
+                value = fh.read()
+            os.utime(filepath)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            LOGGER.debug(f'Cannot read cached result {filepath}: {err}')
+            return None
+
+        if header.get('key') != key:
+            return None
+
+        return value, header['expires'], header['watermark']
+
+    def set(self, key, value, expires, watermark):
+        """
+        store a result, pruning least recently used results beyond
+        `max_bytes` every `PRUNE_INTERVAL` stores
+
+        :param key: `str` of cache key
+        :param value: `bytes` of serialized result
+        :param expires: `float` of expiry time (epoch)
+        :param watermark: `str` of index watermark of result
+
+        :returns: `bool` of whether result was stored
+        """
+
+        if len(value) > self.max_bytes:
+            return False
+
+        filepath = self.get_filepath(key)
+        tmp_filepath = f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+        header = {'key': key, 'expires': expires, 'watermark': watermark}
+
+        try:
+            with open(tmp_filepath, 'wb') as fh:
+                fh.write(json.dumps(header).encode() + b'\n')
+                fh.write(value)
+            os.replace(tmp_filepath, filepath)
+        except OSError as err:
+            LOGGER.warning(f'Cannot store cached result {filepath}: {err}')
+            return False
+
+        self.stores += 1
+        if self.stores % self.PRUNE_INTERVAL == 0:
+            self.prune()
+
+        return True
+
+    def prune(self):
+        """
+        delete least recently used results beyond `max_bytes`
+
+        :returns: `int` of number of deleted results
+        """
+
+        files = []
+        size = 0
+
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                size += stat.st_size
+
+        deleted = 0
+
+        for _, file_size, filepath in sorted(files):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(filepath)
+            except OSError:
+                continue
+            size -= file_size
+            deleted += 1
+
+        self.evictions += deleted
+
+        return deleted
+
+    def __repr__(self):
+        return f'<FileBackend> {self.path}'
+
+
+class QueryCache:
+    """
+    cache of provider query results, expiring after a time-to-live and
+    invalidated when the index changes.
+
+    Changes are detected by the index watermark: the number of indexing
+    and delete operations on its primary shards, sampled at most once
+    every `watermark_interval` seconds.
+    """
+
+    def __init__(self, es, index_name, ttl, backend, watermark_interval=5):
+        """
+        initializer
+
+        :param es: `elasticsearch.Elasticsearch` client
+        :param index_name: `str` of index name (or alias or pattern)
+        :param ttl: number of seconds results are kept
+        :param backend: `MemoryBackend` or `FileBackend`
+        :param watermark_interval: number of seconds between samples of
+                                   the index watermark
+
+        :returns: `msc_pygeoapi.provider.cache.QueryCache`
+        """
+
+        self.es = es
+        self.index_name = index_name
+        self.ttl = ttl
+        self.backend = backend
+        self.watermark_interval = watermark_interval
+
+        self.lock = threading.Lock()
+        self.current_watermark = None
+        self.sampled_at = 0
+        self.changed_at = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def watermark(self):
+        """
+        get the index watermark, sampled at most once every
+        `watermark_interval` seconds
+
+        :returns: `str` of watermark, or `None` if it cannot be retrieved
+        """
+
+        now = time.monotonic()
+
+        with self.lock:
+            if now - self.sampled_at < self.watermark_interval:
+                return self.current_watermark
+            self.sampled_at = now
+
+        try:
+            stats = self.es.indices.stats(
+                index=self.index_name,
+                metric='indexing',
+                filter_path=[
+                    '_all.primaries.indexing.index_total',
+                    '_all.primaries.indexing.delete_total'
+                ]
+            )
+            indexing = stats['_all']['primaries']['indexing']
+            watermark = f"{indexing['index_total']}-{indexing['delete_total']}"  # noqa
+        except Exception as err:
+            LOGGER.warning(f'Cannot get watermark of {self.index_name}: {err}')
+            watermark = None
+
+        with self.lock:
+            if watermark != self.current_watermark:
+                self.current_watermark = watermark
+                self.changed_at = now
+
+        return watermark
+
+    def get(self, key):
+        """
+        get the cached result of a query
+
+        :param key: `str` of normalized query
+        :returns: `dict` of query result, or `None`
+        """
+
+        watermark = self.watermark()
+        entry = None
+
+        if watermark is not None:
+            entry = self.backend.get(key)
+
+        if entry is not None:
+            value, expires, entry_watermark = entry
+            if entry_watermark != watermark:
+                with self.lock:
+                    self.invalidations += 1
+                entry = None
+            elif expires < time.time():
+                entry = None
+
+        with self.lock:
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            lookups = self.hits + self.misses
+
+        if lookups % STATS_INTERVAL == 0:
+            LOGGER.info(f'Query cache of {self.index_name}: {self.stats()}')
+
+        if entry is None:
+            return None
+
+        return loads(entry[0])
+
+    def set(self, key, result):
+        """
+        cache the result of a query
+
+        :param key: `str` of normalized query
+        :param result: `dict` of query result
+
+        :returns: `bool` of whether result was cached
+        """
+
+        watermark = self.watermark()
+
+        if watermark is None:
+            return False
+
+        with self.lock:
+            if time.monotonic() - self.changed_at < REFRESH_GRACE:
+                return False
+
+        return self.backend.set(
+            key, dumps(result), time.time() + self.ttl, watermark
+        )
+
+    def stats(self):
+        """
+        get cache statistics
+
+        :returns: `dict` of hits, misses, invalidations and evictions
+        """
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'evictions': self.backend.evictions
+        }
+
+    def __repr__(self):
+        return f'<QueryCache> {self.index_name} {self.stats()}'
+
+
+def get_query_cache(provider, options):
+    """
+    get the query cache of a provider, shared by its instances
+
+    :param provider: `pygeoapi.provider.elasticsearch_.ElasticsearchProvider`
+    :param options: `dict` of `cache` provider definition: `ttl` (seconds,
+                    required), `max_bytes` (default 64 MB), `backend`
+                    (`memory` or `file`), `path` (file backend directory)
+                    and `watermark_interval` (seconds)
+
+    :returns: `msc_pygeoapi.provider.cache.QueryCache`, or `None` if
+              caching is disabled
+    """
+
+    ttl = options.get('ttl', 0)
+    if not ttl:
+        return None
+
+    with CACHES_LOCK:
+        cache = CACHES.get(provider.data)
+        if cache is not None:
+            return cache
+
+        max_bytes = options.get('max_bytes', 67108864)
+        backend = options.get('backend', 'memory')
+
+        if backend == 'memory':
+            backend_ = MemoryBackend(max_bytes)
+        elif backend == 'file':
+            path = options.get('path') or os.path.join(
+                MSC_PYGEOAPI_CACHEDIR, 'msc-pygeoapi-query-cache',
+                hashlib.sha256(provider.data.encode()).hexdigest()[:16]
+            )
+            backend_ = FileBackend(path, max_bytes)
+        else:
+            msg = f'Invalid query cache backend: {backend}'
+            LOGGER.error(msg)
+            raise ValueError(msg)
+
+        cache = QueryCache(
+            provider.es, provider.index_name, ttl, backend_,
+            options.get('watermark_interval', 5)
+        )
+        CACHES[provider.data] = cache
+
+    return cache
@@ -29,8 +29,10 @@
 from collections import OrderedDict
 import json
 import logging
+import threading
+import time
 
-from elasticsearch import exceptions, helpers
+from elasticsearch import exceptions
 
 from pygeoapi.provider.base import ProviderConnectionError, ProviderQueryError
 from pygeoapi.provider.elasticsearch_ import (
@@ -38,11 +40,24 @@ from pygeoapi.provider.elasticsearch_ import (
 )
 from pygeoapi.util import crs_transform
 
+from msc_pygeoapi.provider.cache import get_query_cache
 from msc_pygeoapi.provider.elasticsearch import MSCElasticsearchProvider
+from msc_pygeoapi.provider.singleflight import SINGLE_FLIGHT, get_key
 
 
 LOGGER = logging.getLogger(__name__)
 
+# deepest page reachable with from/size (index.max_result_window)
+MAX_RESULT_WINDOW = 10000
+
+# point in time (PIT) cursors of deep pagination, by data, query and
+# offset reached, so that walking pages costs one search per page
+PIT_KEEP_ALIVE = '1m'
+PIT_CURSOR_TTL = 50
+PIT_CURSORS_MAX = 100
+PIT_CURSORS = OrderedDict()
+PIT_CURSORS_LOCK = threading.Lock()
+
 
 class CPWElasticsearchProvider(MSCElasticsearchProvider):
     """CPW Elasticsearch Provider"""
@@ -58,6 +73,8 @@ class CPWElasticsearchProvider(MSCElasticsearchProvider):
         self._nested_fields = []
         super().__init__(provider_def)
 
+        self.cache = get_query_cache(self, provider_def.get('cache', {}))
+
     def get_nested_fields(self, properties, fields, prev_field=None):
         """
         Get Elasticsearch fields (names, types) for all nested properties
@@ -167,8 +184,6 @@ class CPWElasticsearchProvider(MSCElasticsearchProvider):
         query = {'track_total_hits': True, 'query': {'bool': {'filter': []}}}
         filter_ = []
 
-        feature_collection = {'type': 'FeatureCollection', 'features': []}
-
         if resulttype == 'hits':
             LOGGER.debug('hits only specified')
             limit = 0
@@ -309,33 +324,58 @@ class CPWElasticsearchProvider(MSCElasticsearchProvider):
                 query['_source']['excludes'] = ['geometry']
             except KeyError:
                 query['_source'] = {'excludes': ['geometry']}
+        LOGGER.debug('querying Elasticsearch')
+        if filterq:
+            LOGGER.debug(f'adding cql object: {filterq.json()}')
+            query = update_query(input_query=query, cql=filterq)
+        LOGGER.debug(json.dumps(query, indent=4))
+
+        key = get_key(self.data, query, offset, limit, resulttype,
+                      self.properties, select_properties)
+
+        if self.cache is not None and key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                LOGGER.debug('Returning cached result')
+                return cached
+
+        def search():
+            feature_collection = self.search(query, offset, limit, resulttype)
+
+            if self.cache is not None and key is not None:
+                self.cache.set(key, feature_collection)
+
+            return feature_collection
+
+        return SINGLE_FLIGHT.do(key, search)
+
+    def search(self, query, offset, limit, resulttype):
+        """
+        search Elasticsearch index and serialize results
+
+        :param query: `dict` of Elasticsearch query
+        :param offset: starting record to return
+        :param limit: number of records to return
+        :param resulttype: return results or hit limit
+
+        :returns: dict of 0..n GeoJSON features
+        """
+
+        feature_collection = {'type': 'FeatureCollection', 'features': []}
+
         try:
-            LOGGER.debug('querying Elasticsearch')
-            if filterq:
-                LOGGER.debug(f'adding cql object: {filterq.json()}')
-                query = update_query(input_query=query, cql=filterq)
-            LOGGER.debug(json.dumps(query, indent=4))
-
-            LOGGER.debug('Testing for ES scrolling')
-            if offset + limit > 10000:
-                gen = helpers.scan(
-                    client=self.es,
-                    query=query,
-                    preserve_order=True,
-                    index=self.index_name
+            LOGGER.debug('Testing for ES deep pagination')
+            if offset + limit > MAX_RESULT_WINDOW and limit == 0:
+                es_results = self.es.search(
+                    index=self.index_name, size=0, **query
                 )
-                results = {'hits': {'total': limit, 'hits': []}}
-                for i in range(offset + limit):
-                    try:
-                        if i >= offset:
-                            results['hits']['hits'].append(next(gen))
-                        else:
-                            next(gen)
-                    except StopIteration:
-                        break
-
-                matched = len(results['hits']['hits']) + offset
-                returned = len(results['hits']['hits'])
+                results = es_results
+                matched = es_results['hits']['total']['value']
+                returned = 0
+            elif offset + limit > MAX_RESULT_WINDOW:
+                matched, hits = self.search_pit(query, offset, limit)
+                results = {'hits': {'hits': hits}}
+                returned = len(hits)
             else:
                 es_results = self.es.search(
                     index=self.index_name, from_=offset, size=limit, **query
@@ -368,6 +408,111 @@ class CPWElasticsearchProvider(MSCElasticsearchProvider):
 
         return feature_collection
 
+    def search_pit(self, query, offset, limit):
+        """
+        query Elasticsearch beyond `MAX_RESULT_WINDOW` with a point in time
+        (PIT) and search_after.
+
+        The PIT and position reached are kept for a short while, so that
+        the next page of the same query continues from there. Otherwise,
+        pages before offset are walked through without their documents.
+
+        :param query: `dict` of Elasticsearch query
+        :param offset: starting record to return
+        :param limit: number of records to return
+
+        :returns: `tuple` of number of matching documents and `list` of hits
+        """
+
+        key = (self.data, json.dumps(query, sort_keys=True, default=str))
+        cursor = take_pit_cursor(key, offset)
+
+        try:
+            return self._search_pit(query, offset, limit, key, cursor)
+        except exceptions.NotFoundError as err:
+            if cursor is None:
+                raise
+            LOGGER.debug(f'PIT cursor expired ({err}), starting over')
+            return self._search_pit(query, offset, limit, key, None)
+
+    def _search_pit(self, query, offset, limit, key, cursor):
+        """
+        query Elasticsearch with a point in time (PIT) and search_after
+        from a cursor, or from the start
+
+        :param query: `dict` of Elasticsearch query
+        :param offset: starting record to return
+        :param limit: number of records to return
+        :param key: `tuple` of cursor key
+        :param cursor: `tuple` of PIT id, search_after values and number of
+                       matching documents at offset, or `None`
+
+        :returns: `tuple` of number of matching documents and `list` of hits
+        """
+
+        if cursor is not None:
+            pit_id, search_after, total = cursor
+            position = offset
+        else:
+            pit_id = self.es.open_point_in_time(
+                index=self.index_name, keep_alive=PIT_KEEP_ALIVE
+            )['id']
+            search_after, total = None, None
+            position = 0
+
+        # _shard_doc breaks ties so that search_after is exact
+        sort = list(query.get('sort', [])) + [{'_shard_doc': 'asc'}]
+        body = {k: v for k, v in query.items() if k != 'sort'}
+
+        hits = []
+
+        while len(hits) < limit:
+            skipping = position < offset
+            if skipping:
+                size = min(offset - position, MAX_RESULT_WINDOW)
+            else:
+                size = min(limit - len(hits), MAX_RESULT_WINDOW)
+
+            kwargs = dict(
+                body,
+                pit={'id': pit_id, 'keep_alive': PIT_KEEP_ALIVE},
+                sort=sort,
+                size=size,
+                track_total_hits=total is None
+            )
+            if search_after is not None:
+                kwargs['search_after'] = search_after
+            if skipping:
+                kwargs['_source'] = False
+                kwargs['filter_path'] = [
+                    'pit_id', 'hits.total', 'hits.hits.sort'
+                ]
+
+            result = self.es.search(**kwargs)
+
+            if 'pit_id' in result:
+                pit_id = result['pit_id']
+            if total is None:
+                total = result['hits']['total']['value']
+
+            page = result['hits'].get('hits', [])
+            if page:
+                search_after = page[-1]['sort']
+                position += len(page)
+                if not skipping:
+                    hits.extend(page)
+
+            if len(page) < size:
+                break
+
+        if position < total:
+            put_pit_cursor(self.es, key, position,
+                           (pit_id, search_after, total))
+        else:
+            close_pit(self.es, pit_id)
+
+        return total, hits
+
     def esdoc2geojson(self, doc):
         """
         generate GeoJSON `dict` from ES document
@@ -424,3 +569,67 @@ class CPWElasticsearchProvider(MSCElasticsearchProvider):
             return feature_thinned
         else:
             return feature_
+
+
+def take_pit_cursor(key, offset):
+    """
+    take the point in time (PIT) cursor of a query at an offset, if any
+
+    :param key: `tuple` of data and query
+    :param offset: `int` of offset
+
+    :returns: `tuple` of PIT id, search_after values and number of
+              matching documents, or `None`
+    """
+
+    with PIT_CURSORS_LOCK:
+        cursor, expiry = PIT_CURSORS.pop((key, offset), (None, 0))
+
+    if expiry < time.monotonic():
+        return None
+
+    return cursor
+
+
+def put_pit_cursor(es, key, offset, cursor):
+    """
+    keep the point in time (PIT) cursor of a query at an offset, closing
+    the least recently stored PIT beyond `PIT_CURSORS_MAX`
+
+    :param es: `elasticsearch.Elasticsearch` client
+    :param key: `tuple` of data and query
+    :param offset: `int` of offset
+    :param cursor: `tuple` of PIT id, search_after values and number of
+                   matching documents
+
+    :returns: `None`
+    """
+
+    evicted = []
+
+    with PIT_CURSORS_LOCK:
+        PIT_CURSORS[(key, offset)] = (
+            cursor, time.monotonic() + PIT_CURSOR_TTL
+        )
+        while len(PIT_CURSORS) > PIT_CURSORS_MAX:
+            evicted.append(PIT_CURSORS.popitem(last=False)[1][0][0])
+
+    for pit_id in evicted:
+        close_pit(es, pit_id)
+
+
+def close_pit(es, pit_id):
+    """
+    close a point in time (PIT), which otherwise expires after
+    `PIT_KEEP_ALIVE`
+
+    :param es: `elasticsearch.Elasticsearch` client
+    :param pit_id: `str` of PIT id
+
+    :returns: `None`
+    """
+
+    try:
+        es.close_point_in_time(id=pit_id)
+    except Exception as err:
+        LOGGER.debug(f'Cannot close PIT: {err}')
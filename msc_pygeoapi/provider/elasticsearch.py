@@ -29,13 +29,32 @@
 
 from datetime import datetime
 import logging
+import threading
+import time
 
+from pygeoapi.provider.base import (
+    ProviderInvalidQueryError,
+    ProviderQueryError
+)
 from pygeoapi.provider.elasticsearch_ import ElasticsearchProvider
 
+from msc_pygeoapi.env import MSC_PYGEOAPI_ES_MAPPING_CACHE_TTL
+from msc_pygeoapi.provider.singleflight import SINGLE_FLIGHT, get_key
 from msc_pygeoapi.util import DATETIME_RFC3339_FMT
 
 LOGGER = logging.getLogger(__name__)
 
+# time_field formats by concrete indices and time_field, with their expiry
+# time: providers are instantiated per request, and keying on concrete
+# indices re-reads the mapping as soon as an alias is repointed
+TIMEFIELD_FORMATS = {}
+TIMEFIELD_FORMATS_LOCK = threading.Lock()
+
+# aggregations: ES stats metrics and date_histogram calendar intervals
+STATISTICS = ('count', 'min', 'max', 'avg', 'sum')
+CALENDAR_INTERVALS = ('hour', 'day', 'week', 'month', 'quarter', 'year')
+NUMERIC_TYPES = ('number', 'integer')
+
 
 class MSCElasticsearchProvider(ElasticsearchProvider):
     """MSC Elasticsearch Provider"""
@@ -51,6 +70,82 @@ class MSCElasticsearchProvider(ElasticsearchProvider):
 
         super().__init__(provider_def)
 
+        # current-state queries (e.g. `latest=true`) are answered from a
+        # latest-state index maintained by the loader, rather than from
+        # flags rewritten across historical indexes
+        self.latest_state = provider_def.get('latest_state', {})
+        self.timefield_key = None
+
+    def _get_latest_state_index(self, properties=[]):
+        """
+        Get the latest-state index answering a query, if the query filters
+        on current state
+
+        :param properties: list of tuples (name, value)
+
+        :returns: `str` of index name, or `None`
+        """
+
+        if not self.latest_state:
+            return None
+
+        for name, value in properties:
+            state = self.latest_state['properties'].get(name)
+            if state is not None and str(state).lower() == value.lower():
+                return self.latest_state['index']
+
+        return None
+
+    def _get_concrete_indices(self):
+        """
+        Resolve the indices behind index_name (e.g. an alias or pattern)
+
+        :returns: `tuple` of concrete index names
+        """
+
+        indices = self.es.indices.get_alias(index=self.index_name)
+
+        return tuple(sorted(indices.keys()))
+
+    def _get_cached_timefield_format(self):
+        """
+        Retrieve time_field format, from ES index mapping once every
+        `MSC_PYGEOAPI_ES_MAPPING_CACHE_TTL` seconds per set of concrete
+        indices. Missing formats are not cached.
+
+        :returns: `str` of time_field format
+        """
+
+        key = (self._get_concrete_indices(), self.time_field)
+        now = time.monotonic()
+        self.timefield_key = key
+
+        with TIMEFIELD_FORMATS_LOCK:
+            format_, expiry = TIMEFIELD_FORMATS.get(key, (None, 0))
+        if expiry > now:
+            return format_
+
+        format_ = self._get_timefield_format()
+
+        if format_ is not None:
+            with TIMEFIELD_FORMATS_LOCK:
+                TIMEFIELD_FORMATS[key] = (
+                    format_, now + MSC_PYGEOAPI_ES_MAPPING_CACHE_TTL
+                )
+
+        return format_
+
+    def _discard_timefield_format(self):
+        """
+        Discard cached time_field format (e.g. after a query error, as an
+        index mapping may have been updated)
+
+        :returns: `None`
+        """
+
+        with TIMEFIELD_FORMATS_LOCK:
+            TIMEFIELD_FORMATS.pop(self.timefield_key, None)
+
     def _get_timefield_format(self):
         """
         Retrieve time_field format from ES index mapping
@@ -132,34 +227,296 @@ class MSCElasticsearchProvider(ElasticsearchProvider):
             return (self._clamp_datetime(time, self.timefield_format),)
 
     def query(self, *args, **kwargs):
+        """
+        query Elasticsearch index, sharing the result of concurrent
+        identical queries of identically configured providers
+
+        :returns: dict of 0..n GeoJSON features
+        """
 
-        if kwargs.get('datetime_'):
-            self.timefield_format = self._get_timefield_format()
+        key = get_key(self.data, self.properties, self.id_field,
+                      self.time_field, self.latest_state, args, kwargs)
 
-            if not self.timefield_format:
-                LOGGER.warning(
-                    'Could not retrieve time_field format from index '
-                    'mapping. Skipping time clamping.'
-                )
-                return super().query(*args, **kwargs)
+        return SINGLE_FLIGHT.do(key, lambda: self._query(*args, **kwargs))
+
+    def _clamp_datetime_param(self, datetime_):
+        """
+        Clamp datetime query parameter to the time_field format of the index
+
+        :param datetime_: `str` datetime range or instant in RFC 3339 format
+
+        :returns: `str` of clamped datetime range or instant
+        """
+
+        self.timefield_format = self._get_cached_timefield_format()
+
+        if not self.timefield_format:
+            LOGGER.warning(
+                'Could not retrieve time_field format from index '
+                'mapping. Skipping time clamping.'
+            )
+            return datetime_
+
+        try:
+            clamped_datetime_range = self._get_clamped_datetime_range(
+                datetime_
+            )
+        except ValueError:
+            LOGGER.warning(
+                'Invalid RFC 3339 datetime format received. '
+                'Skipping time clamping.'
+            )
+            return datetime_
+
+        return '/'.join(
+            [
+                datetime_.strftime(DATETIME_RFC3339_FMT)
+                for datetime_ in clamped_datetime_range
+            ]
+        )
+
+    def _query(self, *args, **kwargs):
+
+        index_name = self.index_name
+        latest_index = self._get_latest_state_index(
+            kwargs.get('properties', [])
+        )
+        if latest_index is not None:
+            LOGGER.debug(f'Querying latest-state index {latest_index}')
+            self.index_name = latest_index
 
-            try:
-                clamped_datetime_range = self._get_clamped_datetime_range(
+        try:
+            if kwargs.get('datetime_'):
+                kwargs['datetime_'] = self._clamp_datetime_param(
                     kwargs['datetime_']
                 )
-                kwargs['datetime_'] = '/'.join(
-                    [
-                        datetime_.strftime(DATETIME_RFC3339_FMT)
-                        for datetime_ in clamped_datetime_range
-                    ]
+
+                try:
+                    return super().query(*args, **kwargs)
+                except Exception:
+                    self._discard_timefield_format()
+                    raise
+
+            return super().query(*args, **kwargs)
+        finally:
+            self.index_name = index_name
+
+    def _get_agg_property(self, property_name):
+        """
+        Get the ES field to aggregate a property on (keyword subfield
+        for text properties)
+
+        :param property_name: `str` of property name
+
+        :returns: `str` of ES field
+        """
+
+        field = self.fields[property_name]
+
+        if field['type'] == 'string' and field.get('format') != 'date':
+            return f'{self.mask_prop(property_name)}.raw'
+
+        return self.mask_prop(property_name)
+
+    def build_filters(self, bbox=[], datetime_=None, properties=[]):
+        """
+        Build ES query filters, as done for feature queries
+
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime_: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+
+        :returns: `list` of ES filter clauses
+        """
+
+        filters = []
+
+        if bbox:
+            minx, miny, maxx, maxy = bbox
+            filters.append({
+                'geo_shape': {
+                    'geometry': {
+                        'shape': {
+                            'type': 'envelope',
+                            'coordinates': [[minx, maxy], [maxx, miny]]
+                        },
+                        'relation': 'intersects'
+                    }
+                }
+            })
+
+        if datetime_ is not None:
+            if self.time_field is None:
+                msg = 'time_field not enabled for collection'
+                LOGGER.error(msg)
+                raise ProviderInvalidQueryError(msg)
+
+            time_field = self.mask_prop(self.time_field)
+            datetime_ = self._clamp_datetime_param(datetime_)
+
+            if '/' in datetime_:
+                time_begin, time_end = datetime_.split('/')
+                range_ = {}
+                if time_begin != '..':
+                    range_['gte'] = time_begin
+                if time_end != '..':
+                    range_['lte'] = time_end
+                filters.append({'range': {time_field: range_}})
+            else:
+                filters.append({'match': {time_field: datetime_}})
+
+        for name, value in properties:
+            match = {'query': value}
+            if '|' not in value:
+                match['minimum_should_match'] = '100%'
+            filters.append({'match': {self.mask_prop(name): match}})
+
+        return filters
+
+    def aggregate(self, bbox=[], datetime_=None, properties=[],
+                  group_by=None, interval=None, fields=[],
+                  statistics=STATISTICS, percents=[], limit=500):
+        """
+        Summarize numeric properties with ES aggregations, optionally
+        grouped by a property and/or a calendar interval of time_field
+
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime_: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param group_by: `str` of property to group by
+        :param interval: `str` of calendar interval (i.e. `day`, `month`)
+        :param fields: `list` of numeric properties to summarize
+        :param statistics: `list` of statistics (i.e. `min`, `avg`)
+        :param percents: `list` of percentiles to compute
+        :param limit: `int` of maximum number of groups
+
+        :returns: `dict` of result table (columns and rows)
+        """
+
+        for field in fields:
+            if self.fields.get(field, {}).get('type') not in NUMERIC_TYPES:
+                msg = f'Invalid numeric property: {field}'
+                LOGGER.error(msg)
+                raise ProviderInvalidQueryError(msg)
+
+        invalid = set(statistics) - set(STATISTICS)
+        if invalid:
+            msg = f'Invalid statistics: {sorted(invalid)}'
+            LOGGER.error(msg)
+            raise ProviderInvalidQueryError(msg)
+
+        if group_by is not None and group_by not in self.fields:
+            msg = f'Invalid group_by property: {group_by}'
+            LOGGER.error(msg)
+            raise ProviderInvalidQueryError(msg)
+
+        if interval is not None:
+            if interval not in CALENDAR_INTERVALS:
+                msg = f'Invalid interval: {interval}'
+                LOGGER.error(msg)
+                raise ProviderInvalidQueryError(msg)
+            if self.time_field is None:
+                msg = 'time_field not enabled for collection'
+                LOGGER.error(msg)
+                raise ProviderInvalidQueryError(msg)
+
+        metrics = {}
+        for field in fields:
+            if statistics:
+                metrics[f'{field}.stats'] = {
+                    'stats': {'field': self.mask_prop(field)}
+                }
+            if percents:
+                metrics[f'{field}.percentiles'] = {
+                    'percentiles': {
+                        'field': self.mask_prop(field),
+                        'percents': percents
+                    }
+                }
+
+        # nest metrics in date histogram and group buckets, if any
+        levels = []
+        aggs = metrics
+        if interval is not None:
+            levels.insert(0, 'interval')
+            aggs = {
+                'interval': {
+                    'date_histogram': {
+                        'field': self.mask_prop(self.time_field),
+                        'calendar_interval': interval,
+                        'min_doc_count': 1
+                    },
+                    'aggs': aggs
+                }
+            }
+        if group_by is not None:
+            levels.insert(0, group_by)
+            aggs = {
+                group_by: {
+                    'terms': {
+                        'field': self._get_agg_property(group_by),
+                        'size': limit,
+                        'order': {'_key': 'asc'}
+                    },
+                    'aggs': aggs
+                }
+            }
+
+        query = {
+            'size': 0,
+            'track_total_hits': True,
+            'query': {
+                'bool': {
+                    'filter': self.build_filters(bbox, datetime_, properties)
+                }
+            },
+            'aggs': aggs
+        }
+
+        LOGGER.debug(f'Aggregation query: {query}')
+
+        try:
+            response = self.es.search(index=self.index_name, **query)
+        except Exception as err:
+            msg = f'Aggregation query error: {err}'
+            LOGGER.error(msg)
+            raise ProviderQueryError(msg)
+
+        columns = levels + ['count']
+        for field in fields:
+            columns.extend(f'{field}_{stat}' for stat in statistics)
+            columns.extend(f'{field}_p{percent:g}' for percent in percents)
+
+        rows = []
+
+        def add_rows(bucket, depth=0, keys=[]):
+            if depth < len(levels):
+                for sub_bucket in bucket[levels[depth]]['buckets']:
+                    key = sub_bucket.get('key_as_string', sub_bucket['key'])
+                    add_rows(sub_bucket, depth + 1, keys + [key])
+                return
+
+            row = keys + [bucket['doc_count']]
+            for field in fields:
+                stats = bucket.get(f'{field}.stats', {})
+                row.extend(stats.get(stat) for stat in statistics)
+                values = bucket.get(f'{field}.percentiles', {}).get(
+                    'values', {}
                 )
-            except ValueError:
-                LOGGER.warning(
-                    'Invalid RFC 3339 datetime format received. '
-                    'Skipping time clamping.'
+                row.extend(
+                    values.get(str(float(percent))) for percent in percents
                 )
+            rows.append(row)
+
+        aggregations = response.get('aggregations', {})
+        aggregations['doc_count'] = response['hits']['total']['value']
+        add_rows(aggregations)
 
-        return super().query(*args, **kwargs)
+        return {
+            'numberMatched': aggregations['doc_count'],
+            'columns': columns,
+            'rows': rows
+        }
 
     def __repr__(self):
         return f'<MSCElasticsearchProvider> {self.data}'
@@ -0,0 +1,166 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import dataclasses
+import json
+import logging
+import threading
+
+try:
+    from babel import Locale
+except ImportError:
+    Locale = None
+
+from msc_pygeoapi.env import MSC_PYGEOAPI_QUERY_COALESCING
+from msc_pygeoapi.provider.cache import dumps, loads
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Call:
+    """in-flight call of a single-flight group"""
+
+    def __init__(self):
+        """
+        initializer
+
+        :returns: `msc_pygeoapi.provider.singleflight.Call`
+        """
+
+        self.done = threading.Event()
+        self.waiters = 0
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    single-flight group: concurrent calls with the same key wait for the
+    first one and share its result, rather than each querying the backend
+    """
+
+    def __init__(self, enabled=True):
+        """
+        initializer
+
+        :param enabled: `bool` of whether calls are coalesced
+
+        :returns: `msc_pygeoapi.provider.singleflight.SingleFlight`
+        """
+
+        self.enabled = enabled
+        self.calls = {}
+        self.lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key, function):
+        """
+        call a function, or wait for the in-flight call of the same key.
+
+        Results are JSON-serializable `dict`s, of which waiters get their
+        own copy (callers may modify results, e.g. to transform their CRS).
+
+        :param key: `str` of call key (`None` does not coalesce)
+        :param function: function without arguments returning a `dict`
+
+        :returns: `dict` of function result
+        """
+
+        if not self.enabled or key is None:
+            return function()
+
+        with self.lock:
+            call = self.calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self.calls[key] = Call()
+                leader = True
+
+        if not leader:
+            LOGGER.debug('Waiting for in-flight identical query')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return loads(call.value)
+
+        try:
+            result = function()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+                waiters = call.waiters
+
+            if waiters and call.error is None:
+                try:
+                    call.value = dumps(result)
+                except Exception as err:
+                    call.error = err
+            call.done.set()
+
+        return result
+
+    def __repr__(self):
+        return f'<SingleFlight> {len(self.calls)} in flight'
+
+
+def get_key(*parts):
+    """
+    build the single-flight key of a query
+
+    :param parts: JSON-serializable query parts (dataclasses, such as CRS
+                  transform specifications, objects with a `json` method,
+                  such as CQL filters, and locales of multilingual
+                  providers are serialized too)
+
+    :returns: `str` of key, or `None` if the query cannot be serialized
+    """
+
+    def default(obj):
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return [type(obj).__name__, dataclasses.asdict(obj)]
+        if Locale is not None and isinstance(obj, Locale):
+            return str(obj)
+        if callable(getattr(obj, 'json', None)):
+            return obj.json()
+        raise TypeError(f'{type(obj).__name__} is not serializable')
+
+    try:
+        return json.dumps(parts, sort_keys=True, default=default)
+    except (TypeError, ValueError) as err:
+        LOGGER.debug(f'Query not coalesced: {err}')
+        return None
+
+
+SINGLE_FLIGHT = SingleFlight(MSC_PYGEOAPI_QUERY_COALESCING)
@@ -28,9 +28,11 @@
 # =================================================================
 
 from datetime import datetime, date, time, timedelta
+from importlib import import_module
 import json
 import logging
 
+import click
 from parse import parse
 
 
@@ -55,6 +57,47 @@ def click_abort_if_false(ctx, param, value):
         ctx.abort()
 
 
+class LazyGroup(click.Group):
+    """
+    `click` group resolving its subcommands only when they are invoked,
+    so that the dependencies of unrelated commands are not imported
+    """
+
+    def __init__(self, *args, lazy_commands={}, **kwargs):
+        """
+        initializer
+
+        :param lazy_commands: `dict` of command names and (module, attribute)
+                              tuples of their `click` command objects
+
+        :returns: `msc_pygeoapi.util.LazyGroup`
+        """
+
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) |
+                      set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module, name = self.lazy_commands[cmd_name]
+
+            try:
+                command = getattr(import_module(module), name)
+            except ImportError as err:
+                LOGGER.info(
+                    f'msc-pygeoapi {self.name} {cmd_name} command unavailable')
+                msg = f'Import error when loading {module}.{name}: {err}'
+                LOGGER.debug(msg)
+                return None
+
+            self.add_command(command, cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+
 def json_pretty_print(data):
     """
     Pretty print a JSON serialization
@@ -193,6 +236,91 @@ def check_es_indexes_to_delete(
     return to_delete
 
 
+# replaces the latest-state document unless it is more recent than the
+# incoming one (files may arrive out of order)
+LATEST_STATE_SCRIPT = """
+def current = ctx._source.properties == null ?
+    null : ctx._source.properties[params.field];
+def incoming = params.doc.properties[params.field];
+if (current == null ||
+        (incoming != null && current.compareTo(incoming) <= 0)) {
+    ctx._source.clear();
+    ctx._source.putAll(params.doc);
+} else {
+    ctx.op = 'noop';
+}
+""".strip()
+
+
+def latest_state_action(index, id_, doc, field):
+    """
+    helper function to build the bulk API action maintaining the latest
+    document of an entity (e.g. a station) in a latest-state index, from
+    which current state is read rather than flagged with update_by_query
+    across historical indexes
+
+    :param index: `str` latest-state index name
+    :param id_: `str` identifier of entity
+    :param doc: `dict` of GeoJSON feature
+    :param field: `str` of property ordering documents (e.g. an ISO 8601
+                  datetime), the most recent document being kept
+
+    :returns: `dict` of bulk API update action
+    """
+
+    return {
+        '_op_type': 'update',
+        '_index': index,
+        '_id': id_,
+        'scripted_upsert': True,
+        'script': {
+            'source': LATEST_STATE_SCRIPT,
+            'lang': 'painless',
+            'params': {'doc': doc, 'field': field}
+        },
+        'upsert': {}
+    }
+
+
+def latest_set_actions(es, index, docs, query=None):
+    """
+    helper function to build the bulk API actions replacing a set of
+    documents of a latest-state index (e.g. the features of the latest
+    publication of a storm): documents of the set missing from `docs`
+    are deleted
+
+    :param es: `elasticsearch.Elasticsearch` client
+    :param index: `str` latest-state index name
+    :param docs: `dict` of document id to GeoJSON feature
+    :param query: `dict` of ES query selecting the set (default: all
+                  documents of the index)
+
+    :returns: `list` of bulk API actions
+    """
+
+    result = es.search(
+        index=index,
+        query=query or {'match_all': {}},
+        _source=False,
+        size=10000
+    )
+
+    actions = [{
+        '_op_type': 'delete',
+        '_index': index,
+        '_id': hit['_id']
+    } for hit in result['hits']['hits'] if hit['_id'] not in docs]
+
+    actions.extend({
+        '_op_type': 'index',
+        '_index': index,
+        '_id': id_,
+        '_source': doc
+    } for id_, doc in docs.items())
+
+    return actions
+
+
 def configure_es_connection(es, username, password, ignore_certs=False):
     """
     helper function to create an ES connection configuration dictionnary with
@@ -0,0 +1,139 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+# benchmark of bulk requests with and without HTTP compression, against a
+# local bulk API endpoint emulating a link of limited bandwidth, run with
+# python tests/benchmark_compression.py [documents] [bandwidth in Mbit/s]
+
+import glob
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import sys
+import threading
+import time
+
+from msc_pygeoapi.connector.elasticsearch_ import (
+    ElasticsearchConnector,
+    get_client
+)
+
+from util import get_test_file_path, read_json
+
+
+class BulkHandler(BaseHTTPRequestHandler):
+    """bulk API endpoint accepting all actions and counting wire bytes"""
+
+    bandwidth = 100e6
+    wire_bytes = 0
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = gzip.compress(data)
+            self.send_header('Content-Encoding', 'gzip')
+
+        BulkHandler.wire_bytes += len(data)
+        time.sleep(len(data) * 8 / self.bandwidth)
+
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('X-Elastic-Product', 'Elasticsearch')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.send({'version': {'number': '8.0.0'}})
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+
+        BulkHandler.wire_bytes += len(body)
+        time.sleep(len(body) * 8 / self.bandwidth)
+
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+
+        items = [
+            {'update': {'status': 200, 'result': 'created'}}
+            for line in body.splitlines()[::2]
+        ]
+        self.send({'took': 1, 'errors': False, 'items': items})
+
+    do_POST = do_PUT
+
+
+def get_actions(count):
+    """build bulk API actions from the swob fixtures"""
+
+    pattern = get_test_file_path('data/swob/*.geojson')
+    features = [read_json(f) for f in sorted(glob.glob(pattern))]
+
+    for i in range(count):
+        feature = features[i % len(features)]
+        yield {
+            '_op_type': 'update',
+            '_index': 'benchmark',
+            '_id': f'{feature["properties"]["id"]}-{i}',
+            'doc': feature,
+            'doc_as_upsert': True
+        }
+
+
+def main(count=20000, bandwidth=100):
+    BulkHandler.bandwidth = bandwidth * 1e6
+    server = ThreadingHTTPServer(('127.0.0.1', 0), BulkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}'
+
+    for http_compress in (False, True):
+        conn = ElasticsearchConnector({'url': url})
+        conn.Elasticsearch = get_client(url, http_compress=http_compress)
+
+        BulkHandler.wire_bytes = 0
+        start = time.monotonic()
+        conn.submit_elastic_package(get_actions(count), request_size=1000)
+        duration = time.monotonic() - start
+
+        print(
+            f'http_compress={http_compress!s:<5} '
+            f'{BulkHandler.wire_bytes / 1e6:>8.1f} MB on the wire '
+            f'{duration:>6.2f}s ({bandwidth} Mbit/s)'
+        )
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
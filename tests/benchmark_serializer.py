@@ -0,0 +1,92 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+# micro-benchmark of the serializers of bulk API actions, run with
+# python tests/benchmark_serializer.py [iterations]
+
+from datetime import datetime
+from decimal import Decimal
+import glob
+import sys
+import timeit
+
+import numpy as np
+
+from msc_pygeoapi.connector.elasticsearch_ import get_serializer
+
+from util import get_test_file_path, read_json
+
+
+def get_actions():
+    """
+    build bulk API actions from the swob fixtures, with the value types
+    found in loader documents (datetimes, Oracle decimals, numpy scalars)
+    """
+
+    actions = []
+
+    pattern = get_test_file_path('data/swob/*.geojson')
+    for filename in sorted(glob.glob(pattern)):
+        feature = read_json(filename)
+        properties = feature['properties']
+        properties['obs_date'] = datetime(2020, 7, 14, 3)
+        properties['elevation'] = Decimal('1234.5')
+        properties['rank'] = np.float32(0.5)
+
+        actions.append({
+            '_op_type': 'update',
+            '_index': 'benchmark',
+            '_id': properties['id'],
+            'doc': feature,
+            'doc_as_upsert': True
+        })
+
+    return actions
+
+
+def main(iterations=200):
+    actions = get_actions()
+
+    for name in ('json', 'orjson'):
+        serializer = get_serializer(name)
+        nbytes = sum(len(serializer.dumps(action)) for action in actions)
+        duration = timeit.timeit(
+            lambda: [serializer.dumps(action) for action in actions],
+            number=iterations
+        )
+        docs = len(actions) * iterations
+
+        print(
+            f'{type(serializer).__name__:<16} {docs / duration:>10.0f} docs/s '
+            f'{nbytes * iterations / duration / 1e6:>8.1f} MB/s'
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,114 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from msc_pygeoapi.util import LazyGroup
+
+# optional dependencies of individual commands, which must not be imported
+# when starting the CLI
+HEAVY_MODULES = [
+    'cx_Oracle',
+    'elasticsearch',
+    'lxml',
+    'osgeo',
+    'rasterio',
+    'sqlalchemy',
+    'xarray'
+]
+
+# generous budget for the cumulative import time of the CLI (microseconds)
+IMPORT_TIME_BUDGET = 1000000
+
+
+def importtime(statement):
+    """
+    Run a Python statement with `-X importtime`
+
+    :param statement: Python statement
+
+    :returns: `dict` of cumulative import time (microseconds) per module
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, check=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line.split('|')
+        try:
+            times[fields[2].strip()] = int(fields[1])
+        except ValueError:  # header line
+            continue
+
+    return times
+
+
+def test_cli_importtime():
+    """Test that starting the CLI does not import command dependencies"""
+
+    times = importtime('import msc_pygeoapi')
+
+    imported = {module.split('.')[0] for module in times}
+    assert imported.isdisjoint(HEAVY_MODULES)
+
+    assert times['msc_pygeoapi'] < IMPORT_TIME_BUDGET
+
+
+def test_lazy_group():
+    """Test that subcommands are resolved when invoked"""
+
+    @click.group(cls=LazyGroup, lazy_commands={
+        'route': ('msc_pygeoapi.handler', 'route'),
+        'missing': ('msc_pygeoapi.missing', 'missing')
+    })
+    def group():
+        pass
+
+    assert group.commands == {}
+    assert group.list_commands(None) == ['missing', 'route']
+
+    runner = CliRunner()
+    result = runner.invoke(group, ['--help'])
+    assert 'route' in result.output
+    assert 'missing' not in result.output
+
+    result = runner.invoke(group, ['missing'])
+    assert result.exit_code != 0
+
+    assert list(group.commands) == ['route']
@@ -0,0 +1,550 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from datetime import datetime
+from decimal import Decimal
+import json
+import time
+
+from elasticsearch import ConnectionTimeout, NotFoundError
+import numpy as np
+import pytest
+
+from msc_pygeoapi.connector import elasticsearch_
+from msc_pygeoapi.connector.elasticsearch_ import (
+    AsyncElasticsearchConnector,
+    BULK_OPTIONS,
+    BulkRetry,
+    BulkSummary,
+    ChunkSizer,
+    ElasticsearchConnector,
+    TemplateCache,
+    TimePartitionedIndex,
+    get_client,
+    get_serializer,
+    get_template_fingerprint
+)
+
+
+def test_get_client_is_shared():
+    """Test that clients are shared per cluster and credentials"""
+
+    client = get_client('http://localhost:9200')
+
+    assert get_client('localhost:9200') is client
+    assert ElasticsearchConnector(
+        {'url': 'http://localhost:9200'}).Elasticsearch is client
+
+    assert get_client('http://localhost:9200', auth=('u', 'p')) is not client
+    assert get_client('http://localhost:9200', verify_certs=False) \
+        is not client
+
+
+def test_get_client_timeout():
+    """Test that per-call timeouts reuse the pooled transport"""
+
+    client = get_client('http://localhost:9200')
+    client_ = get_client('http://localhost:9200', timeout=5)
+
+    assert client_ is not client
+    assert client_.transport is client.transport
+
+
+def test_async_connector_serial(monkeypatch):
+    """Test that the async connector sends serially unless asked not to"""
+
+    calls = []
+
+    def submit_elastic_packages(self, packages, **kwargs):
+        calls.append(kwargs['thread_count'])
+        return [True] * len(packages)
+
+    async def async_submit_elastic_packages(packages, **kwargs):
+        calls.append(('async', kwargs['max_inflight']))
+        return [True] * len(packages)
+
+    monkeypatch.setattr(ElasticsearchConnector, 'submit_elastic_packages',
+                        submit_elastic_packages)
+
+    conn = AsyncElasticsearchConnector({'url': 'http://localhost:9200'})
+    monkeypatch.setattr(conn, 'async_submit_elastic_packages',
+                        async_submit_elastic_packages)
+
+    # without aiohttp, requests go through the synchronous connector
+    conn.AsyncElasticsearch = None
+    assert conn.submit_elastic_package([], thread_count=4)
+    assert calls == [4]
+
+    conn.AsyncElasticsearch = object()
+    assert conn.submit_elastic_package([])
+    assert conn.submit_elastic_package([], thread_count=4)
+    assert calls == [4, 1, ('async', 4)]
+
+    conn.AsyncElasticsearch = None
+    conn.close()
+
+
+def test_async_connector_raises():
+    """Test that failed async bulk requests raise, as synchronous ones do"""
+
+    class FailingClient:
+        requests = 0
+
+        def options(self, **kwargs):
+            return self
+
+        async def bulk(self, **kwargs):
+            FailingClient.requests += 1
+            raise RuntimeError('mapping error')
+
+    conn = AsyncElasticsearchConnector({'url': 'http://localhost:9200'})
+    conn.AsyncElasticsearch = FailingClient()
+
+    packages = [[{'_index': 'foo', '_id': i, 'value': i}] for i in range(3)]
+
+    with pytest.raises(RuntimeError):
+        conn.submit_elastic_packages(packages, request_size=1,
+                                     thread_count=2)
+
+    # no request is sent once a request has failed
+    assert FailingClient.requests < len(packages)
+
+    conn.AsyncElasticsearch = None
+    conn.close()
+
+
+def test_chunk_sizer():
+    """Test that bulk chunk size adapts to latency and rejections"""
+
+    sizer = ChunkSizer(1000, min_size=100, target_latency=2)
+    assert sizer.size == 1000
+
+    assert sizer.observe(1000, 1.0) == 1000
+    assert sizer.observe(1000, 6.0) == 333
+    assert sizer.observe(333, 1.0) == 333
+    assert sizer.observe(333, 0.5) == 499
+    assert sizer.observe(499, 0.5, rejected=True) == 249
+    assert sizer.observe(249, 60) == 100
+
+    for _ in range(10):
+        sizer.observe(sizer.size, 0.1)
+    assert sizer.size == 1000
+
+
+def test_chunk_actions():
+    """Test that bulk requests are bounded by document count and size"""
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+    packages = [
+        [{'_index': 'a', '_id': i, 'v': 'x' * 100} for i in range(5)],
+        [{'_index': 'b', '_id': i, 'v': 'x' * 100} for i in range(5)]
+    ]
+
+    chunks = list(conn.chunk_actions(packages, ChunkSizer(4), 10485760))
+    assert [owners for owners, _, _ in chunks] == [
+        [0, 0, 0, 0], [0, 1, 1, 1], [1, 1]
+    ]
+    assert all(len(lines) == 2
+               for _, actions, _ in chunks for lines in actions)
+
+    chunks = list(conn.chunk_actions(packages, ChunkSizer(4), 400))
+    assert all(nbytes <= 400 for _, _, nbytes in chunks)
+    assert sum(len(owners) for owners, _, _ in chunks) == 10
+
+
+def test_bulk_transport_retries():
+    """Test that bulk requests are not replayed by the transport"""
+
+    class RecordingClient:
+        def __init__(self, client):
+            self.transport = client.transport
+            self.options_ = []
+
+        def options(self, **kwargs):
+            self.options_.append(kwargs)
+            return self
+
+        def bulk(self, operations, **kwargs):
+            item = {'index': {'status': 201, 'result': 'created'}}
+            return {'items': [item] * (len(operations) // 2)}
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+    conn.Elasticsearch = RecordingClient(conn.Elasticsearch)
+
+    assert conn.submit_elastic_package([{'_index': 'a', '_id': 1, 'v': 1}])
+    assert conn.Elasticsearch.options_ == [BULK_OPTIONS]
+    assert BULK_OPTIONS['max_retries'] == 0
+    assert BULK_OPTIONS['retry_on_status'] == ()
+
+
+def test_bulk_load_forcemerge():
+    """Test that a timed out force-merge is not re-issued"""
+
+    class FakeIndices:
+        def __init__(self):
+            self.forcemerges = 0
+            self.settings = []
+
+        def exists(self, index):
+            return True
+
+        def get_settings(self, index, **kwargs):
+            return {index: {'settings': {}}}
+
+        def put_settings(self, index, settings):
+            self.settings.append(settings)
+
+        def refresh(self, index):
+            pass
+
+        def forcemerge(self, **kwargs):
+            self.forcemerges += 1
+            raise ConnectionTimeout('timed out')
+
+    class FakeClient:
+        def __init__(self):
+            self.indices = FakeIndices()
+            self.options_ = []
+
+        def options(self, **kwargs):
+            self.options_.append(kwargs)
+            return self
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+    conn.Elasticsearch = FakeClient()
+
+    with conn.bulk_load('climate_public_daily_data'):
+        pass
+
+    assert conn.Elasticsearch.indices.forcemerges == 1
+    assert conn.Elasticsearch.options_[0]['max_retries'] == 0
+    # settings are relaxed, then restored
+    assert len(conn.Elasticsearch.indices.settings) == 2
+
+
+def test_bulk_retry():
+    """Test that bulk retries back off within a budget"""
+
+    retry = BulkRetry(max_retries=3, initial_backoff=1, max_backoff=3,
+                      budget=4)
+
+    assert 0 <= retry.take(0) <= 1
+    assert 0 <= retry.take(5) <= 3
+    assert retry.allow(2)
+    assert not retry.allow(3)
+
+    retry.take(0)
+    retry.take(0)
+    assert not retry.allow(0)
+
+    assert BulkRetry.retryable(ConnectionTimeout('timed out'))
+    assert not BulkRetry.retryable(ValueError('invalid'))
+
+
+def test_bulk_summary_errors():
+    """Test that bulk errors are counted by type with bounded examples"""
+
+    def item(status, error_type=None):
+        if error_type is None:
+            return {'index': {'status': status, 'result': 'created'}}
+        return {'index': {'status': status, 'error': {'type': error_type}}}
+
+    summary = BulkSummary(3)
+    response = {'items': [
+        item(201), item(429, 'es_rejected_execution_exception'),
+        item(400, 'mapper_parsing_exception'), item(201)
+    ]}
+
+    assert summary.add_items([0, 1, 1, 2], response, retry=True) == [1]
+    assert summary.errors == {'mapper_parsing_exception': 1}
+
+    for i in range(1000):
+        summary.add(2, False, item(400, f'error_{i % 10}'))
+
+    assert sum(summary.errors.values()) == 1001
+    assert len(summary.error_samples) == 5
+    assert summary.report() == [True, False, False]
+
+
+def test_handle_bulk_response():
+    """Test that bulk outcomes select the actions to re-submit"""
+
+    summary = BulkSummary(2)
+    sizer = ChunkSizer(100, 10)
+    retry = BulkRetry(max_retries=1, initial_backoff=0, budget=10)
+    actions = [['{"index":{}}', '{"a":1}'], ['{"index":{}}', '{"b":2}']]
+    response = {'items': [
+        {'index': {'status': 201, 'result': 'created'}},
+        {'index': {'status': 429}}
+    ]}
+
+    owners, retried, nbytes = ElasticsearchConnector.handle_bulk_response(
+        [0, 1], actions, 0, response, 0.1, summary, sizer, retry, 0
+    )
+    assert owners == [1]
+    assert retried == [actions[1]]
+    assert nbytes == sum(len(line) + 1 for line in actions[1])
+    assert summary.retries == 1
+
+    # retries exhausted: rejected actions are recorded as failed
+    rejected = {'items': response['items'][1:]}
+    assert ElasticsearchConnector.handle_bulk_response(
+        owners, retried, nbytes, rejected, 0.1, summary, sizer, retry, 1
+    ) is None
+    assert summary.report() == [True, False]
+
+    # failed requests are re-submitted whole, or raised
+    err = ConnectionTimeout('timed out')
+    assert ElasticsearchConnector.handle_bulk_response(
+        [0, 1], actions, 0, err, 0, summary, sizer, retry, 0
+    )[0] == [0, 1]
+    with pytest.raises(ConnectionTimeout):
+        ElasticsearchConnector.handle_bulk_response(
+            [0, 1], actions, 0, err, 0, summary, sizer, retry, 1
+        )
+
+
+def test_serializers():
+    """Test that serializers handle the value types of loader documents"""
+
+    doc = {
+        'date': datetime(2020, 7, 14, 3),
+        'value': Decimal('1.5'),
+        'rank': np.int64(3),
+        'level': np.float32(0.25)
+    }
+    expected = {
+        'date': '2020-07-14T03:00:00',
+        'value': 1.5,
+        'rank': 3,
+        'level': 0.25
+    }
+
+    for name in ('json', 'orjson'):
+        assert json.loads(get_serializer(name).dumps(doc)) == expected
+
+
+def test_template_fingerprint():
+    """Test that template fingerprints follow content, not key order"""
+
+    settings = {'index_patterns': ['a*'], 'mappings': {'a': 1, 'b': 2}}
+
+    assert get_template_fingerprint(settings) == get_template_fingerprint(
+        {'mappings': {'b': 2, 'a': 1}, 'index_patterns': ['a*']})
+    assert get_template_fingerprint(settings) != get_template_fingerprint(
+        {'index_patterns': ['b*'], 'mappings': {'a': 1, 'b': 2}})
+
+
+def test_template_cache(tmp_path):
+    """Test that template fingerprints expire and persist"""
+
+    filepath = str(tmp_path / 'templates.json')
+
+    cache = TemplateCache(ttl=60, filepath=filepath)
+    cache.set('http://localhost:9200/a', 'abc')
+    cache.entries['http://localhost:9200/b'] = ('def', time.time() - 120)
+    cache.save()
+
+    assert cache.get('http://localhost:9200/a') == 'abc'
+    assert cache.get('http://localhost:9200/b') is None
+
+    cache_ = TemplateCache(ttl=60, filepath=filepath)
+    assert cache_.get('http://localhost:9200/a') == 'abc'
+    assert 'http://localhost:9200/b' not in cache_.entries
+
+    cache_.discard('http://localhost:9200/a')
+    assert TemplateCache(ttl=60, filepath=filepath).entries == {}
+
+
+def test_template_cache_merge(tmp_path):
+    """Test that processes sharing a template cache file keep entries"""
+
+    filepath = str(tmp_path / 'templates.json')
+
+    cache_a = TemplateCache(ttl=60, filepath=filepath)
+    cache_b = TemplateCache(ttl=60, filepath=filepath)
+
+    cache_a.set('http://localhost:9200/a', 'abc')
+    cache_b.set('http://localhost:9200/b', 'def')
+
+    cache = TemplateCache(ttl=60, filepath=filepath)
+    assert cache.get('http://localhost:9200/a') == 'abc'
+    assert cache.get('http://localhost:9200/b') == 'def'
+
+    cache_b.discard('http://localhost:9200/b')
+    cache_a.set('http://localhost:9200/c', 'ghi')
+
+    cache = TemplateCache(ttl=60, filepath=filepath)
+    assert cache.get('http://localhost:9200/b') is None
+    assert cache.get('http://localhost:9200/c') == 'ghi'
+
+
+def test_create_template(monkeypatch):
+    """Test that existing templates are only replaced when overwriting"""
+
+    class FakeIndices:
+        def __init__(self):
+            self.templates = {}
+            self.gets = 0
+
+        def get_template(self, name, filter_path):
+            self.gets += 1
+            if name not in self.templates:
+                raise NotFoundError('not found', meta=None, body=None)
+            version = self.templates[name].get('version')
+            return {name: {'version': version}} if version else {}
+
+        def put_template(self, name, body):
+            self.templates[name] = body
+
+    class FakeClient:
+        def __init__(self):
+            self.indices = FakeIndices()
+
+    monkeypatch.setattr(elasticsearch_, 'TEMPLATES', TemplateCache())
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+    conn.Elasticsearch = FakeClient()
+    indices = conn.Elasticsearch.indices
+
+    # templates predating fingerprints are kept unless overwriting
+    indices.templates['a'] = {'mappings': {'old': 1}}
+    assert not conn.create_template('a', {'mappings': {'new': 1}})
+    assert indices.templates['a'] == {'mappings': {'old': 1}}
+    assert not conn.create_template('a', {'mappings': {'new': 1}})
+    assert indices.gets == 1
+
+    assert conn.create_template('a', {'mappings': {'new': 1}},
+                                overwrite=True)
+    assert indices.templates['a']['mappings'] == {'new': 1}
+
+    # unchanged templates are not written again when overwriting
+    assert not conn.create_template('a', {'mappings': {'new': 1}},
+                                    overwrite=True)
+    assert indices.gets == 2
+
+    assert conn.create_template('b', {'mappings': {}})
+    assert 'b' in indices.templates
+
+
+def test_time_partitioned_index():
+    """Test partition naming and expiry of time-partitioned indexes"""
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+
+    daily = TimePartitionedIndex(conn, 'cap_alerts', {})
+    assert daily.partition(datetime(2024, 1, 2, 13, 30)) == \
+        'cap_alerts.2024-01-02'
+
+    partitions = ['cap_alerts.2024-01-01', 'cap_alerts.2024-01-02',
+                  'cap_alerts.2024-01-03', 'cap_alerts.foo']
+    assert daily.expired(datetime(2024, 1, 3), partitions) == \
+        ['cap_alerts.2024-01-01', 'cap_alerts.2024-01-02']
+
+    hourly = TimePartitionedIndex(conn, 'radar', {}, interval='hour')
+    assert hourly.partition(datetime(2024, 1, 2, 13, 30)) == \
+        'radar.2024-01-02t13'
+    assert hourly.expired(
+        datetime(2024, 1, 2, 13, 59),
+        ['radar.2024-01-02t12', 'radar.2024-01-02t13']
+    ) == ['radar.2024-01-02t12']
+
+
+def test_time_partitioned_index_delete_stale(monkeypatch):
+    """Test that copies of documents in other partitions are deleted"""
+
+    class FakeClient:
+        def __init__(self, docs):
+            self.docs = docs
+            self.searches = []
+
+        def search(self, index, query, _source, size):
+            self.searches.append(index)
+            ids = query['ids']['values']
+            return {'hits': {'hits': [
+                {'_index': index_, '_id': id_}
+                for index_, id_ in self.docs if id_ in ids
+            ]}}
+
+        def delete(self, index, id):
+            self.docs.remove((index, id))
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+    conn.Elasticsearch = FakeClient([
+        ('cap_alerts.2024-01-01', 'a'), ('cap_alerts.2024-01-02', 'b'),
+        ('cap_alerts.2024-01-01', 'c')
+    ])
+
+    index = TimePartitionedIndex(conn, 'cap_alerts', {})
+    assert index.delete_stale({}) == []
+    assert conn.Elasticsearch.searches == []
+
+    assert index.delete_stale({
+        'a': 'cap_alerts.2024-01-02', 'b': 'cap_alerts.2024-01-02'
+    }) == [('cap_alerts.2024-01-01', 'a')]
+    assert conn.Elasticsearch.searches == ['cap_alerts.*']
+    assert conn.Elasticsearch.docs == [
+        ('cap_alerts.2024-01-02', 'b'), ('cap_alerts.2024-01-01', 'c')
+    ]
+
+    # ids are looked up in chunks
+    monkeypatch.setattr(elasticsearch_, 'STALE_CHUNK_SIZE', 1)
+    assert index.delete_stale({
+        'b': 'cap_alerts.2024-01-03', 'c': 'cap_alerts.2024-01-01'
+    }) == [('cap_alerts.2024-01-02', 'b')]
+    assert len(conn.Elasticsearch.searches) == 3
+
+
+def test_time_partitioned_index_setup():
+    """Test that an index holding the alias name fails setup"""
+
+    class FakeIndices:
+        def __init__(self, legacy):
+            self.legacy = legacy
+
+        def exists(self, index):
+            return self.legacy
+
+        def exists_alias(self, name):
+            return False
+
+    class FakeClient:
+        def __init__(self, legacy):
+            self.indices = FakeIndices(legacy)
+
+    conn = ElasticsearchConnector({'url': 'http://localhost:9200'})
+    conn.create_template = lambda name, settings: True
+    index = TimePartitionedIndex(conn, 'cap_alerts', {})
+
+    conn.Elasticsearch = FakeClient(legacy=False)
+    assert index.setup()
+
+    conn.Elasticsearch = FakeClient(legacy=True)
+    with pytest.raises(RuntimeError):
+        index.setup()
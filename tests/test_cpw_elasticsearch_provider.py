@@ -0,0 +1,108 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import pytest
+
+# pygeoapi's Elasticsearch provider requires GDAL
+pytest.importorskip('osgeo')
+
+from msc_pygeoapi.provider import cpw_elasticsearch  # noqa
+from msc_pygeoapi.provider.cpw_elasticsearch import (  # noqa
+    CPWElasticsearchProvider
+)
+
+
+class Elasticsearch:
+    """Elasticsearch client paginating with PIT over numbered documents"""
+
+    def __init__(self, count):
+        self.count = count
+        self.pits = set()
+        self.searches = 0
+        self.documents = 0
+
+    def open_point_in_time(self, index, keep_alive):
+        pit_id = f'pit{len(self.pits)}'
+        self.pits.add(pit_id)
+        return {'id': pit_id}
+
+    def close_point_in_time(self, id):
+        self.pits.discard(id)
+
+    def search(self, pit, sort, size, search_after=None, _source=True,
+               track_total_hits=True, filter_path=None, **kwargs):
+        assert pit['id'] in self.pits
+        self.searches += 1
+
+        start = 0 if search_after is None else search_after[0] + 1
+        hits = [{'_id': str(i), 'sort': [i]}
+                for i in range(start, min(start + size, self.count))]
+        if _source is not False:
+            self.documents += len(hits)
+            for hit in hits:
+                hit['_source'] = {'properties': {}}
+
+        result = {'pit_id': pit['id'], 'hits': {'hits': hits}}
+        if track_total_hits:
+            result['hits']['total'] = {'value': self.count}
+        return result
+
+
+class Provider(CPWElasticsearchProvider):
+    """Provider querying a fake Elasticsearch client"""
+
+    def __init__(self, es):
+        self.data = 'http://localhost:9200/citypageweather_realtime'
+        self.index_name = 'citypageweather_realtime'
+        self.es = es
+
+
+def test_search_pit():
+    """Test that deep pages are walked with PIT and search_after"""
+
+    cpw_elasticsearch.PIT_CURSORS.clear()
+    es = Elasticsearch(25000)
+    provider = Provider(es)
+
+    total, hits = provider.search_pit({'query': {}}, 20000, 10)
+    assert total == 25000
+    assert [hit['_id'] for hit in hits] == [str(i) for i in range(20000, 20010)]  # noqa
+    assert es.documents == 10
+    assert es.searches == 3
+
+    # next page continues from the cursor of the previous one
+    total, hits = provider.search_pit({'query': {}}, 20010, 10)
+    assert total == 25000
+    assert hits[0]['_id'] == '20010'
+    assert es.searches == 4
+
+    # last page closes its PIT
+    total, hits = provider.search_pit({'query': {}}, 24995, 10)
+    assert len(hits) == 5
+    assert len(es.pits) == 1
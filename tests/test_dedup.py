@@ -0,0 +1,79 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import time
+
+from msc_pygeoapi.handler.dedup import DedupCache, get_key
+
+IDENTITY = {'method': 'sha512', 'value': 'abc123'}
+
+
+def test_get_key():
+    """Test that cache keys combine path and content checksum"""
+
+    key = get_key('/data/file.xml', IDENTITY)
+    assert key == '/data/file.xml:sha512:abc123'
+    assert key != get_key('/data/file.xml', {**IDENTITY, 'value': 'def'})
+
+    assert get_key('/data/file.xml', None) is None
+    assert get_key('/data/file.xml', {'method': 'cod', 'value': 'sha512'}) \
+        is None
+
+
+def test_lru_and_ttl(monkeypatch):
+    """Test that entries are evicted by size and expire by age"""
+
+    cache = DedupCache(max_entries=2, ttl=60)
+
+    cache.add('a')
+    cache.add('b')
+    assert cache.seen('a')
+    cache.add('c')
+
+    assert cache.seen('a')
+    assert not cache.seen('b')
+    assert cache.seen('c')
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    assert not cache.seen('a')
+    assert cache.entries == {'c': cache.entries['c']}
+
+
+def test_persistence(tmp_path):
+    """Test that entries are restored across restarts"""
+
+    filepath = str(tmp_path / 'dedup.json')
+
+    cache = DedupCache(filepath=filepath)
+    cache.add('a')
+    assert cache.save()
+
+    assert DedupCache(filepath=filepath).seen('a')
+    assert not DedupCache(filepath=filepath, ttl=-1).seen('a')
@@ -0,0 +1,227 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import pytest
+
+# pygeoapi's Elasticsearch provider requires GDAL
+pytest.importorskip('osgeo')
+
+from msc_pygeoapi.provider.elasticsearch import MSCElasticsearchProvider  # noqa
+
+
+class Provider(MSCElasticsearchProvider):
+    """Provider reading a time_field format without Elasticsearch"""
+
+    def __init__(self, index_name, time_field, format_, indices=None):
+        self.data = f'http://localhost:9200/{index_name}'
+        self.index_name = index_name
+        self.time_field = time_field
+        self.timefield_key = None
+        self.format_ = format_
+        self.concrete_indices = indices or [index_name]
+        self.lookups = 0
+        self.es = self
+        self.indices = self
+
+    def get_alias(self, index):
+        return {name: {'aliases': {}} for name in self.concrete_indices}
+
+    def _get_timefield_format(self):
+        self.lookups += 1
+        return self.format_
+
+
+def test_timefield_format_cache():
+    """Test that time_field formats are shared by providers until reset"""
+
+    provider = Provider('test_a', 'date', 'yyyy-MM', ['test_a.1'])
+    assert provider._get_cached_timefield_format() == 'yyyy-MM'
+
+    provider_ = Provider('test_a', 'date', 'yyyy', ['test_a.1'])
+    assert provider_._get_cached_timefield_format() == 'yyyy-MM'
+    assert provider_.lookups == 0
+
+    provider_._discard_timefield_format()
+    assert provider_._get_cached_timefield_format() == 'yyyy'
+    assert provider_.lookups == 1
+
+    # alias repointed to an index with another mapping
+    repointed = Provider('test_a', 'date', 'yyyy-MM-dd', ['test_a.2'])
+    assert repointed._get_cached_timefield_format() == 'yyyy-MM-dd'
+    assert repointed.lookups == 1
+
+    # missing formats are not cached
+    other = Provider('test_b', 'date', None)
+    assert other._get_cached_timefield_format() is None
+    assert other._get_cached_timefield_format() is None
+    assert other.lookups == 2
+
+
+class AggregationProvider(Provider):
+    """Provider recording aggregation queries without Elasticsearch"""
+
+    def __init__(self, response):
+        super().__init__('test_c', 'LOCAL_DATE', None)
+        self._fields = {
+            'CLIMATE_IDENTIFIER': {'type': 'string'},
+            'LOCAL_DATE': {'type': 'string', 'format': 'date'},
+            'MAX_TEMPERATURE': {'type': 'number', 'format': 'float'}
+        }
+        self.response = response
+        self.queries = []
+
+    def search(self, index, **query):
+        self.queries.append(query)
+        return self.response
+
+
+def test_aggregate():
+    """Test that aggregations are filtered and returned as a table"""
+
+    def bucket(key, count, max_):
+        return {
+            'key': key,
+            'doc_count': count,
+            'interval': {
+                'buckets': [{
+                    'key': 0,
+                    'key_as_string': '2020-01-01 00:00:00',
+                    'doc_count': count,
+                    'MAX_TEMPERATURE.stats': {'max': max_, 'avg': 1.0},
+                    'MAX_TEMPERATURE.percentiles': {
+                        'values': {'50.0': 0.5}
+                    }
+                }]
+            }
+        }
+
+    provider = AggregationProvider({
+        'hits': {'total': {'value': 3}},
+        'aggregations': {
+            'CLIMATE_IDENTIFIER': {
+                'buckets': [bucket('1', 1, 2.5), bucket('2', 2, 3.5)]
+            }
+        }
+    })
+
+    result = provider.aggregate(
+        bbox=[-80, 40, -70, 50],
+        datetime_='2020-01-01T00:00:00Z/..',
+        properties=[('CLIMATE_IDENTIFIER', '1|2')],
+        group_by='CLIMATE_IDENTIFIER',
+        interval='month',
+        fields=['MAX_TEMPERATURE'],
+        statistics=['max', 'avg'],
+        percents=[50]
+    )
+
+    assert result == {
+        'numberMatched': 3,
+        'columns': [
+            'CLIMATE_IDENTIFIER', 'interval', 'count',
+            'MAX_TEMPERATURE_max', 'MAX_TEMPERATURE_avg',
+            'MAX_TEMPERATURE_p50'
+        ],
+        'rows': [
+            ['1', '2020-01-01 00:00:00', 1, 2.5, 1.0, 0.5],
+            ['2', '2020-01-01 00:00:00', 2, 3.5, 1.0, 0.5]
+        ]
+    }
+
+    query = provider.queries[0]
+    assert query['size'] == 0
+    filters = query['query']['bool']['filter']
+    assert filters[1] == {
+        'range': {'properties.LOCAL_DATE': {'gte': '2020-01-01T00:00:00Z'}}
+    }
+    assert 'minimum_should_match' not in (
+        filters[2]['match']['properties.CLIMATE_IDENTIFIER']
+    )
+    terms = query['aggs']['CLIMATE_IDENTIFIER']
+    assert terms['terms']['field'] == 'properties.CLIMATE_IDENTIFIER.raw'
+    histogram = terms['aggs']['interval']['date_histogram']
+    assert histogram['calendar_interval'] == 'month'
+
+
+def test_aggregate_invalid():
+    """Test that non-numeric fields and unknown statistics are rejected"""
+
+    from pygeoapi.provider.base import ProviderInvalidQueryError
+
+    provider = AggregationProvider({})
+
+    with pytest.raises(ProviderInvalidQueryError):
+        provider.aggregate(fields=['CLIMATE_IDENTIFIER'])
+
+    with pytest.raises(ProviderInvalidQueryError):
+        provider.aggregate(fields=['MAX_TEMPERATURE'], statistics=['median'])
+
+    assert provider.queries == []
+
+
+def test_latest_state_index():
+    """Test that current-state queries read the latest-state index"""
+
+    provider = Provider('metnotes*', 'date', None)
+    provider.latest_state = {}
+    assert provider._get_latest_state_index(
+        [('metnote_status', 'active')]) is None
+
+    provider.latest_state = {
+        'index': 'latest-metnotes',
+        'properties': {'metnote_status': 'active', 'latest': True}
+    }
+    assert provider._get_latest_state_index(
+        [('metnote_status', 'active')]) == 'latest-metnotes'
+    assert provider._get_latest_state_index(
+        [('id', '1'), ('latest', 'true')]) == 'latest-metnotes'
+    assert provider._get_latest_state_index(
+        [('metnote_status', 'inactive')]) is None
+    assert provider._get_latest_state_index([]) is None
+
+
+def test_query_key(monkeypatch):
+    """Test that queries are only coalesced across identical providers"""
+
+    from msc_pygeoapi.provider import elasticsearch
+
+    keys = []
+    monkeypatch.setattr(elasticsearch.SINGLE_FLIGHT, 'do',
+                        lambda key, fn: keys.append(key))
+
+    for properties in (['a'], ['a'], ['b']):
+        provider = Provider('test_d', 'date', None)
+        provider.properties = properties
+        provider.id_field = 'id'
+        provider.latest_state = {}
+        provider.query(limit=10)
+
+    assert keys[0] is not None
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
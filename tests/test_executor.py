@@ -0,0 +1,67 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import threading
+import time
+
+from msc_pygeoapi.handler.executor import KeyedThreadPool
+
+
+def test_ordering_per_key():
+    """Test that tasks sharing a key run sequentially in order"""
+
+    pool = KeyedThreadPool(4)
+    results = {'a': [], 'b': []}
+
+    def task(key, value):
+        time.sleep(0.001 * (5 - value))
+        results[key].append(value)
+
+    futures = [
+        pool.submit(key, task, key, value)
+        for value in range(5) for key in ('a', 'b')
+    ]
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+    assert results == {'a': [0, 1, 2, 3, 4], 'b': [0, 1, 2, 3, 4]}
+
+
+def test_concurrency():
+    """Test that tasks with different keys run concurrently"""
+
+    pool = KeyedThreadPool(2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    # integers hash to themselves, so keys 0 and 1 use different workers
+    futures = [pool.submit(key, barrier.wait) for key in (0, 1)]
+    for future in futures:
+        future.result()
+    pool.shutdown()
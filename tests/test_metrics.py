@@ -0,0 +1,97 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from msc_pygeoapi.metrics import Metrics
+
+
+def test_disabled():
+    """Test that metrics are not recorded when no export file is set"""
+
+    metrics = Metrics()
+
+    with metrics.timer('load', 'swob_realtime'):
+        pass
+    metrics.inc('documents_total', 10, result='created')
+
+    assert metrics.timings == {}
+    assert metrics.counters == {}
+    assert not metrics.flush()
+
+
+def test_render_and_export(tmp_path):
+    """Test that metrics are exported in Prometheus text format"""
+
+    filepath = tmp_path / 'msc-pygeoapi.prom'
+    metrics = Metrics(str(filepath), interval=3600,
+                      labels={'instance': '1'})
+
+    with metrics.loader('swob_realtime'):
+        with metrics.timer('load'):
+            pass
+        metrics.inc('documents_total', 3, result='created')
+        metrics.inc('documents_total', 2, result='created')
+        metrics.inc('documents_total', 0, result='noop')
+
+    metrics.observe('route', 0.5, 'hydrometric_realtime')
+
+    assert not metrics.flush()
+    assert metrics.export()
+
+    lines = filepath.read_text().splitlines()
+
+    assert '# TYPE msc_pygeoapi_stage_seconds summary' in lines
+    assert ('msc_pygeoapi_stage_seconds_count{instance="1",'
+            'loader="swob_realtime",stage="load"} 1') in lines
+    assert ('msc_pygeoapi_stage_seconds_sum{instance="1",'
+            'loader="hydrometric_realtime",stage="route"} 0.500000') in lines
+    assert ('msc_pygeoapi_documents_total{instance="1",'
+            'loader="swob_realtime",result="created"} 5') in lines
+    assert not any('result="noop"' in line for line in lines)
+    assert list(tmp_path.iterdir()) == [filepath]
+
+
+def test_drain_and_merge(tmp_path):
+    """Test that metrics of worker processes are merged by their parent"""
+
+    worker = Metrics(str(tmp_path / 'worker.prom'))
+    parent = Metrics(str(tmp_path / 'parent.prom'))
+
+    worker.observe('generate', 1.5, 'swob_realtime')
+    worker.inc('documents_total', 2, loader='swob_realtime',
+               result='created')
+    parent.observe('generate', 0.5, 'swob_realtime')
+
+    parent.merge(worker.drain())
+    parent.merge(worker.drain())
+
+    assert worker.timings == {}
+    assert worker.counters == {}
+    assert parent.timings == {('swob_realtime', 'generate'): [2, 2.0]}
+    assert parent.counters == {('documents_total', (
+        ('loader', 'swob_realtime'), ('result', 'created'))): 2}
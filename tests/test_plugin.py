@@ -0,0 +1,273 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from datetime import datetime
+import json
+
+import pytest
+
+from msc_pygeoapi.loader import bulletins_realtime, hurricanes_realtime
+from msc_pygeoapi.plugin import (
+    FilenameRouter, InvalidPluginError, PLUGINS, PluginPool
+)
+
+
+class DummyLoader:
+    """dummy loader used to exercise plugin pooling"""
+
+    instances = 0
+
+    def __init__(self, conn_config={}):
+        DummyLoader.instances += 1
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+
+class FakeConnector:
+    """Elasticsearch connector stand-in recording submitted actions"""
+
+    def __init__(self, conn_config={}):
+        self.actions = []
+        self.Elasticsearch = None
+
+    def create(self, *args, **kwargs):
+        return True
+
+    def create_template(self, *args, **kwargs):
+        pass
+
+    def submit_elastic_package(self, package, *args, **kwargs):
+        self.actions.extend(package)
+        return True
+
+
+@pytest.fixture()
+def pool(monkeypatch):
+    monkeypatch.setitem(PLUGINS['loader'], 'dummy', {
+        'filename_pattern': 'dummy/',
+        'handler': 'test_plugin.DummyLoader'
+    })
+    DummyLoader.instances = 0
+
+    return PluginPool('loader')
+
+
+def test_pool_reuses_instances(pool):
+    """Test that pooled plugins are built once per process"""
+
+    loader = pool.get('dummy')
+    assert pool.get('dummy') is loader
+    assert DummyLoader.instances == 1
+
+
+def test_pool_invalidate(pool):
+    """Test that invalidated plugins are rebuilt on next use"""
+
+    loader = pool.get('dummy')
+    pool.invalidate('dummy')
+    assert pool.get('dummy') is not loader
+    assert DummyLoader.instances == 2
+
+    pool.invalidate()
+    assert pool.plugins == {}
+
+
+def test_pool_unknown_plugin(pool):
+    """Test that unknown plugins raise InvalidPluginError"""
+
+    with pytest.raises(InvalidPluginError):
+        pool.get('does-not-exist')
+
+    with pytest.raises(InvalidPluginError):
+        PluginPool('does-not-exist')
+
+
+def test_pool_hurricanes_reset(monkeypatch, tmp_path):
+    """Test that a pooled hurricanes loader does not leak per-file state"""
+
+    monkeypatch.setattr(hurricanes_realtime, 'ElasticsearchConnector',
+                        FakeConnector)
+
+    files = []
+    for name, storm_number in [('storm1.json', 1), ('storm2.json', 2)]:
+        filepath = tmp_path / name
+        filepath.write_text(json.dumps({'features': [{
+            'properties': {
+                'id': f'{name}-1',
+                'amendment': 0,
+                'type': 'track',
+                'storm_number': storm_number,
+                'publication_datetime': '2026-10-16T00:00:00Z',
+                'validity_datetime': '2026-10-16T00:00:00Z'
+            }
+        }]}))
+        files.append(filepath)
+
+    latest_updates = []
+    newer = {'storm1.json': True, 'storm2.json': False}
+
+    def latest_set_actions(es, index, docs, query):
+        if docs:
+            latest_updates.append((index, docs, query))
+        return []
+
+    monkeypatch.setattr(hurricanes_realtime, 'latest_set_actions',
+                        latest_set_actions)
+
+    pool = PluginPool('loader')
+    loader = pool.get('hurricanes_realtime')
+
+    monkeypatch.setattr(loader, 'check_if_newer', lambda file_id, amendment: {
+        'update': newer[file_id], 'id_list': []
+    })
+    monkeypatch.setattr(loader, 'generate_local_copy', lambda: True)
+
+    for filepath in files:
+        assert pool.get('hurricanes_realtime') is loader
+        loader.reset()
+        assert loader.load_data(filepath)
+
+    # only the first file is newer: the second must not reuse its state
+    assert len(latest_updates) == 1
+    index, docs, query = latest_updates[0]
+    assert index == 'latest-hurricanes-track'
+    assert query == {'match': {'properties.storm_number': 1}}
+    assert loader.newer is None
+
+    # the latest-state copy is flagged, the historical one is not
+    assert docs['storm1.json-1']['properties']['latest_publication'] is True
+    historical = [action for action in loader.conn.actions
+                  if action['_id'] == 'storm1.json-1']
+    assert historical[0]['doc']['properties']['latest_publication'] is False
+
+
+def test_pool_bulletins_reset(monkeypatch):
+    """Test that a pooled bulletins loader refreshes its URL per file"""
+
+    class FakeDatetime(datetime):
+        today_ = datetime(2026, 10, 16)
+
+        @classmethod
+        def today(cls):
+            return cls.today_
+
+    monkeypatch.setattr(bulletins_realtime, 'ElasticsearchConnector',
+                        FakeConnector)
+    monkeypatch.setattr(bulletins_realtime, 'datetime', FakeDatetime)
+
+    path = '/data/bulletins/alphanumeric/20261016/SA/CWAO/12/SACN31_CWAO_161200___01234'  # noqa
+
+    pool = PluginPool('loader')
+    loader = pool.get('bulletins_realtime')
+
+    urls = []
+    for today in [datetime(2026, 10, 16), datetime(2026, 10, 17)]:
+        FakeDatetime.today_ = today
+        assert pool.get('bulletins_realtime') is loader
+        loader.reset()
+        urls.append(loader.bulletin2dict(path)['properties']['url'])
+
+    assert urls[0].startswith('https://dd.weather.gc.ca/20261016/')
+    assert urls[1].startswith('https://dd.weather.gc.ca/20261017/')
+
+
+@pytest.mark.parametrize('path,plugin_name', [
+    ('/data/hydrometric/csv/BC/hourly/BC_08MF005_hourly_hydrometric.csv',
+     'hydrometric_realtime'),
+    ('/data/observations/swob-ml/20200531/CYBQ/2020-05-31-0200-CYBQ-AUTO-swob.xml',  # noqa
+     'swob_realtime'),
+    ('/data/alerts/cap/20240101/CWUL/12/T_WOCN11_C_CWUL_202401011200.cap',
+     'cap_alerts_realtime'),
+    ('/data/dms-alpha/alerts/20251126T182051.607Z_MSC_Alerts.json',
+     'alerts_realtime-alpha'),
+    ('/data/unknown/feed/file.txt', None)
+])
+def test_router(path, plugin_name):
+    """Test that the filename router selects exactly one plugin"""
+
+    router = FilenameRouter(PLUGINS['loader'])
+    assert router.route(path) == plugin_name
+
+
+def test_router_order():
+    """Test that overlapping rules follow plugin definition order"""
+
+    router = FilenameRouter({
+        'first': {'filename_pattern': 'feed/'},
+        'second': {'filename_pattern': 'sub/'}
+    })
+
+    # both patterns match: the plugin defined last wins, wherever
+    # its pattern occurs in the path
+    assert router.route('/data/feed/sub/file') == 'second'
+    assert router.route('/data/sub/feed/file') == 'second'
+    assert router.route('/data/feed/file') == 'first'
+    assert router.route('/data/sub/file') == 'second'
+
+
+def test_router_matches_plugin_scan():
+    """Test that routing matches a substring scan over plugin order"""
+
+    def scan(path):
+        selected = None
+        for key, plugin_def in PLUGINS['loader'].items():
+            if plugin_def['filename_pattern'] in path:
+                selected = key
+        return selected
+
+    router = FilenameRouter(PLUGINS['loader'])
+
+    for path in [
+        '/data/hydrometric/marine_weather/file.xml',
+        '/data/alerts/cap/hurricanes/file.cap',
+        '/data/air_quality/aqhi/metnotes/file.json',
+        '/data/observations/swob-ml/file.xml',
+        '/data/dms-geomet/alerts/cap/file.json',
+        '/data/metnotes/hydrometric/metnotes/file.json'
+    ]:
+        assert router.route(path) == scan(path)
+
+
+@pytest.mark.parametrize('path,key', [
+    ('/data/observations/swob-ml/20200531/CYBQ/2020-05-31-0200-CYBQ-AUTO-swob.xml',  # noqa
+     'swob_realtime:CYBQ'),
+    ('/data/hydrometric/csv/BC/hourly/BC_08MF005_hourly_hydrometric.csv',
+     'hydrometric_realtime:BC_08MF005'),
+    ('/data/citypage_weather/ON/20250101T120000.000Z_MSC_CitypageWeather_s0000458_en.xml',  # noqa
+     'citypageweather_realtime:s0000458'),
+    ('/data/dms-geomet/alerts/20251126T182051.607Z_MSC_Alerts.json',
+     'alerts_realtime')
+])
+def test_ordering_key(path, key):
+    """Test that files are assigned ordering keys per plugin"""
+
+    router = FilenameRouter(PLUGINS['loader'])
+    assert router.ordering_key(router.route(path), path) == key
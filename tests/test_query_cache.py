@@ -0,0 +1,120 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import pytest
+
+# msc_pygeoapi.provider requires GDAL
+pytest.importorskip('osgeo')
+
+from msc_pygeoapi.provider import cache as cache_module  # noqa
+from msc_pygeoapi.provider.cache import (  # noqa
+    FileBackend,
+    MemoryBackend,
+    QueryCache
+)
+
+
+class Indices:
+    """Elasticsearch indices client reporting indexing statistics"""
+
+    def __init__(self):
+        self.index_total = 10
+        self.calls = 0
+
+    def stats(self, index, metric, filter_path):
+        self.calls += 1
+        return {'_all': {'primaries': {'indexing': {
+            'index_total': self.index_total, 'delete_total': 0
+        }}}}
+
+
+class Elasticsearch:
+    def __init__(self):
+        self.indices = Indices()
+
+
+def test_memory_backend():
+    """Test that memory results are bounded in bytes, least recent first"""
+
+    backend = MemoryBackend(max_bytes=10)
+    backend.set('a', b'1234', 0, 'w')
+    backend.set('b', b'1234', 0, 'w')
+    backend.get('a')
+    backend.set('c', b'1234', 0, 'w')
+
+    assert list(backend.entries) == ['a', 'c']
+    assert backend.size == 8
+    assert backend.evictions == 1
+    assert not backend.set('d', b'12345678901', 0, 'w')
+
+
+def test_file_backend(tmp_path):
+    """Test that file results are shared and pruned"""
+
+    backend = FileBackend(str(tmp_path), max_bytes=200)
+    backend.set('a', b'{"a": 1}', 1.0, 'w')
+
+    assert FileBackend(str(tmp_path), 200).get('a') == (b'{"a": 1}', 1.0, 'w')  # noqa
+    assert backend.get('b') is None
+
+    for i in range(10):
+        backend.set(str(i), b'x' * 50, 1.0, 'w')
+    backend.prune()
+
+    assert sum(f.stat().st_size for f in tmp_path.iterdir()) <= 200
+
+
+def test_query_cache(monkeypatch):
+    """Test that cached results are invalidated by index changes"""
+
+    monkeypatch.setattr(cache_module, 'REFRESH_GRACE', 0)
+
+    es = Elasticsearch()
+    cache = QueryCache(es, 'citypageweather_realtime', 60,
+                       MemoryBackend(1000), watermark_interval=0)
+
+    assert cache.get('q') is None
+    assert cache.set('q', {'features': [1]})
+
+    result = cache.get('q')
+    assert result == {'features': [1]}
+    result['features'].append(2)
+    assert cache.get('q') == {'features': [1]}
+
+    es.indices.index_total += 1
+    assert cache.get('q') is None
+
+    assert cache.stats() == {
+        'hits': 2, 'misses': 2, 'invalidations': 1, 'evictions': 0
+    }
+
+    # index changes may not be searchable yet
+    monkeypatch.setattr(cache_module, 'REFRESH_GRACE', 60)
+    es.indices.index_total += 1
+    assert not cache.set('q', {'features': []})
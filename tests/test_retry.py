@@ -0,0 +1,89 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import json
+
+from msc_pygeoapi.handler.retry import RetryQueue
+
+
+def test_backoff_is_capped():
+    """Test that retry backoff grows exponentially up to its cap"""
+
+    queue = RetryQueue(backoff=10, backoff_max=60)
+
+    assert [queue.delay(i) for i in range(1, 6)] == [10, 20, 40, 60, 60]
+
+
+def test_retry_then_succeed():
+    """Test that failed files are deferred until their backoff expires"""
+
+    queue = RetryQueue(max_retries=2, backoff=0)
+
+    assert queue.ready('/data/file.xml')
+    assert queue.failed('/data/file.xml', RuntimeError('boom'))
+    assert queue.ready('/data/file.xml')
+
+    queue = RetryQueue(max_retries=2, backoff=3600)
+    assert queue.failed('/data/file.xml', RuntimeError('boom'))
+    assert not queue.ready('/data/file.xml')
+
+    queue.succeeded('/data/file.xml')
+    assert queue.ready('/data/file.xml')
+
+
+def test_deadletter(tmp_path):
+    """Test that files exceeding their retry budget are dead-lettered"""
+
+    filepath = tmp_path / 'bad.xml'
+    filepath.write_text('<bad')
+    deadletter_dir = tmp_path / 'deadletter'
+
+    queue = RetryQueue(max_retries=1, backoff=0,
+                       deadletter_dir=str(deadletter_dir))
+
+    assert queue.failed(str(filepath), ValueError('malformed'))
+    assert not queue.failed(str(filepath), ValueError('malformed'))
+
+    assert (deadletter_dir / 'bad.xml').read_text() == '<bad'
+    with (deadletter_dir / 'bad.xml.error.json').open() as fh:
+        report = json.load(fh)
+    assert report['attempts'] == 2
+    assert report['error'] == 'malformed'
+    assert queue.entries == {}
+
+
+def test_max_entries():
+    """Test that the number of tracked files is bounded"""
+
+    queue = RetryQueue(max_entries=2)
+
+    for i in range(5):
+        queue.failed(f'/data/{i}.xml', RuntimeError('boom'))
+
+    assert list(queue.entries.keys()) == ['/data/3.xml', '/data/4.xml']
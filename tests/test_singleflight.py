@@ -0,0 +1,118 @@
+# =================================================================
+#
+# Author: Tom Kralidis <tom.kralidis@ec.gc.ca>
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+import time
+
+import pytest
+
+# msc_pygeoapi.provider requires GDAL
+pytest.importorskip('osgeo')
+
+from msc_pygeoapi.provider.singleflight import SingleFlight, get_key  # noqa
+
+
+@dataclass
+class Spec:
+    crs: str
+
+
+def test_single_flight():
+    """Test that concurrent identical calls share one call"""
+
+    group = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def function():
+        calls.append(1)
+        release.wait()
+        return {'features': [1]}
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(group.do, 'q', function)
+                   for _ in range(8)]
+        while group.coalesced < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result == {'features': [1]} for result in results)
+    assert len({id(result) for result in results}) == 8
+    assert group.calls == {}
+
+    # calls are not coalesced once completed
+    assert group.do('q', function) == {'features': [1]}
+    assert len(calls) == 2
+
+
+def test_single_flight_error():
+    """Test that waiting calls get the error of the in-flight call"""
+
+    group = SingleFlight()
+    release = threading.Event()
+
+    def function():
+        release.wait()
+        raise ValueError('failed')
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(group.do, 'q', function)
+                   for _ in range(2)]
+        while group.coalesced < 1:
+            time.sleep(0.01)
+        release.set()
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_get_key():
+    """Test that query keys are normalized"""
+
+    assert get_key('a', {'x': 1, 'y': 2}) == get_key('a', {'y': 2, 'x': 1})
+    assert get_key('a', Spec('4326')) != get_key('a', Spec('3857'))
+    assert get_key('a', object()) is None
+
+
+def test_get_key_locale():
+    """Test that locales of multilingual providers are serialized"""
+
+    babel = pytest.importorskip('babel')
+
+    en = get_key('a', babel.Locale.parse('en_CA'))
+    fr = get_key('a', babel.Locale.parse('fr_CA'))
+
+    assert en is not None and fr is not None
+    assert en != fr
+    assert en == get_key('a', babel.Locale.parse('en_CA'))